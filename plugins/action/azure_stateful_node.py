@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_action import SpotActionModule
+
+
+class ActionModule(SpotActionModule):
+    pass
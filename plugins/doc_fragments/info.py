@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    # Options shared by the _info modules.
+    DOCUMENTATION = """
+options:
+  credentials_path:
+    type: str
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+  account_id:
+    type: str
+    description:
+      - Optional parameter that allows to set an account-id inside the module configuration. By default this is retrieved from the credentials path
+  token:
+    type: str
+    description:
+      - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+  names:
+    type: list
+    elements: str
+    description:
+      - Return the resources with these names.
+      - Without I(tags), each name is looked up with the API's name filter instead of listing the account.
+  ids:
+    type: list
+    elements: str
+    description:
+      - Return the resources with these IDs.
+      - Without I(tags), only these resources are fetched instead of listing the account.
+      - IDs that do not exist are skipped with a warning.
+  fields:
+    type: list
+    elements: str
+    description:
+      - Dotted paths of the configuration attributes to return, such as C(name) or C(compute.launch_specification).
+        A path that crosses a list applies to each of its items. The whole configuration is returned when not set.
+  exclude_fields:
+    type: list
+    elements: str
+    description:
+      - Dotted paths of the configuration attributes to leave out of the result.
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of lookups and detail fetches running at the same time.
+"""
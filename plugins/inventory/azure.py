@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: azure
+version_added: 1.3.0
+short_description: Spot Azure stateful nodes and Azure Elastigroup VMs inventory source
+author: Spot by NetApp (@talzur)
+description:
+  - Builds an inventory of the VMs of the account's Azure stateful nodes and Azure Elastigroups.
+  - The stateful nodes and groups are listed once, and the VMs of each of them are then fetched concurrently.
+  - Hosts are grouped by stateful node or elastigroup name, by region, by resource group and by tag. Further
+    groups and variables can be built from the host variables with I(keyed_groups), I(groups) and I(compose).
+  - Uses a YAML configuration file that ends with C(spot_azure.yml) or C(spot_azure.yaml).
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - constructed
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['spot.cloud_modules.azure']
+  credentials_path:
+    type: path
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+  account_id:
+    type: str
+    env:
+      - name: SPOTINST_ACCOUNT_ID
+    description:
+      - Optional parameter that allows to set an account-id inside the inventory configuration. By default this is retrieved from the credentials path
+  token:
+    type: str
+    env:
+      - name: SPOTINST_TOKEN
+    description:
+      - Optional parameter that allows to set an token inside the inventory configuration. By default this is retrieved from the credentials path
+  include:
+    type: list
+    elements: str
+    default: ['stateful_nodes', 'elastigroups']
+    choices: ['stateful_nodes', 'elastigroups']
+    description:
+      - Kinds of resources whose VMs are added to the inventory.
+  hostname:
+    type: str
+    default: vm_name
+    choices: ['vm_name', 'private_ip', 'public_ip']
+    description:
+      - VM attribute used as the inventory hostname. VMs without it are skipped.
+  use_private_ip:
+    type: bool
+    default: false
+    description:
+      - Set C(ansible_host) to the private IP address even when the VM has a public one.
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of stateful nodes and elastigroups whose VMs are fetched at the same time.
+  resource_cache:
+    type: dict
+    description:
+      - Optional on-disk cache of the stateful nodes, elastigroups and their VMs, kept per account.
+      - Within I(ttl) seconds of the last refresh the cached VMs are used without calling the API.
+        After that the resources are listed again, and VMs are only fetched for resources that are new,
+        whose C(updatedAt) changed since the last refresh, or whose VMs are older than I(max_age).
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the cache file on the control node. A C(<path>.lock) file is created next to it.
+      ttl:
+        type: int
+        default: 300
+        description:
+          - Seconds during which the cached inventory is used as is.
+      max_age:
+        type: int
+        default: 3600
+        description:
+          - Seconds after which the VMs of a resource are fetched again even if the resource did not change,
+            so that replaced VMs are eventually picked up.
+"""
+
+EXAMPLES = """
+# inventory.spot_azure.yml
+plugin: spot.cloud_modules.azure
+include:
+  - stateful_nodes
+hostname: private_ip
+resource_cache:
+  path: ~/.ansible/tmp/spot_azure_inventory.json
+  ttl: 600
+keyed_groups:
+  - key: spot_vm_size
+    prefix: size
+"""
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_inventory import (
+    SpotInventoryPlugin, get_resource_cache, get_resources)
+
+KIND_STATEFUL_NODE = "stateful_node"
+KIND_ELASTIGROUP = "elastigroup"
+
+
+def get_resource_summary(kind, resource):
+    """Keep only the attributes the inventory uses, so that cached entries stay small."""
+    compute = resource.get("compute") or dict()
+    launch_specification = compute.get("launch_specification") or dict()
+    tags = launch_specification.get("tags") or list()
+
+    return dict(
+        id=resource.get("id"),
+        kind=kind,
+        name=resource.get("name"),
+        region=resource.get("region"),
+        resource_group_name=resource.get("resource_group_name"),
+        updated_at=resource.get("updated_at"),
+        tags=dict((tag.get("tag_key"), tag.get("tag_value")) for tag in tags if tag.get("tag_key")),
+    )
+
+
+def get_group_vms(status):
+    """The elastigroup status holds its VMs under ``vms``, or is a single VM."""
+    if not status:
+        return list()
+
+    if "vms" in status:
+        return status.get("vms") or list()
+
+    return [status] if status.get("vm_name") else list()
+
+
+class InventoryModule(SpotInventoryPlugin):
+
+    NAME = "spot.cloud_modules.azure"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("spot_azure.yml", "spot_azure.yaml"))
+
+        return False
+
+    def fetch_resources(self, stateful_node_client, elastigroup_client):
+        include = self.get_option("include")
+
+        def list_resources():
+            resources = list()
+
+            if "stateful_nodes" in include:
+                resources.extend(get_resource_summary(KIND_STATEFUL_NODE, node)
+                                 for node in stateful_node_client.get_all_stateful_nodes())
+
+            if "elastigroups" in include:
+                resources.extend(get_resource_summary(KIND_ELASTIGROUP, group)
+                                 for group in elastigroup_client.get_elastigroups())
+
+            return resources
+
+        def fetch_vms(resource):
+            if resource["kind"] == KIND_STATEFUL_NODE:
+                status = stateful_node_client.get_stateful_node_status(resource["id"])
+                return [status] if status and status.get("vm_name") else list()
+
+            return get_group_vms(elastigroup_client.get_elastigroup_status(resource["id"]))
+
+        resource_cache = get_resource_cache(self, "azure/" + ",".join(sorted(include)))
+
+        return get_resources(resource_cache, list_resources, fetch_vms, self.get_option("max_workers"))
+
+    def populate(self, resources):
+        hostname = self.get_option("hostname")
+
+        for resource in resources:
+            group_names = ["{0}_{1}".format(resource["kind"], resource["name"])]
+
+            if resource.get("region"):
+                group_names.append("region_" + resource["region"])
+
+            if resource.get("resource_group_name"):
+                group_names.append("resource_group_" + resource["resource_group_name"])
+
+            for key, value in resource["tags"].items():
+                group_names.append("tag_{0}_{1}".format(key, value) if value else "tag_" + key)
+
+            for vm in resource["hosts"]:
+                host = vm.get(hostname)
+
+                if not host:
+                    continue
+
+                host_vars = dict(("spot_" + key, value) for key, value in vm.items())
+                host_vars.update(
+                    spot_resource_id=resource["id"],
+                    spot_resource_kind=resource["kind"],
+                    spot_resource_name=resource["name"],
+                    spot_region=resource.get("region"),
+                    spot_resource_group_name=resource.get("resource_group_name"),
+                    spot_tags=resource["tags"])
+
+                ansible_host = self.get_ansible_host(vm.get("private_ip"), vm.get("public_ip"))
+
+                if ansible_host:
+                    host_vars["ansible_host"] = ansible_host
+
+                self.add_spot_host(host, group_names, host_vars)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache=cache)
+
+        self._read_config_data(path)
+
+        if not HAS_SPOTINST_SDK:
+            raise AnsibleError("the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+        try:
+            resources = self.fetch_resources(
+                self.get_client("stateful_node_azure"), self.get_client("elastigroup_azure_v3"))
+        except Exception as exc:
+            raise AnsibleError("Failed to list Azure resources: {0}".format(to_native(exc)))
+
+        self.populate(resources)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: elastigroup
+version_added: 1.3.0
+short_description: Spot AWS Elastigroup instances inventory source
+author: Spot by NetApp (@talzur)
+description:
+  - Builds an inventory of the active instances of the account's AWS Elastigroups.
+  - The groups are listed with one API call and their instances are then fetched concurrently.
+  - Hosts are grouped by elastigroup name, by tag and by product. Further groups and variables can be
+    built from the host variables with I(keyed_groups), I(groups) and I(compose).
+  - Uses a YAML configuration file that ends with C(spot_elastigroup.yml) or C(spot_elastigroup.yaml).
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['spot.cloud_modules.elastigroup']
+  credentials_path:
+    type: path
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+  account_id:
+    type: str
+    env:
+      - name: SPOTINST_ACCOUNT_ID
+    description:
+      - Optional parameter that allows to set an account-id inside the inventory configuration. By default this is retrieved from the credentials path
+  token:
+    type: str
+    env:
+      - name: SPOTINST_TOKEN
+    description:
+      - Optional parameter that allows to set an token inside the inventory configuration. By default this is retrieved from the credentials path
+  group_names:
+    type: list
+    elements: str
+    default: []
+    description:
+      - Only include the elastigroups with these names. All groups are included when empty.
+  hostname:
+    type: str
+    default: instance_id
+    choices: ['instance_id', 'private_ip', 'public_ip']
+    description:
+      - Instance attribute used as the inventory hostname. Instances without it are skipped.
+  use_private_ip:
+    type: bool
+    default: false
+    description:
+      - Set C(ansible_host) to the private IP address even when the instance has a public one.
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of elastigroups whose instances are fetched at the same time.
+"""
+
+EXAMPLES = """
+# inventory.spot_elastigroup.yml
+plugin: spot.cloud_modules.elastigroup
+group_names:
+  - web
+  - worker
+hostname: private_ip
+max_workers: 16
+cache: true
+cache_plugin: jsonfile
+cache_connection: ~/.ansible/spot_inventory
+cache_timeout: 300
+keyed_groups:
+  - key: spot_availability_zone
+    prefix: az
+"""
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.inventory import Cacheable
+from ansible.utils.display import Display
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_inventory import SpotInventoryPlugin, fetch_hosts
+
+display = Display()
+
+
+def get_group_summary(group):
+    """Keep only the elastigroup attributes the inventory uses, so that cached entries stay small."""
+    compute = group.get("compute") or dict()
+    launch_specification = compute.get("launch_specification") or dict()
+    tags = launch_specification.get("tags") or list()
+
+    return dict(
+        id=group.get("id"),
+        name=group.get("name"),
+        product=compute.get("product"),
+        tags=dict((tag.get("tag_key"), tag.get("tag_value")) for tag in tags if tag.get("tag_key")),
+    )
+
+
+class InventoryModule(SpotInventoryPlugin, Cacheable):
+
+    NAME = "spot.cloud_modules.elastigroup"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("spot_elastigroup.yml", "spot_elastigroup.yaml"))
+
+        return False
+
+    def fetch_groups(self, client):
+        """
+        List the elastigroups and fetch the active instances of each of them
+        concurrently. Returns the groups and whether every group was fetched.
+        """
+        group_names = self.get_option("group_names")
+        groups = [get_group_summary(group) for group in client.get_elastigroups()
+                  if not group_names or group.get("name") in group_names]
+
+        def fetch_instances(group):
+            return client.get_elastigroup_active_instances(group["id"])
+
+        complete = True
+
+        for group, instances, error in fetch_hosts(groups, fetch_instances, self.get_option("max_workers")):
+            if error is not None:
+                display.warning("Failed to fetch the instances of elastigroup {0}: {1}".format(group["id"], error))
+                complete = False
+
+            group["instances"] = instances or list()
+
+        return groups, complete
+
+    def populate(self, groups):
+        hostname = self.get_option("hostname")
+
+        for group in groups:
+            group_names = ["elastigroup_" + group["name"]]
+
+            if group.get("product"):
+                group_names.append("product_" + group["product"])
+
+            for key, value in group["tags"].items():
+                group_names.append("tag_{0}_{1}".format(key, value) if value else "tag_" + key)
+
+            for instance in group["instances"]:
+                host = instance.get(hostname)
+
+                if not host:
+                    continue
+
+                host_vars = dict(("spot_" + key, value) for key, value in instance.items())
+                host_vars.update(
+                    spot_group_id=group["id"],
+                    spot_group_name=group["name"],
+                    spot_product=group.get("product"),
+                    spot_tags=group["tags"])
+
+                ansible_host = self.get_ansible_host(instance.get("private_ip"), instance.get("public_ip"))
+
+                if ansible_host:
+                    host_vars["ansible_host"] = ansible_host
+
+                self.add_spot_host(host, group_names, host_vars)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache=cache)
+
+        self._read_config_data(path)
+
+        if not HAS_SPOTINST_SDK:
+            raise AnsibleError("the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+        def fetch():
+            try:
+                return self.fetch_groups(self.get_client("elastigroup_aws"))
+            except Exception as exc:
+                raise AnsibleError("Failed to list elastigroups: {0}".format(to_native(exc)))
+
+        self.populate(self.get_cached(path, cache, fetch))
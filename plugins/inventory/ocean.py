@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: ocean
+version_added: 1.3.0
+short_description: Spot Ocean cluster nodes inventory source
+author: Spot by NetApp (@talzur)
+description:
+  - Builds an inventory of the nodes of the account's AWS Ocean Kubernetes clusters.
+  - The clusters are listed once, and the instances and launch specs of each cluster are then fetched concurrently.
+  - Hosts are grouped by Ocean cluster and by launch spec. Further groups and variables can be built from the
+    host variables with I(keyed_groups), I(groups) and I(compose).
+  - Results can be cached for a configurable time with the inventory cache options.
+  - Uses a YAML configuration file that ends with C(spot_ocean.yml) or C(spot_ocean.yaml).
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['spot.cloud_modules.ocean']
+  credentials_path:
+    type: path
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+  account_id:
+    type: str
+    env:
+      - name: SPOTINST_ACCOUNT_ID
+    description:
+      - Optional parameter that allows to set an account-id inside the inventory configuration. By default this is retrieved from the credentials path
+  token:
+    type: str
+    env:
+      - name: SPOTINST_TOKEN
+    description:
+      - Optional parameter that allows to set an token inside the inventory configuration. By default this is retrieved from the credentials path
+  cluster_names:
+    type: list
+    elements: str
+    default: []
+    description:
+      - Only include the Ocean clusters with these names. All clusters are included when empty.
+  hostname:
+    type: str
+    default: instance_id
+    choices: ['instance_id', 'private_ip', 'public_ip']
+    description:
+      - Instance attribute used as the inventory hostname. Instances without it are skipped.
+  use_private_ip:
+    type: bool
+    default: false
+    description:
+      - Set C(ansible_host) to the private IP address even when the instance has a public one.
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of clusters whose nodes are fetched at the same time.
+"""
+
+EXAMPLES = """
+# inventory.spot_ocean.yml
+plugin: spot.cloud_modules.ocean
+cluster_names:
+  - prod
+hostname: private_ip
+cache: true
+cache_plugin: jsonfile
+cache_connection: ~/.ansible/spot_inventory
+cache_timeout: 600
+keyed_groups:
+  - key: spot_instance_type
+    prefix: type
+"""
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.inventory import Cacheable
+from ansible.utils.display import Display
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ocean_aws import get_cluster_instances, get_cluster_launch_specs
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_inventory import SpotInventoryPlugin, fetch_hosts
+
+display = Display()
+
+
+def get_cluster_summary(cluster):
+    """Keep only the cluster attributes the inventory uses, so that cached entries stay small."""
+    return dict(
+        id=cluster.get("id"),
+        name=cluster.get("name"),
+        controller_cluster_id=cluster.get("controller_cluster_id"),
+        region=cluster.get("region"),
+    )
+
+
+def get_launch_spec_id(instance):
+    return instance.get("launch_spec_id") or instance.get("launch_specification_id")
+
+
+class InventoryModule(SpotInventoryPlugin, Cacheable):
+
+    NAME = "spot.cloud_modules.ocean"
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("spot_ocean.yml", "spot_ocean.yaml"))
+
+        return False
+
+    def fetch_clusters(self, client):
+        """
+        List the Ocean clusters and fetch the instances and launch specs of each
+        of them concurrently. Returns the clusters and whether every cluster was fetched.
+        """
+        cluster_names = self.get_option("cluster_names")
+        clusters = [get_cluster_summary(cluster) for cluster in client.get_all_ocean_cluster()
+                    if not cluster_names or cluster.get("name") in cluster_names]
+
+        def fetch_nodes(cluster):
+            launch_specs = get_cluster_launch_specs(client, cluster["id"])
+            launch_spec_names = dict((launch_spec.get("id"), launch_spec.get("name")) for launch_spec in launch_specs)
+            instances = get_cluster_instances(client, cluster["id"])
+
+            for instance in instances:
+                launch_spec_id = get_launch_spec_id(instance)
+                instance["launch_spec_id"] = launch_spec_id
+                instance["launch_spec_name"] = instance.get("launch_spec_name") or launch_spec_names.get(launch_spec_id)
+
+            return instances
+
+        complete = True
+
+        for cluster, instances, error in fetch_hosts(clusters, fetch_nodes, self.get_option("max_workers")):
+            if error is not None:
+                display.warning("Failed to fetch the nodes of Ocean cluster {0}: {1}".format(cluster["id"], error))
+                complete = False
+
+            cluster["instances"] = instances or list()
+
+        return clusters, complete
+
+    def populate(self, clusters):
+        hostname = self.get_option("hostname")
+
+        for cluster in clusters:
+            for instance in cluster["instances"]:
+                host = instance.get(hostname)
+
+                if not host:
+                    continue
+
+                group_names = ["ocean_" + cluster["name"]]
+
+                if instance.get("launch_spec_name"):
+                    group_names.append("launch_spec_" + instance["launch_spec_name"])
+
+                host_vars = dict(("spot_" + key, value) for key, value in instance.items())
+                host_vars.update(
+                    spot_ocean_id=cluster["id"],
+                    spot_ocean_name=cluster["name"],
+                    spot_controller_cluster_id=cluster.get("controller_cluster_id"),
+                    spot_region=cluster.get("region"))
+
+                ansible_host = self.get_ansible_host(instance.get("private_ip"), instance.get("public_ip"))
+
+                if ansible_host:
+                    host_vars["ansible_host"] = ansible_host
+
+                self.add_spot_host(host, group_names, host_vars)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache=cache)
+
+        self._read_config_data(path)
+
+        if not HAS_SPOTINST_SDK:
+            raise AnsibleError("the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+        def fetch():
+            try:
+                return self.fetch_clusters(self.get_client("ocean_aws"))
+            except Exception as exc:
+                raise AnsibleError("Failed to list Ocean clusters: {0}".format(to_native(exc)))
+
+        self.populate(self.get_cached(path, cache, fetch))
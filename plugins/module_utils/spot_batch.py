@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_native
+
+DEFAULT_MAX_WORKERS = 8
+
+CREDENTIAL_PARAMS = ("account_id", "credentials_path", "token")
+
+
+class BatchItemFailed(Exception):
+    pass
+
+
+class BatchItemModule(object):
+    """
+    Stands in for the AnsibleModule when a single-resource handler runs for one
+    item of a batch. ``params`` are the item's options plus the batch-level
+    credentials, and ``fail_json`` fails only this item instead of exiting.
+    """
+
+    def __init__(self, module, item):
+        self.params = dict(item)
+        self.check_mode = module.check_mode
+        self._module = module
+
+        for key in CREDENTIAL_PARAMS:
+            self.params[key] = module.params.get(key)
+
+    def debug(self, msg):
+        self._module.debug(msg)
+
+    def fail_json(self, msg, **kwargs):
+        raise BatchItemFailed(msg)
+
+
+def run_batch(items, handle_item, max_workers=DEFAULT_MAX_WORKERS, max_failures=None):
+    """
+    Call ``handle_item(item)`` for every item on a pool of at most ``max_workers``
+    threads. Returns the results in item order. An item that raises gets
+    ``dict(failed=True, msg=...)`` as its result and does not affect the others.
+
+    With ``max_failures``, items that have not started yet once more than
+    ``max_failures`` items failed are not handled and get
+    ``dict(skipped=True, msg=...)`` as their result.
+    """
+    lock = threading.Lock()
+    failures = [0]
+
+    def run_item(item):
+        if max_failures is not None:
+            with lock:
+                if failures[0] > max_failures:
+                    return dict(skipped=True, msg="Skipped after {0} items failed".format(failures[0]))
+
+        try:
+            return handle_item(item)
+        except Exception:
+            with lock:
+                failures[0] += 1
+            raise
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(run_item, item) for item in items]
+
+    results = list()
+
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as exc:
+            results.append(dict(failed=True, msg=to_native(exc)))
+
+    return results
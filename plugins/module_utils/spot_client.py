@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import threading
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import acquire_rate_limit, configure_rate_limit
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_policy
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import (
+    HAS_REQUESTS, HAS_SPOTINST_SDK, requests, spotinst, spotinst_client)
+
+
+# Services used by the collection, mapped to the SDK client class that serves them.
+# Building the client directly avoids SpotinstSession.client(), which instantiates
+# every client the SDK knows about just to return one of them.
+CLIENT_CLS_NAME_BY_SERVICE = {
+    "elastigroup_aws": "ElastigroupAwsClient",
+    "elastigroup_azure_v3": "ElastigroupAzureV3Client",
+    "managed_instance_aws": "ManagedInstanceAwsClient",
+    "mrScaler_aws": "MrScalerAwsClient",
+    "ocean_aws": "OceanAwsClient",
+    "stateful_node_azure": "StatefulNodeAzureClient",
+    "subscription": "SubscriptionClient",
+}
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+_lock = threading.RLock()
+_clients = {}
+_credentials_by_path = {}
+_http_session = None
+
+
+class PooledRequests(object):
+    """
+    Stand-in for the ``requests`` module used by the SDK.
+
+    The SDK issues every call through ``requests.get/post/put/delete``, which opens
+    a new connection (and TLS handshake) per request. This routes those calls
+    through a single keep-alive session, retrying them according to the shared
+    RetryPolicy, and leaves everything else untouched. When a rate limit is
+    configured, every attempt, retries included, first takes a token for the
+    request's account.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def request(self, method, url, **kwargs):
+        account = (kwargs.get("params") or dict()).get("accountId")
+
+        def send():
+            acquire_rate_limit(account)
+            return self.session.request(method, url, **kwargs)
+
+        return get_retry_policy().call(method, send, url)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def get_http_session():
+    global _http_session
+
+    with _lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+
+    return _http_session
+
+
+def install_pooled_transport():
+    if not HAS_REQUESTS or not HAS_SPOTINST_SDK:
+        return
+
+    with _lock:
+        client_module = spotinst_client.load()
+
+        if not isinstance(client_module.requests, PooledRequests):
+            client_module.requests = PooledRequests(get_http_session())
+
+
+def load_credentials_file(credentials_path):
+    """
+    Parse a ``key: value`` credentials file, caching the result until the file changes.
+    Returns an empty dict if the file is missing or unreadable.
+    """
+    if credentials_path is None:
+        return dict()
+
+    credentials_path = os.path.expanduser(credentials_path)
+
+    try:
+        mtime = os.stat(credentials_path).st_mtime
+    except OSError:
+        return dict()
+
+    with _lock:
+        cached = _credentials_by_path.get(credentials_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    creds_file_loaded_vars = dict()
+
+    try:
+        with open(credentials_path, "r") as creds:
+            for line in creds:
+                eq_index = line.find(":")
+                var_name = line[:eq_index].strip()
+                string_value = line[eq_index + 1:].strip()
+                creds_file_loaded_vars[var_name] = string_value
+    except IOError:
+        return dict()
+
+    with _lock:
+        _credentials_by_path[credentials_path] = (mtime, creds_file_loaded_vars)
+
+    return creds_file_loaded_vars
+
+
+def resolve_credentials(params):
+    """
+    Resolve the token and account from the module parameters, falling back to the
+    credentials file. Returns a (token, account) tuple; either may be None.
+    """
+    creds_file_loaded_vars = load_credentials_file(params.get("credentials_path"))
+
+    token = params.get("token")
+    if not token:
+        token = creds_file_loaded_vars.get("token")
+
+    account = params.get("account_id")
+    if not account:
+        account = creds_file_loaded_vars.get("account")
+
+    return token, account
+
+
+def build_client(service, token, account):
+    install_pooled_transport()
+
+    if account is not None:
+        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
+    else:
+        session = spotinst.SpotinstSession(auth_token=token)
+
+    cls_name = CLIENT_CLS_NAME_BY_SERVICE.get(service)
+    class_ = getattr(spotinst, cls_name, None) if cls_name else None
+
+    # The SDK prints every request and response to stdout unless told not to,
+    # which would corrupt the JSON that modules and inventory plugins write there.
+    if class_ is None:
+        return session.client(service, print_output=False)
+
+    return class_(session=session.session, print_output=False)
+
+
+def get_spot_client(params, service):
+    """
+    Return a Spot SDK client for ``service``.
+
+    Clients are cached per (service, token, account) for the lifetime of the
+    process, so callers that handle several resources in one process share one
+    client and one connection pool. Also enables the ``rate_limit`` option if set.
+    """
+    configure_rate_limit(params)
+
+    token, account = resolve_credentials(params)
+    key = (service, token, account)
+
+    with _lock:
+        client = _clients.get(key)
+
+        if client is None:
+            client = build_client(service, token, account)
+            _clients[key] = client
+
+    return client
+
+
+def clear_client_cache():
+    with _lock:
+        _clients.clear()
+        _credentials_by_path.clear()
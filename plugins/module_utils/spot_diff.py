@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils.six import string_types
+
+# Placeholder the SDK models use for attributes that were never set.
+SDK_MISSING = "d3043820717d74d9a17694c176d39733"
+
+# Attributes the API accepts but never returns. They are only compared when
+# the current resource does hold them.
+WRITE_ONLY_FIELDS = ("password",)
+
+# Attributes whose values are replaced in the returned diff.
+SECRET_FIELDS = ("password", "custom_data")
+MASKED_VALUE = "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+
+
+def model_to_dict(model):
+    """
+    Serialize an SDK model the way the SDK builds request bodies, keeping the
+    snake_case attribute names the SDK's GET calls also return. Unset attributes
+    are dropped. Plain dicts and lists pass through unchanged.
+    """
+    return exclude_missing(json.loads(json.dumps(model, default=lambda o: o.__dict__)))
+
+
+def exclude_missing(content):
+    if isinstance(content, dict):
+        return dict((key, exclude_missing(value)) for key, value in content.items() if value != SDK_MISSING)
+    elif isinstance(content, list):
+        return [exclude_missing(item) for item in content]
+
+    return content
+
+
+def values_equal(desired, current):
+    if desired == current:
+        return True
+
+    # Module options typed as str may hold booleans or numbers the API returns natively.
+    if isinstance(desired, string_types) != isinstance(current, string_types):
+        return desired is not None and current is not None and str(desired).lower() == str(current).lower()
+
+    return False
+
+
+def mask_secrets(content):
+    if isinstance(content, dict):
+        return dict((key, MASKED_VALUE if key in SECRET_FIELDS and value is not None else mask_secrets(value))
+                    for key, value in content.items())
+    elif isinstance(content, list):
+        return [mask_secrets(item) for item in content]
+
+    return content
+
+
+def compare(desired, current):
+    """
+    Compare ``desired`` against ``current``, where only the fields set in
+    ``desired`` matter; fields set to None count as unset, and write-only
+    fields are skipped when ``current`` does not hold them. Returns None if
+    nothing differs, otherwise a ``(before, after)`` pair holding just the
+    differing fields. Lists are compared item by item and reported as a whole
+    when any item differs.
+    """
+    if isinstance(desired, dict):
+        if current is None:
+            current = dict()
+
+        if not isinstance(current, dict):
+            return current, desired
+
+        before, after = dict(), dict()
+
+        for key, value in desired.items():
+            if value is None or (key in WRITE_ONLY_FIELDS and current.get(key) is None):
+                continue
+
+            changed = compare(value, current.get(key))
+
+            if changed is not None:
+                before[key], after[key] = changed
+
+        return (before, after) if after else None
+
+    elif isinstance(desired, list):
+        if not isinstance(current, list) or len(desired) != len(current):
+            return current, desired
+
+        for desired_item, current_item in zip(desired, current):
+            if compare(desired_item, current_item) is not None:
+                return current, desired
+
+        return None
+
+    return None if values_equal(desired, current) else (current, desired)
+
+
+def get_update_diff(desired, current):
+    """
+    Return an Ansible ``diff`` dict between the desired update (an SDK model or
+    plain dict) and the resource as returned by the SDK's GET call. Both
+    ``before`` and ``after`` are empty when the update would change nothing.
+    Secret values are masked.
+    """
+    changed = compare(model_to_dict(desired), current)
+
+    if changed is None:
+        return dict(before=dict(), after=dict())
+
+    before, after = changed
+    return dict(before=mask_secrets(before), after=mask_secrets(after))
+
+
+def get_create_diff(desired):
+    return dict(before=dict(), after=mask_secrets(model_to_dict(desired)))
+
+
+def get_delete_diff(resource_id):
+    return dict(before=dict(id=resource_id), after=dict())
+
+
+def prune_model(model, changed):
+    """
+    Strip ``model`` (an SDK model or plain dict) down to the branches present in
+    ``changed``, the ``after`` side of an update diff, so the update only sends
+    the fields that differ. Nested models are pruned in place; lists are kept
+    whole since the API replaces them. Returns ``model`` for convenience.
+    """
+    if isinstance(model, dict):
+        for key in list(model):
+            if key not in changed:
+                del model[key]
+            elif isinstance(changed[key], dict):
+                prune_model(model[key], changed[key])
+
+    elif hasattr(model, "__dict__"):
+        for key, value in list(vars(model).items()):
+            if key not in changed:
+                setattr(model, key, SDK_MISSING)
+            elif isinstance(changed[key], dict):
+                prune_model(value, changed[key])
+
+    return model
+
+
+def has_changes(diff):
+    return bool(diff["after"]) or bool(diff["before"])
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+# Path segment that matches every key of a dict or item of a list.
+WILDCARD = "*"
+
+# Trie node of a path that ends there.
+LEAF = True
+
+
+def compile_paths(paths):
+    """
+    Compile dotted ``paths`` such as ``compute.launch_specification.data_disks.*.size_gb``
+    into a trie of nested dicts keyed by path segment, where ``LEAF`` marks the
+    end of a path. A path ending above another one covers it.
+    """
+    trie = dict()
+
+    for path in paths or ():
+        segments = path.split(".")
+        node = trie
+
+        for segment in segments[:-1]:
+            node = node.setdefault(segment, dict())
+
+            if node is LEAF:
+                break
+        else:
+            node[segments[-1]] = LEAF
+
+    return trie
+
+
+def list_indexes(segment, length):
+    if segment == WILDCARD:
+        return range(length)
+
+    try:
+        index = int(segment)
+    except ValueError:
+        return ()
+
+    if -length <= index < length:
+        return (index % length,)
+
+    return ()
+
+
+def prune(content, trie):
+    """
+    Return ``content`` without what the compiled ``trie`` matches: matched
+    dict keys are deleted and matched list items removed. Paths through keys
+    that are missing, None or not a dict or list are skipped.
+
+    ``content`` is left as it is. The walk only descends into the branches
+    the trie names, and only the dicts and lists along matched paths are
+    copied; everything else is shared with ``content``.
+    """
+    if isinstance(content, dict):
+        pruned = content
+
+        for segment, node in trie.items():
+            keys = list(pruned) if segment == WILDCARD else (segment,)
+
+            for key in keys:
+                if key not in pruned:
+                    continue
+
+                if node is not LEAF:
+                    value = prune(pruned[key], node)
+
+                    if value is pruned[key]:
+                        continue
+
+                if pruned is content:
+                    pruned = dict(content)
+
+                if node is LEAF:
+                    del pruned[key]
+                else:
+                    pruned[key] = value
+
+        return pruned
+
+    if isinstance(content, list):
+        pruned = content
+        removed = set()
+
+        for segment, node in trie.items():
+            for index in list_indexes(segment, len(content)):
+                if node is LEAF:
+                    removed.add(index)
+                    continue
+
+                value = prune(pruned[index], node)
+
+                if value is not pruned[index]:
+                    if pruned is content:
+                        pruned = list(content)
+
+                    pruned[index] = value
+
+        if removed:
+            pruned = [item for index, item in enumerate(pruned) if index not in removed]
+
+        return pruned
+
+    return content
+
+
+def clean_do_not_update_fields(content, do_not_update_list):
+    """
+    Return ``content``, the options of a resource, without the dotted paths of
+    ``do_not_update_list``, before they are turned into an update request.
+    Segments may be dict keys, list indexes or ``*`` for every key or item.
+    ``content`` itself is not modified.
+    """
+    if not do_not_update_list:
+        return content
+
+    return prune(content, compile_paths(do_not_update_list))
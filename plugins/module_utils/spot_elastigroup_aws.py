@@ -0,0 +1,901 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import get_create_diff, get_delete_diff, get_update_diff, has_changes, prune_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_mapping import Each, MappingConverter, ModelMapping, Nested
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_name_cache, name_cache_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_waiter import get_waiter, waiter_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import HAS_SPOTINST_SDK, sdk_models, spotinst_client
+
+models = sdk_models("elastigroup.aws")
+
+# Fields of a polled instance whose change is recorded while waiting for instances.
+INSTANCE_STATE_KEYS = ('health_status', 'private_ip')
+
+# Deployment statuses a roll does not leave.
+ROLL_FINISHED = 'FINISHED'
+ROLL_END_STATUSES = (ROLL_FINISHED, 'FAILED', 'STOPPED')
+
+
+# Options describing one elastigroup, shared by the modules that manage them.
+elastigroup_fields = dict(
+    auto_apply_tags=dict(type='bool'),
+    availability_vs_cost=dict(type='str', required=True),
+    availability_zones=dict(type='list', required=True),
+    block_device_mappings=dict(type='list'),
+    chef=dict(type='dict'),
+    code_deploy=dict(type='dict'),
+    credit_specification=dict(type='dict'),
+    do_not_update=dict(default=[], type='list'),
+    docker_swarm=dict(type='dict'),
+    down_scaling_policies=dict(type='list'),
+    draining_timeout=dict(type='int'),
+    ebs_optimized=dict(type='bool'),
+    ebs_volume_pool=dict(type='list'),
+    ecs=dict(type='dict'),
+    elastic_beanstalk=dict(type='dict'),
+    elastic_ips=dict(type='list'),
+    fallback_to_od=dict(type='bool'),
+    id=dict(type='str'),
+    health_check_grace_period=dict(type='int'),
+    health_check_type=dict(type='str'),
+    health_check_unhealthy_duration_before_replacement=dict(type='int'),
+    iam_role_arn=dict(type='str'),
+    iam_role_name=dict(type='str'),
+    image_id=dict(type='str', required=True),
+    key_pair=dict(type='str'),
+    kubernetes=dict(type='dict'),
+    lifetime_period=dict(type='int'),
+    load_balancers=dict(type='list'),
+    max_size=dict(type='int', required=True),
+    mesosphere=dict(type='dict'),
+    min_size=dict(type='int', required=True),
+    mlb_runtime=dict(type='dict'),
+    mlb_load_balancers=dict(type='list'),
+    monitoring=dict(type='str'),
+    multai_load_balancers=dict(type='list'),
+    multai_token=dict(type='str'),
+    name=dict(type='str', required=True),
+    name_cache=dict(type='dict', options=name_cache_fields),
+    network_interfaces=dict(type='list'),
+    nomad=dict(type='dict'),
+    on_demand_count=dict(type='int'),
+    on_demand_instance_type=dict(type='str'),
+    opsworks=dict(type='dict'),
+    persistence=dict(type='dict'),
+    preferred_spot_instance_types=dict(type='list'),
+    private_ips=dict(type='list'),
+    product=dict(type='str', required=True),
+    rancher=dict(type='dict'),
+    revert_to_spot=dict(type='dict'),
+    right_scale=dict(type='dict'),
+    risk=dict(type='int'),
+    roll_config=dict(type='dict'),
+    route53=dict(type='dict'),
+    scheduled_tasks=dict(type='list'),
+    security_group_ids=dict(type='list', required=True),
+    shutdown_script=dict(type='str'),
+    signals=dict(type='list'),
+    spin_up_time=dict(type='int'),
+    spot_instance_types=dict(type='list', required=True),
+    state=dict(default='present', choices=['present', 'absent']),
+    stateful_deallocation_should_delete_images=dict(type='bool'),
+    stateful_deallocation_should_delete_network_interfaces=dict(type='bool'),
+    stateful_deallocation_should_delete_snapshots=dict(type='bool'),
+    stateful_deallocation_should_delete_volumes=dict(type='bool'),
+    tags=dict(type='list'),
+    target=dict(type='int', required=True),
+    target_group_arns=dict(type='list'),
+    tenancy=dict(type='str'),
+    terminate_at_end_of_billing_hour=dict(type='bool'),
+    unit=dict(type='str'),
+    user_data=dict(type='str'),
+    utilize_reserved_instances=dict(type='bool'),
+    uniqueness_by=dict(default='name', choices=['name', 'id']),
+    up_scaling_policies=dict(type='list'),
+    target_tracking_policies=dict(type='list'),
+    wait_for_instances=dict(type='bool', default=False),
+    wait_for_roll=dict(type='bool', default=False),
+    wait_for_roll_timeout=dict(type='int', default=1800),
+    wait_config=dict(type='dict', options=waiter_fields),
+    wait_timeout=dict(type='int')
+)
+
+eni_fields = ('description',
+              'device_index',
+              'secondary_private_ip_address_count',
+              'associate_public_ip_address',
+              'delete_on_termination',
+              'groups',
+              'network_interface_id',
+              'private_ip_address',
+              'subnet_id',
+              'associate_ipv6_address')
+
+private_ip_fields = ('private_ip_address',
+                     'primary')
+
+instance_types_fields = (dict(ansible_field_name='spot_instance_types',
+                              spotinst_field_name='spot'),
+                         dict(ansible_field_name='on_demand_instance_type',
+                              spotinst_field_name='ondemand'),
+                         dict(ansible_field_name='preferred_spot_instance_types',
+                              spotinst_field_name='preferred_spot'))
+
+compute_fields = ('product',
+                  'elastic_ips',
+                  'private_ips')
+
+ebs_volume_fields = ('device_name',
+                     'volume_ids')
+
+credit_specification_fields = ('cpu_credits',)
+
+capacity_fields = (dict(ansible_field_name='min_size',
+                        spotinst_field_name='minimum'),
+                   dict(ansible_field_name='max_size',
+                        spotinst_field_name='maximum'),
+                   'target',
+                   'unit')
+
+lspec_fields = ('user_data',
+                'key_pair',
+                'tenancy',
+                'shutdown_script',
+                'monitoring',
+                'ebs_optimized',
+                'image_id',
+                'health_check_type',
+                'health_check_grace_period',
+                'health_check_unhealthy_duration_before_replacement',
+                'security_group_ids')
+
+iam_fields = (dict(ansible_field_name='iam_role_name',
+                   spotinst_field_name='name'),
+              dict(ansible_field_name='iam_role_arn',
+                   spotinst_field_name='arn'))
+
+scheduled_task_fields = ('adjustment',
+                         'adjustment_percentage',
+                         'batch_size_percentage',
+                         'cron_expression',
+                         'frequency',
+                         'grace_period',
+                         'task_type',
+                         'is_enabled',
+                         'scale_target_capacity',
+                         'scale_min_capacity',
+                         'scale_max_capacity')
+
+scaling_policy_fields = ('policy_name',
+                         'namespace',
+                         'metric_name',
+                         'dimensions',
+                         'statistic',
+                         'evaluation_periods',
+                         'period',
+                         'threshold',
+                         'cooldown',
+                         'unit',
+                         'operator',
+                         'shouldResumeStateful')
+
+tracking_policy_fields = ('policy_name',
+                          'namespace',
+                          'source',
+                          'metric_name',
+                          'statistic',
+                          'unit',
+                          'cooldown',
+                          'target',
+                          'threshold')
+
+action_fields = (dict(ansible_field_name='action_type',
+                      spotinst_field_name='type'),
+                 'adjustment',
+                 'min_target_capacity',
+                 'max_target_capacity',
+                 'target',
+                 'minimum',
+                 'maximum')
+
+signal_fields = ('name',
+                 'timeout')
+
+multai_lb_fields = ('balancer_id',
+                    'project_id',
+                    'target_set_id',
+                    'az_awareness',
+                    'auto_weight')
+
+persistence_fields = ('should_persist_root_device',
+                      'should_persist_block_devices',
+                      'should_persist_private_ip',
+                      'block_devices_mode')
+
+revert_to_spot_fields = ('perform_at',
+                         'time_windows')
+
+elastic_beanstalk_platform_update_fields = ('perform_at',
+                                            'time_window',
+                                            'update_level')
+
+strategy_fields = ('risk',
+                   'utilize_reserved_instances',
+                   'fallback_to_od',
+                   'on_demand_count',
+                   'availability_vs_cost',
+                   'draining_timeout',
+                   'spin_up_time',
+                   'lifetime_period')
+
+ebs_fields = ('delete_on_termination',
+              'encrypted',
+              'iops',
+              'snapshot_id',
+              'volume_type',
+              'volume_size')
+
+bdm_fields = ('device_name',
+              'virtual_name',
+              'no_device')
+
+
+kubernetes_fields = ('api_server',
+                     'token',
+                     'integration_mode',
+                     'cluster_identifier')
+
+kubernetes_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
+
+kubernetes_headroom_fields = (
+    'cpu_per_unit',
+    'memory_per_unit',
+    'num_of_units')
+
+kubernetes_labels_fields = ('key', 'value')
+
+kubernetes_down_fields = ('evaluation_periods',)
+
+nomad_fields = ('master_host', 'master_port', 'acl_token')
+
+nomad_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
+
+nomad_headroom_fields = ('cpu_per_unit', 'memory_per_unit', 'num_of_units')
+
+nomad_constraints_fields = ('key', 'value')
+
+nomad_down_fields = ('evaluation_periods',)
+
+docker_swarm_fields = ('master_host', 'master_port')
+
+docker_swarm_auto_scale_fields = ('is_enabled', 'cooldown')
+
+docker_swarm_headroom_fields = (
+    'cpu_per_unit',
+    'memory_per_unit',
+    'num_of_units')
+
+docker_swarm_down_fields = ('evaluation_periods',)
+
+route53_domain_fields = ('hosted_zone_id',)
+
+route53_record_set_fields = ('name', 'use_public_ip')
+
+mlb_runtime_fields = ('deployment_id',)
+
+mlb_load_balancers_fields = (
+    'type',
+    'target_set_id',
+    'balancer_id',
+    'auto_weight',
+    'az_awareness')
+
+elastic_beanstalk_fields = ('environment_id',)
+
+elastic_beanstalk_deployment_fields = ('automatic_roll',
+                                       'batch_size_percentage',
+                                       'grace_period')
+
+elastic_beanstalk_strategy_fields = ('action', 'should_drain_instances')
+
+stateful_deallocation_fields = (
+    dict(
+        ansible_field_name='stateful_deallocation_should_delete_images',
+        spotinst_field_name='should_delete_images'),
+    dict(
+        ansible_field_name='stateful_deallocation_should_delete_snapshots',
+        spotinst_field_name='should_delete_snapshots'),
+    dict(
+        ansible_field_name='stateful_deallocation_should_delete_network_interfaces',
+        spotinst_field_name='should_delete_network_interfaces'),
+    dict(
+        ansible_field_name='stateful_deallocation_should_delete_volumes',
+        spotinst_field_name='should_delete_volumes'))
+
+code_deploy_fields = ('clean_up_on_failure', 'terminate_instance_on_failure')
+
+code_deploy_deployment_fields = ('application_name', 'deployment_group_name')
+
+right_scale_fields = ('account_id',
+                      'refresh_token')
+
+rancher_fields = ('access_key',
+                  'secret_key',
+                  'master_host',
+                  'version')
+
+chef_fields = ('chef_server',
+               'organization',
+               'user',
+               'pem_key',
+               'chef_version')
+
+az_fields = ('name',
+             'subnet_id',
+             'subnet_ids',
+             'placement_group_name')
+
+opsworks_fields = ('layer_id',)
+
+scaling_strategy_fields = ('terminate_at_end_of_billing_hour',)
+
+mesosphere_fields = ('api_server',)
+
+ecs_fields = ('cluster_name',)
+
+ecs_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
+
+ecs_headroom_fields = ('cpu_per_unit', 'memory_per_unit', 'num_of_units')
+
+ecs_attributes_fields = ('key', 'value')
+
+ecs_down_fields = ('evaluation_periods',)
+
+multai_fields = (dict(ansible_field_name='multai_token',
+                      spotinst_field_name='token'),)
+
+
+def handle_elastigroup(client, module, existing_groups=None, roll=None):
+    """
+    Create, update or delete the elastigroup described by ``module.params``.
+
+    ``existing_groups`` may hold the account's groups from a single earlier
+    listing, in which case the name lookup is answered from it instead of
+    querying the API again.
+
+    ``roll``, when given, is a dict updated with the ID of the roll started
+    after an update and, with ``wait_for_roll``, the outcome of the wait.
+    """
+    has_changed = False
+    should_create = False
+    group_id = None
+    message = 'None'
+    diff = None
+
+    name = module.params.get('name')
+    state = module.params.get('state')
+    uniqueness_by = module.params.get('uniqueness_by')
+    external_group_id = module.params.get('id')
+    name_cache = get_name_cache(module.params, "elastigroup_aws")
+
+    if uniqueness_by == 'id':
+        if external_group_id is None:
+            should_create = True
+        else:
+            should_create = False
+            group_id = external_group_id
+    else:
+        if existing_groups is not None:
+            groups = existing_groups
+        else:
+            groups = find_resources_by_name(client, name, client.get_elastigroups, limit=1, name_cache=name_cache)
+        should_create, group_id = find_group_with_same_name(groups, name)
+
+    if should_create is True:
+        if state == 'present':
+            eg = expand_elastigroup(module, is_update=False)
+            diff = get_create_diff(eg)
+            has_changed = True
+
+            if module.check_mode:
+                message = 'Group would be created.'
+            else:
+                module.debug(str(" [INFO] " + message + "\n"))
+                group = client.create_elastigroup(group=eg)
+                group_id = group['id']
+                message = 'Created group Successfully.'
+
+                if name_cache is not None:
+                    name_cache.record_created(name, group_id)
+
+        elif state == 'absent':
+            message = 'Cannot delete non-existent group.'
+            has_changed = False
+    else:
+        eg = expand_elastigroup(module, is_update=True)
+        auto_apply_tags = module.params.get('auto_apply_tags')
+
+        if state == 'present':
+            current_group = client.get_elastigroup(group_id=group_id)
+            diff = get_update_diff(eg, current_group)
+
+            if has_changes(diff) and module.check_mode:
+                message = 'Group would be updated.'
+                has_changed = True
+            elif has_changes(diff):
+                prune_model(eg, diff['after'])
+                group = client.update_elastigroup(group_update=eg, group_id=group_id, auto_apply_tags=auto_apply_tags)
+                message = 'Updated group successfully.'
+
+                if name_cache is not None and diff['after'].get('name'):
+                    name_cache.record_renamed(diff['after']['name'], group_id)
+
+                roll_response = None
+
+                try:
+                    roll_config = module.params.get('roll_config')
+                    if roll_config:
+                        roll_response = start_group_roll(client, group_id, roll_config)
+                        message = 'Updated and started rolling the group successfully.'
+
+                except spotinst_client.SpotinstClientException as exc:
+                    message = 'Updated group successfully, but failed to perform roll. Error:' + str(exc)
+                has_changed = True
+
+                if roll_response is not None:
+                    roll_result = dict(id=get_roll_id(roll_response))
+
+                    if module.params.get('wait_for_roll'):
+                        roll_result.update(wait_for_group_roll(client, module, group_id, roll_result['id']))
+                        message = 'Updated and rolled the group successfully.'
+
+                    if roll is not None:
+                        roll.update(roll_result)
+            else:
+                message = 'Group is already up to date.'
+
+        elif state == 'absent' and module.check_mode:
+            diff = get_delete_diff(group_id)
+            message = 'Group would be deleted.'
+            has_changed = True
+
+        elif state == 'absent':
+            diff = get_delete_diff(group_id)
+
+            try:
+                stfl_dealloc_request = stateful_deallocation_converter.convert(module.params)
+                if stfl_dealloc_request. \
+                        should_delete_network_interfaces is True or \
+                        stfl_dealloc_request.should_delete_images is True or \
+                        stfl_dealloc_request.should_delete_volumes is True or \
+                        stfl_dealloc_request.should_delete_snapshots is True:
+                    client.delete_elastigroup_with_deallocation(
+                        group_id=group_id,
+                        stateful_deallocation=stfl_dealloc_request)
+                else:
+                    client.delete_elastigroup(group_id=group_id)
+            except spotinst_client.SpotinstClientException as exc:
+                if "GROUP_DOESNT_EXIST" in exc.message:
+                    pass
+                else:
+                    module.fail_json(
+                        msg="Error while attempting to delete group :"
+                            " " + exc.message)
+
+            message = 'Deleted group successfully.'
+            has_changed = True
+
+            if name_cache is not None:
+                name_cache.record_deleted(group_id)
+
+    return group_id, message, has_changed, diff
+
+
+def retrieve_group_instances(client, module, group_id):
+    """
+    Wait for ``target`` instances of the group to be up, when
+    ``wait_for_instances`` is set, and return them with the outcome of the
+    wait. An instance is up once it is HEALTHY when ``health_check_type`` is
+    set, or once it has a private IP otherwise.
+    """
+    wait_timeout = module.params.get('wait_timeout')
+    wait_for_instances = module.params.get('wait_for_instances')
+
+    health_check_type = module.params.get('health_check_type')
+
+    if wait_timeout is None:
+        wait_timeout = 300
+
+    target = module.params.get('target')
+    state = module.params.get('state')
+
+    if state == 'present' and group_id is not None and wait_for_instances is True and not module.check_mode:
+
+        def poll_instances():
+            if health_check_type is not None:
+                return client.get_instance_healthiness(group_id=group_id)
+
+            return client.get_elastigroup_active_instances(group_id=group_id)
+
+        def is_healthy(instance):
+            if health_check_type is not None:
+                return instance.get('health_status') == 'HEALTHY'
+
+            return instance.get('private_ip') is not None
+
+        def log_event(event):
+            module.debug(" [INFO] Instance {instance_id} {event} at {offset}s".format(**event))
+
+        waiter = get_waiter(module.params)
+        tracker = InstanceTracker(is_healthy, on_event=log_event, clock=waiter.clock)
+        wait_result = waiter.wait(lambda: tracker.update(poll_instances()),
+                                  lambda tracker: len(tracker.healthy) >= target, wait_timeout)
+
+        wait = wait_result.to_dict()
+        wait.update(instances=tracker.get_timeline(), events=tracker.events)
+
+        return tracker.get_healthy_instances(), wait
+
+    return list(), None
+
+
+class InstanceTracker(object):
+    """
+    Follows the instances of a group across the polls of a wait, keyed by
+    instance ID. A poll only replaces the instances whose ``INSTANCE_STATE_KEYS``
+    changed, and records an event each time an instance is first seen, becomes
+    healthy or unhealthy, or is gone, in seconds from the start of the wait.
+    """
+
+    def __init__(self, is_healthy, on_event=None, clock=time.time):
+        self.is_healthy = is_healthy
+        self.on_event = on_event
+        self.clock = clock
+        self.started_at = clock()
+        self.instances = dict()
+        self.healthy = set()
+        self.timeline = dict()
+        self.events = list()
+
+    def update(self, items):
+        offset = round(self.clock() - self.started_at, 3)
+        seen = set()
+
+        for item in items:
+            instance_id = item.get('instance_id')
+            seen.add(instance_id)
+            current = self.instances.get(instance_id)
+
+            if current is None:
+                self.timeline.setdefault(instance_id, dict(instance_id=instance_id, seen_at=offset, healthy_at=None))
+                self.emit(instance_id, 'seen', offset)
+            elif all(current.get(key) == item.get(key) for key in INSTANCE_STATE_KEYS):
+                continue
+
+            self.instances[instance_id] = item
+
+            if self.is_healthy(item):
+                if instance_id not in self.healthy:
+                    self.healthy.add(instance_id)
+                    self.emit(instance_id, 'healthy', offset)
+
+                    if self.timeline[instance_id]['healthy_at'] is None:
+                        self.timeline[instance_id]['healthy_at'] = offset
+            elif instance_id in self.healthy:
+                self.healthy.discard(instance_id)
+                self.emit(instance_id, 'unhealthy', offset)
+
+        if len(seen) != len(self.instances):
+            for instance_id in [instance_id for instance_id in self.instances if instance_id not in seen]:
+                del self.instances[instance_id]
+                self.healthy.discard(instance_id)
+                self.emit(instance_id, 'gone', offset)
+
+        return self
+
+    def emit(self, instance_id, event, offset):
+        event = dict(instance_id=instance_id, event=event, offset=offset)
+        self.events.append(event)
+
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def get_healthy_instances(self):
+        return [instance for instance_id, instance in self.instances.items() if instance_id in self.healthy]
+
+    def get_timeline(self):
+        """
+        When each instance was first seen and first became healthy, and how
+        long that took, for tuning ``health_check_grace_period``.
+        """
+        timeline = list()
+
+        for entry in self.timeline.values():
+            entry = dict(entry, time_to_healthy=None)
+
+            if entry['healthy_at'] is not None:
+                entry['time_to_healthy'] = round(entry['healthy_at'] - entry['seen_at'], 3)
+
+            timeline.append(entry)
+
+        return timeline
+
+
+def start_group_roll(client, group_id, roll_config):
+    """
+    Start rolling the group with the ``batch_size_percentage``, ``grace_period``
+    and ``health_check_type`` of ``roll_config``, and return the API response.
+    """
+    eg_roll = models.Roll(
+        batch_size_percentage=roll_config.get('batch_size_percentage'),
+        grace_period=roll_config.get('grace_period'),
+        health_check_type=roll_config.get('health_check_type')
+    )
+
+    return client.roll_group(group_roll=eg_roll, group_id=group_id)
+
+
+def get_roll_id(roll_response):
+    items = roll_response.get('items') if isinstance(roll_response, dict) else None
+
+    if items:
+        return items[0].get('id')
+
+    return None
+
+
+def wait_for_group_roll(client, module, group_id, roll_id):
+    """
+    Poll the deployment status of the roll ``roll_id`` until it ends or
+    ``wait_for_roll_timeout`` passes, and return its status with the
+    duration of every batch. Fails the module unless the roll finished.
+    """
+    if roll_id is None:
+        module.fail_json(msg="Started rolling group " + str(group_id) + ", but the roll response has no ID to wait for",
+                         group_id=group_id, changed=True)
+
+    def poll_deployment_status():
+        items = client.get_deployment_status(group_id=group_id, roll_id=roll_id)
+        return tracker.update(items[0] if items else dict())
+
+    waiter = get_waiter(module.params)
+    tracker = RollTracker(clock=waiter.clock)
+    wait_result = waiter.wait(poll_deployment_status, lambda tracker: tracker.is_done(),
+                              module.params.get('wait_for_roll_timeout'))
+
+    roll = tracker.to_dict()
+    roll['wait'] = wait_result.to_dict()
+
+    if tracker.status != ROLL_FINISHED:
+        if wait_result.done:
+            msg = "Roll " + str(roll_id) + " of group " + str(group_id) + " ended with status " + str(tracker.status)
+        else:
+            msg = "Timed out waiting for roll " + str(roll_id) + " of group " + str(group_id) + " to finish"
+
+        module.fail_json(msg=msg, group_id=group_id, changed=True, roll=dict(roll, id=roll_id))
+
+    return roll
+
+
+class RollTracker(object):
+    """
+    Follows a roll across the polls of its deployment status, and records
+    when each batch was first seen running and when it ended, in seconds from
+    the start of the wait. Durations are therefore as fine as the polling.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.started_at = clock()
+        self.status = None
+        self.progress = None
+        self.num_of_batches = None
+        self.batches = list()
+
+    def update(self, deployment):
+        offset = round(self.clock() - self.started_at, 3)
+        current_batch = deployment.get('current_batch')
+
+        self.status = str(deployment.get('status') or '').upper() or None
+        self.progress = deployment.get('progress')
+        self.num_of_batches = deployment.get('num_of_batches')
+
+        if current_batch is not None and (not self.batches or self.batches[-1]['batch'] != current_batch):
+            self.end_batch(offset)
+            self.batches.append(dict(batch=current_batch, started_at=offset, ended_at=None, duration=None))
+
+        if self.is_done():
+            self.end_batch(offset)
+
+        return self
+
+    def end_batch(self, offset):
+        if self.batches and self.batches[-1]['ended_at'] is None:
+            batch = self.batches[-1]
+            batch['ended_at'] = offset
+            batch['duration'] = round(offset - batch['started_at'], 3)
+
+    def is_done(self):
+        return self.status in ROLL_END_STATUSES
+
+    def to_dict(self):
+        return dict(status=self.status, progress=self.progress, num_of_batches=self.num_of_batches,
+                    batches=self.batches)
+
+
+def find_group_with_same_name(groups, name):
+    for group in groups:
+        if group['name'] == name:
+            return False, group.get('id')
+
+    return True, None
+
+
+def expand_elastigroup(module, is_update):
+    """
+    Build the Elastigroup model of ``module.params``. Updates leave out the
+    product and capacity unit, and the image and target capacity when
+    ``do_not_update`` lists them.
+    """
+    return elastigroup_converter.convert(module.params, is_update, module.params.get('do_not_update'))
+
+
+def expand_tag(tag):
+    """Tags are given as dicts of a single key and its value."""
+    if not tag:
+        return None
+
+    key = next(iter(tag))
+    return dict(tag_key=key, tag_value=tag[key] or None)
+
+
+def expand_load_balancer_name(name):
+    return dict(name=name)
+
+
+def expand_target_group_arn(arn):
+    return dict(arn=arn)
+
+
+scaling_policy_mapping = ModelMapping(
+    'ScalingPolicy', scaling_policy_fields,
+    members=[Nested('action', ModelMapping('ScalingPolicyAction', action_fields))])
+
+capacity_mapping = ModelMapping('Capacity', capacity_fields, create_only=('unit',), do_not_update=('target',))
+
+strategy_mapping = ModelMapping('Strategy', strategy_fields, members=[
+    Nested('scaling_strategy', ModelMapping('ScalingStrategy', scaling_strategy_fields,
+                                            required=('terminate_at_end_of_billing_hour',))),
+    Nested('persistence', ModelMapping('Persistence', persistence_fields), 'persistence'),
+    Each('signals', ModelMapping('Signal', signal_fields), 'signals'),
+    Nested('revert_to_spot', ModelMapping('RevertToSpot', revert_to_spot_fields), 'revert_to_spot'),
+])
+
+scaling_mapping = ModelMapping('Scaling', required=('up', 'down', 'target'), members=[
+    Each('up', scaling_policy_mapping, 'up_scaling_policies'),
+    Each('down', scaling_policy_mapping, 'down_scaling_policies'),
+    Each('target', ModelMapping('TargetTrackingPolicy', tracking_policy_fields), 'target_tracking_policies'),
+])
+
+integrations_mapping = ModelMapping(
+    'ThirdPartyIntegrations',
+    required=('mesosphere', 'ecs', 'kubernetes', 'nomad', 'docker_swarm', 'route53', 'mlb_runtime',
+              'elastic_beanstalk', 'code_deploy', 'right_scale', 'opsworks', 'rancher', 'chef'),
+    members=[
+        Nested('mesosphere', ModelMapping('Mesosphere', mesosphere_fields), 'mesosphere'),
+        Nested('ecs', ModelMapping('EcsConfiguration', ecs_fields, members=[
+            Nested('auto_scale', ModelMapping('EcsAutoScaleConfiguration', ecs_auto_scale_fields, members=[
+                Nested('headroom', ModelMapping('EcsAutoScalerHeadroomConfiguration', ecs_headroom_fields),
+                       'headroom'),
+                Each('attributes', ModelMapping('EcsAutoScalerAttributeConfiguration', ecs_attributes_fields),
+                     'attributes'),
+                Nested('down', ModelMapping('EcsAutoScalerDownConfiguration', ecs_down_fields), 'down'),
+            ]), 'auto_scale'),
+        ]), 'ecs'),
+        Nested('kubernetes', ModelMapping('KubernetesConfiguration', kubernetes_fields, members=[
+            Nested('auto_scale', ModelMapping('KubernetesAutoScalerConfiguration', kubernetes_auto_scale_fields, members=[
+                Nested('headroom', ModelMapping('KubernetesAutoScalerHeadroomConfiguration', kubernetes_headroom_fields),
+                       'headroom'),
+                Each('labels', ModelMapping('KubernetesAutoScalerLabelsConfiguration', kubernetes_labels_fields),
+                     'labels'),
+                Nested('down', ModelMapping('KubernetesAutoScalerDownConfiguration', kubernetes_down_fields), 'down'),
+            ]), 'auto_scale'),
+        ]), 'kubernetes'),
+        Nested('nomad', ModelMapping('NomadConfiguration', nomad_fields, members=[
+            Nested('auto_scale', ModelMapping('NomadAutoScalerConfiguration', nomad_auto_scale_fields, members=[
+                Nested('headroom', ModelMapping('NomadAutoScalerHeadroomConfiguration', nomad_headroom_fields),
+                       'headroom'),
+                Each('constraints', ModelMapping('NomadAutoScalerConstraintsConfiguration', nomad_constraints_fields),
+                     'constraints'),
+                Nested('down', ModelMapping('NomadAutoScalerDownConfiguration', nomad_down_fields), 'down'),
+            ]), 'auto_scale'),
+        ]), 'nomad'),
+        Nested('docker_swarm', ModelMapping('DockerSwarmConfiguration', docker_swarm_fields, members=[
+            Nested('auto_scale', ModelMapping('DockerSwarmAutoScalerConfiguration', docker_swarm_auto_scale_fields, members=[
+                Nested('headroom', ModelMapping('DockerSwarmAutoScalerHeadroomConfiguration', docker_swarm_headroom_fields),
+                       'headroom'),
+                Nested('down', ModelMapping('DockerSwarmAutoScalerDownConfiguration', docker_swarm_down_fields), 'down'),
+            ]), 'auto_scale'),
+        ]), 'docker_swarm'),
+        Nested('route53', ModelMapping('Route53Configuration', members=[
+            Each('domains', ModelMapping('Route53DomainsConfiguration', route53_domain_fields, members=[
+                Each('record_sets', ModelMapping('Route53RecordSetsConfiguration', route53_record_set_fields),
+                     'record_sets'),
+            ]), 'domains'),
+        ]), 'route53'),
+        Nested('mlb_runtime', ModelMapping('MlbRuntimeConfiguration', mlb_runtime_fields), 'mlb_runtime'),
+        Nested('elastic_beanstalk', ModelMapping('ElasticBeanstalk', elastic_beanstalk_fields, members=[
+            Nested('deployment_preferences', ModelMapping('DeploymentPreferences', elastic_beanstalk_deployment_fields, members=[
+                Nested('strategy', ModelMapping('BeanstalkDeploymentStrategy', elastic_beanstalk_strategy_fields),
+                       'strategy'),
+            ]), 'deployment_preferences'),
+            Nested('managed_actions', ModelMapping('ManagedActions', members=[
+                Nested('platform_update', ModelMapping('PlatformUpdate', elastic_beanstalk_platform_update_fields),
+                       'platform_update'),
+            ]), 'managed_actions'),
+        ]), 'elastic_beanstalk'),
+        Nested('code_deploy', ModelMapping('CodeDeployConfiguration', code_deploy_fields, members=[
+            Each('deployment_groups', ModelMapping('CodeDeployDeploymentGroupsConfiguration', code_deploy_deployment_fields),
+                 'deployment_groups'),
+        ]), 'code_deploy'),
+        Nested('right_scale', ModelMapping('RightScaleConfiguration', right_scale_fields), 'right_scale'),
+        Nested('opsworks', ModelMapping('OpsWorksConfiguration', opsworks_fields), 'opsworks'),
+        Nested('rancher', ModelMapping('Rancher', rancher_fields), 'rancher'),
+        Nested('chef', ModelMapping('ChefConfiguration', chef_fields), 'chef'),
+    ])
+
+launch_spec_mapping = ModelMapping('LaunchSpecification', lspec_fields, do_not_update=('image_id',), members=[
+    Nested('iam_role', ModelMapping('IamRole', iam_fields, required=('name', 'arn'))),
+    Each('tags', ModelMapping('Tag', ('tag_key', 'tag_value')), 'tags', prepare=expand_tag),
+    Nested('load_balancers_config', ModelMapping('LoadBalancersConfig', required=('load_balancers',), members=[
+        Each('load_balancers', ModelMapping('LoadBalancer', ('name',), constants=dict(type='CLASSIC'), required=('name',)),
+             'load_balancers', prepare=expand_load_balancer_name),
+        Each('load_balancers', ModelMapping('LoadBalancer', ('arn',), constants=dict(type='TARGET_GROUP'), required=('arn',)),
+             'target_group_arns', prepare=expand_target_group_arn),
+        Each('load_balancers', ModelMapping('LoadBalancer', mlb_load_balancers_fields, constants=dict(type='MULTAI_TARGET_SET')),
+             'mlb_load_balancers'),
+    ])),
+    Each('block_device_mappings', ModelMapping('BlockDeviceMapping', bdm_fields, members=[
+        Nested('ebs', ModelMapping('EBS', ebs_fields), 'ebs'),
+    ]), 'block_device_mappings'),
+    Each('network_interfaces', ModelMapping('NetworkInterface', eni_fields, members=[
+        Each('private_ip_addresses', ModelMapping('PrivateIpAddress', private_ip_fields), 'private_ip_addresses'),
+    ]), 'network_interfaces'),
+    Nested('credit_specification', ModelMapping('CreditSpecification', credit_specification_fields),
+           'credit_specification', default=None),
+])
+
+compute_mapping = ModelMapping('Compute', compute_fields, create_only=('product',), members=[
+    Nested('instance_types', ModelMapping('InstanceTypes', instance_types_fields, required=('spot', 'ondemand'))),
+    Each('ebs_volume_pool', ModelMapping('EbsVolume', ebs_volume_fields, required=('device_name',)), 'ebs_volume_pool'),
+    Each('availability_zones', ModelMapping('AvailabilityZone', az_fields), 'availability_zones'),
+    Nested('launch_specification', launch_spec_mapping),
+])
+
+multai_mapping = ModelMapping('Multai', multai_fields, required=('balancers',), members=[
+    Each('balancers', ModelMapping('MultaiLoadBalancer', multai_lb_fields), 'multai_load_balancers'),
+])
+
+scheduling_mapping = ModelMapping('Scheduling', required=('tasks',), members=[
+    Each('tasks', ModelMapping('ScheduledTask', scheduled_task_fields), 'scheduled_tasks'),
+])
+
+elastigroup_converter = MappingConverter(models, ModelMapping('Elastigroup', ('name', 'description'), members=[
+    Nested('capacity', capacity_mapping),
+    Nested('strategy', strategy_mapping),
+    Nested('scaling', scaling_mapping),
+    Nested('third_parties_integration', integrations_mapping),
+    Nested('compute', compute_mapping),
+    Nested('multai', multai_mapping),
+    Nested('scheduling', scheduling_mapping),
+]))
+
+stateful_deallocation_converter = MappingConverter(
+    models, ModelMapping('StatefulDeallocation', stateful_deallocation_fields))
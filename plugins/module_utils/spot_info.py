@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_batch import DEFAULT_MAX_WORKERS, run_batch
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name, get_item_name
+
+info_fields = dict(
+    names=dict(type='list', elements='str'),
+    ids=dict(type='list', elements='str'),
+    fields=dict(type='list', elements='str'),
+    exclude_fields=dict(type='list', elements='str'),
+    max_workers=dict(type='int', default=DEFAULT_MAX_WORKERS),
+)
+
+_MISSING = object()
+
+
+def _select(data, parts):
+    if not parts:
+        return data
+
+    if isinstance(data, list):
+        selected = [_select(item, parts) for item in data]
+        return [dict() if item is _MISSING else item for item in selected]
+
+    if not isinstance(data, dict) or parts[0] not in data:
+        return _MISSING
+
+    value = _select(data[parts[0]], parts[1:])
+
+    return _MISSING if value is _MISSING else {parts[0]: value}
+
+
+def _merge(target, source):
+    for key, value in source.items():
+        current = target.get(key)
+
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            target[key] = [_merge(old, new) if isinstance(old, dict) and isinstance(new, dict) else new
+                           for old, new in zip(current, value)]
+        else:
+            target[key] = value
+
+    return target
+
+
+def _drop(data, parts):
+    if isinstance(data, list):
+        for item in data:
+            _drop(item, parts)
+    elif isinstance(data, dict) and parts[0] in data:
+        if len(parts) == 1:
+            del data[parts[0]]
+        else:
+            _drop(data[parts[0]], parts[1:])
+
+
+def project(resource, fields=None, exclude_fields=None):
+    """
+    Trim ``resource`` to the dotted paths in ``fields`` (all of it when not set)
+    and then remove the dotted paths in ``exclude_fields``. A path that crosses
+    a list applies to every item. ``resource`` itself may be modified.
+    """
+    if fields:
+        projected = dict()
+
+        for field in fields:
+            selected = _select(resource, field.split("."))
+
+            if selected is not _MISSING:
+                _merge(projected, selected)
+
+        resource = projected
+
+    for field in exclude_fields or list():
+        _drop(resource, field.split("."))
+
+    return resource
+
+
+def tags_to_dict(tags, key_name="tag_key", value_name="tag_value"):
+    return dict((tag.get(key_name), tag.get(value_name)) for tag in tags or list() if tag.get(key_name))
+
+
+def matches_tags(tags, wanted):
+    """Whether every key in ``wanted`` is in ``tags`` with the same value."""
+    return all(tags.get(key) == value for key, value in (wanted or dict()).items())
+
+
+def fetch_all(module, items, fetch, max_workers):
+    """
+    Call ``fetch(item)`` for every item on a bounded thread pool and return the
+    results in item order. Fails the module if any fetch failed.
+    """
+    results = run_batch(items, fetch, max_workers)
+    failed = [result["msg"] for result in results if isinstance(result, dict) and result.get("failed")]
+
+    if failed:
+        module.fail_json(msg="Failed to fetch {0} of {1} resources: {2}".format(len(failed), len(items), failed[0]))
+
+    return results
+
+
+def _call_once(function):
+    lock = threading.Lock()
+    results = list()
+
+    def call():
+        with lock:
+            if not results:
+                results.append(function())
+
+        return results[0]
+
+    return call
+
+
+def fetch_by_id(module, ids, get_by_id, list_all, max_workers):
+    """
+    Fetch the resources with ``ids`` concurrently. IDs that could not be fetched
+    and are not in the account listing returned by ``list_all`` are skipped with
+    a warning. Any other failure fails the module.
+    """
+    results = run_batch(ids, get_by_id, max_workers)
+    failed = [(resource_id, result["msg"]) for resource_id, result in zip(ids, results)
+              if isinstance(result, dict) and result.get("failed")]
+
+    if not failed:
+        return results
+
+    # The API reports a missing resource like any other error, so check the listing before failing.
+    existing_ids = set(resource.get('id') for resource in list_all())
+    errors = [msg for resource_id, msg in failed if resource_id in existing_ids]
+
+    if errors:
+        module.fail_json(msg="Failed to fetch {0} of {1} resources: {2}".format(len(errors), len(ids), errors[0]))
+
+    module.warn("Resources not found: {0}".format(", ".join(resource_id for resource_id, msg in failed)))
+
+    return [result for result in results if not (isinstance(result, dict) and result.get("failed"))]
+
+
+def find_resources(client, module, list_all, get_by_id, name_path=("name",), get_tags=None):
+    """
+    Return the resources selected by the ``names``, ``ids`` and ``tags`` options.
+
+    Without tags, names are looked up with the server-side name filter and IDs
+    are fetched directly, both concurrently. With tags, or when neither names
+    nor IDs are given, the account is listed once with ``list_all`` and filtered
+    here. ``get_tags`` returns a resource's tags as a dict.
+    """
+    names = module.params.get('names') or list()
+    ids = module.params.get('ids') or list()
+    tags = module.params.get('tags')
+    max_workers = module.params.get('max_workers')
+
+    if tags or not (names or ids):
+        return [resource for resource in list_all()
+                if (not names and not ids or get_item_name(resource, name_path) in names or resource.get('id') in ids)
+                and (get_tags is None or matches_tags(get_tags(resource), tags))]
+
+    # Name lookups that fall back to listing the account share a single listing.
+    list_all_once = _call_once(list_all)
+    resources = [resource for matches in fetch_all(
+        module, names, lambda name: find_resources_by_name(client, name, list_all_once), max_workers)
+        for resource in matches]
+    resources.extend(fetch_by_id(module, ids, get_by_id, list_all_once, max_workers))
+
+    seen = set()
+    unique = list()
+
+    for resource in resources:
+        if resource.get('id') not in seen:
+            seen.add(resource.get('id'))
+            unique.append(resource)
+
+    return unique
+
+
+def get_resources_info(module, resources, details):
+    """
+    Trim each resource with the ``fields`` and ``exclude_fields`` options, and add
+    the details named in the ``include`` option, fetched concurrently. ``details``
+    maps each ``include`` choice to the result key and the call that takes a
+    resource ID and fetches that detail.
+    """
+    include = module.params.get('include') or list()
+    fields = module.params.get('fields')
+    exclude_fields = module.params.get('exclude_fields')
+
+    # Trim the resources first, so the full payloads are not kept while the details are fetched.
+    items = [(resource['id'], project(resource, fields, exclude_fields)) for resource in resources]
+
+    if not include:
+        return [info for resource_id, info in items]
+
+    def fetch_details(item):
+        resource_id, info = item
+
+        for name in include:
+            key, fetch = details[name]
+            info[key] = fetch(resource_id)
+
+        return info
+
+    return fetch_all(module, items, fetch_details, module.params.get('max_workers'))
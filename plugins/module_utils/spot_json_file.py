@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+
+
+class LockedJsonFile(object):
+    """
+    A JSON object in a local file, shared by the module processes on the
+    control node. Callers hold ``locked()``, an exclusive flock on
+    ``<path>.lock``, around each read-modify-write. Writes replace the file
+    atomically, so readers never see a partial file.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+
+    @contextmanager
+    def locked(self):
+        lock_path = self.path + ".lock"
+        lock_dir = os.path.dirname(lock_path)
+
+        if lock_dir and not os.path.isdir(lock_dir):
+            os.makedirs(lock_dir)
+
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def read(self):
+        try:
+            with open(self.path, "r") as json_file:
+                content = json.load(json_file)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+        return content if isinstance(content, dict) else dict()
+
+    def write(self, content):
+        tmp_path = "{0}.{1}.tmp".format(self.path, os.getpid())
+
+        with open(tmp_path, "w") as json_file:
+            json.dump(content, json_file)
+
+        os.rename(tmp_path, self.path)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import spotinst_client
+
+
+# List endpoint and path of the name field in each listed item, by SDK client class.
+LIST_ENDPOINT_BY_CLIENT_CLS = {
+    "ElastigroupAwsClient": ("https://api.spotinst.io/aws/ec2/group", ("name",)),
+    "ElastigroupAzureV3Client": ("https://api.spotinst.io/azure/compute/group", ("name",)),
+    "ManagedInstanceAwsClient": ("https://api.spotinst.io/aws/ec2/managedInstance", ("config", "name")),
+    "StatefulNodeAzureClient": ("https://api.spotinst.io/azure/compute/statefulNode", ("name",)),
+    "OceanAwsClient": ("https://api.spotinst.io/ocean/aws/k8s/cluster", ("name",)),
+    "MrScalerAwsClient": ("https://api.spotinst.io/aws/emr/mrScaler", ("name",)),
+}
+
+
+def get_item_name(item, name_path):
+    value = item
+
+    for part in name_path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+
+    return value
+
+
+def make_item(resource_id, name, name_path):
+    item = dict(id=resource_id)
+    parent = item
+
+    for part in name_path[:-1]:
+        parent = parent.setdefault(part, dict())
+
+    parent[name_path[-1]] = name
+
+    return item
+
+
+def match_by_name(items, name, name_path, limit=None):
+    matches = []
+
+    for item in items:
+        if get_item_name(item, name_path) == name:
+            matches.append(item)
+
+            if limit is not None and len(matches) >= limit:
+                break
+
+    return matches
+
+
+def query_by_name(client, name, limit=None):
+    """
+    List resources with the name passed as a server-side filter.
+
+    Only the matching items are converted to the SDK's snake_case form; the rest of
+    the raw response is discarded without being walked. Returns None when the client
+    has no known list endpoint.
+    """
+    endpoint = LIST_ENDPOINT_BY_CLIENT_CLS.get(type(client).__name__)
+
+    if endpoint is None:
+        return None
+
+    url, name_path = endpoint
+    content = client.send_get(url=url, entity_name="resources by name", query_params=dict(name=name))
+    items = content["response"]["items"]
+
+    return [client.convert_json(item, client.camel_to_underscore)
+            for item in match_by_name(items, name, name_path, limit)]
+
+
+def find_resources_by_name(client, name, list_all, limit=None, name_cache=None):
+    """
+    Return the resources called ``name``, as the SDK's list call would return them.
+
+    Tries a filtered query first and stops scanning once ``limit`` matches are found.
+    If the filtered query is unavailable or rejected, falls back to ``list_all``, the
+    SDK call that lists every resource in the account.
+
+    With a ``name_cache``, the lookup is answered from the shared name -> ID index
+    instead, and the returned items only carry their ID and name.
+    """
+    endpoint = LIST_ENDPOINT_BY_CLIENT_CLS.get(type(client).__name__)
+    name_path = endpoint[1] if endpoint is not None else ("name",)
+
+    if name_cache is not None:
+        ids = name_cache.get_ids(name, list_all, name_path)
+        return [make_item(resource_id, name, name_path) for resource_id in ids[:limit]]
+
+    try:
+        matches = query_by_name(client, name, limit)
+    except (spotinst_client.SpotinstClientException, KeyError, TypeError, ValueError):
+        matches = None
+
+    if matches is None:
+        matches = match_by_name(list_all(), name, name_path, limit)
+
+    return matches
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import SDK_MISSING
+
+# Mask key of fields that are only sent when the resource is created.
+CREATE_ONLY = "<create>"
+
+_UNSET = object()
+
+
+def get_mask(option, create_only, do_not_update):
+    if option in create_only:
+        return CREATE_ONLY
+    if option in do_not_update:
+        return option
+    return None
+
+
+def compile_fields(fields, create_only=(), do_not_update=()):
+    """
+    Turn a field table into ``(option, attribute, mask)`` triples. Entries are
+    option names, or dicts with ``ansible_field_name`` and ``spotinst_field_name``
+    for options whose attribute is named differently. ``mask`` is the key that
+    drops the field from updates, if any.
+    """
+    compiled = []
+
+    for field in fields:
+        if isinstance(field, dict):
+            option, attribute = field['ansible_field_name'], field['spotinst_field_name']
+        else:
+            option, attribute = field, field
+
+        compiled.append((option, attribute, get_mask(option, create_only, do_not_update)))
+
+    return tuple(compiled)
+
+
+def join_path(path, attribute):
+    return attribute if not path else path + "." + attribute
+
+
+class ModelMapping(object):
+    """
+    Declares how a dict of options maps onto one SDK model class.
+
+    ``fields`` is a field table of options copied as they are when not None,
+    ``members`` the ``Nested`` and ``Each`` mappings of attributes that hold
+    other models, and ``constants`` attributes that are always set.
+    ``arguments`` names the options passed to classes whose constructor
+    requires them. When
+    ``required`` names attributes, the model is dropped unless one of them was
+    set. Fields and members whose option is in ``create_only`` are dropped from
+    updates, and those in ``do_not_update`` when the caller lists them.
+
+    The field table is compiled when the mapping is declared and the model
+    class is looked up on first use, so a conversion is a single walk that
+    only reads the options that are given and sets their attributes.
+    """
+
+    def __init__(self, cls_name, fields=(), members=(), constants=None, required=(), create_only=(),
+                 do_not_update=(), arguments=()):
+        self.cls_name = cls_name
+        self.arguments = tuple(arguments)
+        self.fields = compile_fields(fields, create_only, do_not_update)
+        self.members = tuple((member, get_mask(member.option or member.attribute, create_only, do_not_update))
+                             for member in members)
+        self.constants = tuple((constants or dict()).items())
+        self.required = tuple(required)
+        self.models = None
+        self.cls = None
+
+    def bind(self, models):
+        self.models = models
+
+        for member, mask in self.members:
+            member.mapping.bind(models)
+
+    def build(self, item, masked, path=None, assigned=None):
+        """
+        Return the model for the options in ``item``, or None if a required
+        attribute is missing. When ``assigned`` is a list, the paths of the
+        attributes set from options are appended to it.
+        """
+        if self.cls is None:
+            self.cls = getattr(self.models, self.cls_name)
+
+        if self.arguments:
+            obj = self.cls(**dict((argument, item.get(argument)) for argument in self.arguments))
+        else:
+            obj = self.cls()
+
+        recorded = 0 if assigned is None else len(assigned)
+
+        for option, attribute, mask in self.fields:
+            value = item.get(option)
+
+            if value is not None and (mask is None or mask not in masked):
+                setattr(obj, attribute, value)
+
+                if assigned is not None:
+                    assigned.append(join_path(path, attribute))
+
+        for member, mask in self.members:
+            if mask is None or mask not in masked:
+                member.apply(obj, item, masked, path, assigned)
+
+        if self.required and not any(is_set(obj, attribute) for attribute in self.required):
+            if assigned is not None:
+                del assigned[recorded:]
+
+            return None
+
+        for attribute, value in self.constants:
+            setattr(obj, attribute, value)
+
+        return obj
+
+
+class Nested(object):
+    """
+    Attribute ``attribute`` holds the model of option ``option``, a dict, or of
+    the same options as its parent when ``option`` is None. Options that are
+    None or empty leave the attribute as it is, or set it to ``default``.
+    """
+
+    def __init__(self, attribute, mapping, option=None, default=_UNSET):
+        self.attribute = attribute
+        self.mapping = mapping
+        self.option = option
+        self.default = default
+
+    def apply(self, obj, item, masked, path=None, assigned=None):
+        value = item if self.option is None else item.get(self.option)
+        model = None
+
+        if value:
+            if assigned is not None:
+                path = join_path(path, self.attribute)
+
+            model = self.mapping.build(value, masked, path, assigned)
+
+        if model is not None:
+            setattr(obj, self.attribute, model)
+        elif self.default is not _UNSET:
+            setattr(obj, self.attribute, self.default)
+
+
+class Each(object):
+    """
+    Attribute ``attribute`` holds a model per item of list option ``option``.
+    ``prepare`` turns items that are not dicts of options into one, or into
+    None to skip them. Several ``Each`` of one attribute add to the same list,
+    and an attribute whose list ends up empty is left as it is.
+    """
+
+    def __init__(self, attribute, mapping, option, prepare=None):
+        self.attribute = attribute
+        self.mapping = mapping
+        self.option = option
+        self.prepare = prepare
+
+    def apply(self, obj, item, masked, path=None, assigned=None):
+        values = item.get(self.option)
+
+        if not values:
+            return
+
+        build, prepare = self.mapping.build, self.prepare
+        models = []
+        offset = len(getattr(obj, self.attribute)) if is_set(obj, self.attribute) else 0
+
+        for value in values:
+            if prepare is not None:
+                value = prepare(value)
+
+            if value is None:
+                continue
+
+            if assigned is not None:
+                item_path = "{0}[{1}]".format(join_path(path, self.attribute), offset + len(models))
+                model = build(value, masked, item_path, assigned)
+            else:
+                model = build(value, masked)
+
+            if model is not None:
+                models.append(model)
+
+        if models:
+            if offset:
+                models = getattr(obj, self.attribute) + models
+
+            setattr(obj, self.attribute, models)
+
+
+def is_set(obj, attribute):
+    value = getattr(obj, attribute, None)
+    return value is not None and value != SDK_MISSING
+
+
+class MappingConverter(object):
+    """Builds the model of a whole resource from module options in one pass over a ``ModelMapping`` tree."""
+
+    def __init__(self, models, mapping):
+        self.mapping = mapping
+        mapping.bind(models)
+
+    def convert(self, params, is_update=False, do_not_update=(), assigned=None):
+        """
+        Build the model for ``params``. Updates drop the create-only fields and
+        the fields of the ``do_not_update`` options. When ``assigned`` is a list,
+        the dotted paths of the model attributes set from options, such as
+        ``compute.launch_specification.tags[0].tag_key``, are appended to it.
+        """
+        masked = frozenset(do_not_update or ()).union((CREATE_ONLY,)) if is_update else frozenset()
+
+        return self.mapping.build(params, masked, None, assigned)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+PRIMITIVE_TYPES = (bool, float, int, str)
+
+
+def to_pascal_case(snake_str):
+    return "".join(word.title() for word in snake_str.split("_"))
+
+
+class ModelNode(object):
+    """The model class of one option path, and the nodes of its sub-options by name."""
+
+    __slots__ = ("path", "cls_name", "cls", "children")
+
+    def __init__(self, path, cls_name):
+        self.path = path
+        self.cls_name = cls_name
+        self.cls = None
+        self.children = dict()
+
+
+class ModelConverter(object):
+    """
+    Turns the nested dicts and lists of a module option into SDK model objects.
+
+    Each dict becomes an instance of the model class named after its option in
+    PascalCase, unless ``cls_name_by_path`` maps the dotted path of the option
+    to another class name. List items use the class of the list's option.
+
+    Paths are resolved into a tree of ModelNode once, ahead of time from the
+    argument spec with ``compile()``, or on first use for dicts the spec does
+    not describe. A conversion is then a single walk over the content that
+    follows the tree, and the items of a list share one node and its class.
+    """
+
+    def __init__(self, models, cls_name_by_path=None):
+        self.models = models
+        self.cls_name_by_path = cls_name_by_path or dict()
+        self.roots = dict()
+
+    def get_node(self, parent, name):
+        children = self.roots if parent is None else parent.children
+        node = children.get(name)
+
+        if node is None:
+            path = name if parent is None else parent.path + "." + name
+            node = ModelNode(path, self.cls_name_by_path.get(path) or to_pascal_case(name))
+            children[name] = node
+
+        return node
+
+    def compile(self, name, options, parent=None):
+        """
+        Add the nodes of option ``name`` and of every sub-option in its argument
+        spec ``options``. Model classes are looked up when first instantiated, so
+        compiling does not import the SDK.
+        """
+        node = self.get_node(parent, name)
+
+        for key, spec in (options or dict()).items():
+            if spec.get("options"):
+                self.compile(key, spec["options"], node)
+
+        return node
+
+    def convert(self, content, name):
+        """Turn ``content``, the value of option ``name``, into SDK model objects."""
+        return self.convert_node(content, self.get_node(None, name))
+
+    def convert_node(self, content, node):
+        if content is None or isinstance(content, PRIMITIVE_TYPES):
+            return content
+
+        if isinstance(content, list):
+            return [self.convert_node(item, node) for item in content]
+
+        if not isinstance(content, dict):
+            return None
+
+        if node.cls is None:
+            node.cls = getattr(self.models, node.cls_name)
+
+        instance = node.cls()
+        children = node.children
+
+        for key, value in content.items():
+            if isinstance(value, (dict, list)):
+                value = self.convert_node(value, children.get(key) or self.get_node(node, key))
+            elif value is not None and not isinstance(value, PRIMITIVE_TYPES):
+                value = None
+
+            setattr(instance, key, value)
+
+        return instance
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import time
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import resolve_credentials
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_json_file import LockedJsonFile
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import get_item_name
+
+DEFAULT_TTL = 300
+
+name_cache_fields = dict(
+    path=dict(type='path', required=True),
+    ttl=dict(type='int', default=DEFAULT_TTL),
+)
+
+
+def get_name_cache(params, service):
+    """
+    Build the name cache configured by the ``name_cache`` module option, or return
+    None if the option is not set. Entries are scoped by service and credentials.
+    """
+    name_cache = params.get("name_cache")
+
+    if not name_cache or not name_cache.get("path"):
+        return None
+
+    ttl = name_cache.get("ttl")
+    if ttl is None:
+        ttl = DEFAULT_TTL
+
+    return NameCache(path=name_cache["path"], ttl=ttl, scope=get_cache_scope(params, service))
+
+
+def get_cache_scope(params, service):
+    """
+    Return the key under which a cache file keeps the entries of ``service`` for
+    the account and token in ``params``. The token itself is not written.
+    """
+    token, account = resolve_credentials(params)
+    token_digest = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+
+    return "{0}/{1}/{2}".format(service, account or "", token_digest)
+
+
+class NameCache(object):
+    """
+    A name -> IDs index persisted in a local JSON file.
+
+    The file is shared by every module process on the control node. Each read or
+    write holds an exclusive lock on the file, and a refresh lists the account
+    while still holding the lock. Concurrent tasks therefore wait for
+    that one listing instead of each fetching the account themselves.
+    """
+
+    def __init__(self, path, ttl, scope):
+        self.store = LockedJsonFile(path)
+        self.path = self.store.path
+        self.ttl = ttl
+        self.scope = scope
+
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def get_ids(self, name, list_all, name_path):
+        """
+        Return the IDs of resources called ``name``. The whole index is rebuilt
+        with ``list_all`` when this scope is missing or older than the TTL.
+        """
+        with self.store.locked():
+            content = self.store.read()
+            entry = content.get(self.scope)
+
+            if not self.is_fresh(entry):
+                entry = dict(fetched_at=time.time(), ids_by_name=build_index(list_all(), name_path))
+                content[self.scope] = entry
+                self.store.write(content)
+
+        return list(entry["ids_by_name"].get(name, []))
+
+    def record_created(self, name, resource_id):
+        with self.store.locked():
+            content = self.store.read()
+            entry = content.get(self.scope)
+
+            if entry is not None:
+                add_id(entry["ids_by_name"], name, resource_id)
+                self.store.write(content)
+
+    def record_deleted(self, resource_id):
+        with self.store.locked():
+            content = self.store.read()
+            entry = content.get(self.scope)
+
+            if entry is not None:
+                remove_id(entry["ids_by_name"], resource_id)
+                self.store.write(content)
+
+    def record_renamed(self, name, resource_id):
+        """Move ``resource_id`` from whichever name it was indexed under to ``name``."""
+        with self.store.locked():
+            content = self.store.read()
+            entry = content.get(self.scope)
+
+            if entry is not None:
+                remove_id(entry["ids_by_name"], resource_id)
+                add_id(entry["ids_by_name"], name, resource_id)
+                self.store.write(content)
+
+
+def add_id(ids_by_name, name, resource_id):
+    ids = ids_by_name.setdefault(name, [])
+
+    if resource_id not in ids:
+        ids.append(resource_id)
+
+
+def remove_id(ids_by_name, resource_id):
+    for name in list(ids_by_name):
+        if resource_id in ids_by_name[name]:
+            ids_by_name[name].remove(resource_id)
+
+            if not ids_by_name[name]:
+                del ids_by_name[name]
+
+
+def build_index(items, name_path):
+    ids_by_name = dict()
+
+    for item in items:
+        name = get_item_name(item, name_path)
+
+        if name is not None:
+            ids_by_name.setdefault(name, []).append(item.get("id"))
+
+    return ids_by_name
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+# The SDK has no calls for a cluster's instances or launch specs, so they are sent
+# through the client's own request helpers, which add the account and credentials.
+OCEAN_CLUSTER_URL = "https://api.spotinst.io/ocean/aws/k8s/cluster"
+OCEAN_LAUNCH_SPEC_URL = "https://api.spotinst.io/ocean/aws/k8s/launchSpec"
+
+
+def send_get_items(client, url, entity_name, query_params=None):
+    content = client.send_get(url=url, entity_name=entity_name, query_params=query_params)
+
+    return client.convert_json(content, client.camel_to_underscore)["response"]["items"]
+
+
+def get_cluster_instances(client, ocean_id):
+    return send_get_items(client, OCEAN_CLUSTER_URL + "/" + ocean_id + "/instances", "ocean instances")
+
+
+def get_cluster_launch_specs(client, ocean_id):
+    return send_get_items(client, OCEAN_LAUNCH_SPEC_URL, "ocean launch specs", dict(oceanId=ocean_id))
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_json_file import LockedJsonFile
+
+DEFAULT_ACCOUNT_KEY = "default"
+
+rate_limit_fields = dict(
+    path=dict(type='path', required=True),
+    rate=dict(type='float', required=True),
+    burst=dict(type='int'),
+)
+
+_lock = threading.Lock()
+_limiter = None
+
+
+class TokenBucket(object):
+    """
+    A token bucket per Spot account, kept in a locked JSON file so that every
+    module process and thread on the control node draws from the same buckets.
+
+    Each request takes one token; tokens refill at ``rate`` per second up to
+    ``burst``. A request that finds the bucket empty still takes its token,
+    driving the balance negative, and sleeps until that token is due. Waiting
+    requests are therefore spaced ``1 / rate`` apart in arrival order instead
+    of all retrying at once.
+    """
+
+    def __init__(self, path, rate, burst=None, sleep=time.sleep, clock=time.time):
+        self.store = LockedJsonFile(path)
+        self.rate = float(rate)
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self.sleep = sleep
+        self.clock = clock
+        self.waited = 0.0
+
+    def reserve(self, account):
+        """Take a token for ``account`` and return the seconds to wait before using it."""
+        key = account or DEFAULT_ACCOUNT_KEY
+
+        with self.store.locked():
+            content = self.store.read()
+            now = self.clock()
+            bucket = content.get(key) or dict(tokens=self.burst, updated_at=now)
+
+            elapsed = max(0.0, now - bucket["updated_at"])
+            tokens = min(float(self.burst), bucket["tokens"] + elapsed * self.rate) - 1
+
+            content[key] = dict(tokens=tokens, updated_at=now)
+            self.store.write(content)
+
+        return -tokens / self.rate if tokens < 0 else 0.0
+
+    def acquire(self, account):
+        delay = self.reserve(account)
+
+        if delay > 0:
+            self.waited += delay
+            self.sleep(delay)
+
+        return delay
+
+
+def configure_rate_limit(params):
+    """
+    Enable the rate limiter described by the ``rate_limit`` module option for
+    this process, or leave it disabled if the option is not set.
+    """
+    global _limiter
+
+    rate_limit = params.get("rate_limit")
+
+    if not rate_limit or not rate_limit.get("path") or not rate_limit.get("rate"):
+        return
+
+    with _lock:
+        if _limiter is None or (_limiter.store.path, _limiter.rate) != (rate_limit["path"], rate_limit["rate"]):
+            _limiter = TokenBucket(rate_limit["path"], rate_limit["rate"], rate_limit.get("burst"))
+
+
+def acquire_rate_limit(account):
+    limiter = _limiter
+
+    if limiter is not None:
+        limiter.acquire(account)
+
+
+def reset_rate_limit():
+    global _limiter
+
+    with _lock:
+        _limiter = None
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import requests
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 20.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+# Total seconds a process may spend waiting between retries, across all calls.
+DEFAULT_BUDGET = 120.0
+
+# Reads, updates of a resource's configuration and deletes can be repeated.
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+# The API also starts actions with PUT, on URLs ending in one of these path
+# segments (rolls, scaling, pausing, recycling and so on). Repeating them would
+# run the action twice, so they are retried like creates.
+ACTION_PATH_SEGMENTS = frozenset((
+    "roll", "recycle", "pause", "resume", "state", "suspend", "up", "down", "stop", "start", "finish",
+    "reimport", "attach", "detach", "detachVms", "detachInstances", "deallocate",
+))
+# Statuses where the request was most likely not applied, or is safe to repeat.
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+# A non idempotent request is only retried when the API rejected it before handling it.
+RETRYABLE_WRITE_STATUSES = (429,)
+
+
+def parse_retry_after(value, now=None):
+    """
+    Return the delay in seconds requested by a ``Retry-After`` header, given
+    either as seconds or as an HTTP date, or None if it cannot be parsed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parsed = parsedate_tz(value)
+
+    if parsed is None:
+        return None
+
+    return max(0.0, mktime_tz(parsed) - (now if now is not None else time.time()))
+
+
+def is_idempotent(method, url=None):
+    """Whether a request with ``method`` to ``url`` can be repeated without side effects."""
+    if method not in IDEMPOTENT_METHODS:
+        return False
+
+    if method == "PUT" and url:
+        path = urlparse(url).path.rstrip("/")
+        return path.rsplit("/", 1)[-1] not in ACTION_PATH_SEGMENTS
+
+    return True
+
+
+class RetryPolicy(object):
+    """
+    Retries Spot API calls that failed on rate limiting or transient errors.
+
+    Idempotent requests are retried on 429, 5xx and connection errors. Other
+    requests (creates, sent as POST, and actions, sent as POST or as PUT to an
+    action URL) are only retried on 429 or when the connection could not be
+    opened, since the API did not handle them.
+    The wait honors ``Retry-After`` and otherwise grows exponentially with full
+    jitter. All waits in the process draw from one shared budget, after which
+    the last response or error is passed on unchanged.
+    """
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 max_retry_after=DEFAULT_MAX_RETRY_AFTER, budget=DEFAULT_BUDGET, sleep=time.sleep):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.waited = 0.0
+            self.by_reason = dict()
+
+    def stats(self):
+        with self._lock:
+            return dict(count=self.count, waited=round(self.waited, 3), by_reason=dict(self.by_reason))
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def should_retry_status(self, method, status_code, url=None):
+        if is_idempotent(method, url):
+            return status_code in RETRYABLE_STATUSES
+
+        return status_code in RETRYABLE_WRITE_STATUSES
+
+    def should_retry_error(self, method, exc, url=None):
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+
+        if is_idempotent(method, url):
+            return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+        return False
+
+    def reserve(self, delay, reason):
+        with self._lock:
+            if self.waited + delay > self.budget:
+                return False
+
+            self.count += 1
+            self.waited += delay
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+        return True
+
+    def call(self, method, send, url=None):
+        """
+        Call ``send()``, which performs one HTTP request with ``method`` to
+        ``url`` and returns its response, retrying as described above.
+        """
+        method = method.upper()
+        attempt = 0
+
+        while True:
+            try:
+                response = send()
+            except requests.exceptions.RequestException as exc:
+                if attempt >= self.max_retries or not self.should_retry_error(method, exc, url):
+                    raise
+
+                delay = self.backoff(attempt)
+                if not self.reserve(delay, type(exc).__name__):
+                    raise
+            else:
+                if attempt >= self.max_retries or not self.should_retry_status(method, response.status_code, url):
+                    return response
+
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.backoff(attempt)
+                delay = min(delay, self.max_retry_after)
+
+                if not self.reserve(delay, str(response.status_code)):
+                    return response
+
+            self.sleep(delay)
+            attempt += 1
+
+
+_policy = RetryPolicy()
+
+
+def get_retry_policy():
+    return _policy
+
+
+def get_retry_stats():
+    """
+    Return how many API calls were retried in this process, the total time spent
+    waiting, and the count per status code or error.
+    """
+    return _policy.stats()
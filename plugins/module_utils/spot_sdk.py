@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+
+try:
+    from importlib.util import find_spec
+except ImportError:
+    find_spec = None
+
+
+def is_installed(name):
+    """Whether the top-level package ``name`` can be imported, without importing it."""
+    if find_spec is not None:
+        return find_spec(name) is not None
+
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+
+    return True
+
+
+HAS_SPOTINST_SDK = is_installed("spotinst_sdk2")
+HAS_REQUESTS = is_installed("requests")
+
+
+class LazyModule(object):
+    """
+    Stand-in for a module that is imported the first time one of its attributes
+    is read.
+
+    Importing the SDK pulls in ``requests``, ``yaml`` and the models and clients
+    of every Spot service, which takes longer than validating the arguments and
+    building most requests. Modules reference the SDK through these stand-ins, so
+    that runs that fail on their arguments, or never reach the API, skip it.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+
+        return self._module
+
+    def __getattr__(self, name):
+        if name in ("_name", "_module"):
+            raise AttributeError(name)
+
+        return getattr(self.load(), name)
+
+
+def sdk_models(service):
+    """Deferred ``spotinst_sdk2.models.<service>`` package, such as ``elastigroup.aws``."""
+    return LazyModule("spotinst_sdk2.models." + service)
+
+
+spotinst = LazyModule("spotinst_sdk2")
+spotinst_client = LazyModule("spotinst_sdk2.client")
+requests = LazyModule("requests")
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import time
+
+DEFAULT_INITIAL_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 30.0
+DEFAULT_BACKOFF = 2.0
+DEFAULT_JITTER = 0.2
+
+waiter_fields = dict(
+    initial_interval=dict(type='float', default=DEFAULT_INITIAL_INTERVAL),
+    max_interval=dict(type='float', default=DEFAULT_MAX_INTERVAL),
+    backoff=dict(type='float', default=DEFAULT_BACKOFF),
+    jitter=dict(type='float', default=DEFAULT_JITTER),
+)
+
+
+def get_waiter(params, option="wait_config"):
+    """
+    Build a Waiter from a module option holding ``waiter_fields`` suboptions,
+    falling back to the defaults for anything not set.
+    """
+    config = params.get(option) or dict()
+    kwargs = dict((key, config[key]) for key in waiter_fields if config.get(key) is not None)
+
+    return Waiter(**kwargs)
+
+
+class WaitResult(object):
+
+    def __init__(self, done, value, elapsed, polls):
+        self.done = done
+        self.value = value
+        self.elapsed = elapsed
+        self.polls = polls
+
+    def to_dict(self):
+        return dict(done=self.done, elapsed=round(self.elapsed, 3), polls=self.polls)
+
+
+class Waiter(object):
+    """
+    Polls until a condition holds or a timeout passes.
+
+    The first poll is immediate and the waiter returns as soon as a poll
+    satisfies the condition. Between polls it sleeps ``initial_interval``
+    seconds, multiplied by ``backoff`` after each poll up to ``max_interval``,
+    and spread by +/- ``jitter`` (a fraction of the interval) so that
+    concurrent waiters do not poll in lockstep. The last sleep is cut short so
+    that one final poll happens right at the timeout.
+    """
+
+    def __init__(self, initial_interval=DEFAULT_INITIAL_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL,
+                 backoff=DEFAULT_BACKOFF, jitter=DEFAULT_JITTER, sleep=time.sleep, clock=time.time):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.sleep = sleep
+        self.clock = clock
+
+    def intervals(self):
+        interval = self.initial_interval
+
+        while True:
+            spread = interval * self.jitter
+            yield max(0.0, min(self.max_interval, interval + random.uniform(-spread, spread)))
+            interval = min(self.max_interval, interval * self.backoff)
+
+    def wait(self, poll, is_done, timeout):
+        """
+        Call ``poll()`` until ``is_done(value)`` is true for its return value, or
+        ``timeout`` seconds have passed. Returns a WaitResult with the last polled
+        value and the timing of every poll.
+        """
+        started_at = self.clock()
+        deadline = started_at + timeout
+        polls = list()
+        intervals = self.intervals()
+
+        while True:
+            poll_started_at = self.clock()
+            value = poll()
+            poll_ended_at = self.clock()
+            done = bool(is_done(value))
+
+            polls.append(dict(
+                offset=round(poll_started_at - started_at, 3),
+                duration=round(poll_ended_at - poll_started_at, 3),
+                done=done))
+
+            remaining = deadline - poll_ended_at
+
+            if done or remaining <= 0:
+                return WaitResult(done, value, poll_ended_at - started_at, polls)
+
+            self.sleep(min(next(intervals), remaining))
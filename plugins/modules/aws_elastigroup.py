@@ -41,6 +41,28 @@ options:
     description:
       - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
 
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
   state:
     type: str
     choices:
@@ -362,6 +384,24 @@ options:
       - Unique name for elastigroup to be created, updated or deleted
     required: true
 
+  name_cache:
+    type: dict
+    description:
+      - Optional on-disk cache of the account's group name to ID index, shared by the tasks of a run.
+      - When set, resolving a group by name lists the account once per I(ttl) instead of once per task.
+      - The cache is updated when this module creates or deletes a group.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the cache file on the control node. A C(<path>.lock) file is created next to it.
+      ttl:
+        type: int
+        default: 300
+        description:
+          - Seconds after which the cached index is fetched again.
+
   network_interfaces:
     type: list
     description:
@@ -704,11 +744,53 @@ options:
       - In case of any available Reserved Instances,
          Elastigroup will utilize your reservations before purchasing Spot instances.
 
+  wait_config:
+    type: dict
+    description:
+      - Polling behaviour while waiting for instances or for a roll. The first poll is immediate and the wait ends
+        as soon as enough instances are up, or the roll has ended.;
+        Only works if wait_for_instances or wait_for_roll is True.
+    suboptions:
+      initial_interval:
+        type: float
+        default: 2
+        description:
+          - Seconds to wait after the first poll.
+      max_interval:
+        type: float
+        default: 30
+        description:
+          - Upper bound in seconds for the wait between polls.
+      backoff:
+        type: float
+        default: 2
+        description:
+          - Factor the wait between polls grows by after each poll.
+      jitter:
+        type: float
+        default: 0.2
+        description:
+          - Random spread applied to each wait, as a fraction of it.
+
   wait_for_instances:
     type: bool
     description:
       - Whether or not the elastigroup creation / update actions should wait for the instances to spin
 
+  wait_for_roll:
+    type: bool
+    default: false
+    description:
+      - Whether or not to wait, after an update that started a roll with roll_config, until the roll ends.;
+        The deployment status is polled as set by wait_config, and the task fails unless the roll finishes.
+
+  wait_for_roll_timeout:
+    type: int
+    default: 1800
+    description:
+      - How long in seconds to wait for the roll before failing the action.;
+        Only works if wait_for_roll is True.
+
   wait_timeout:
     type: int
     description:
@@ -989,1195 +1071,102 @@ instances:
             "status": "fulfilled"
         }
     ]
+roll:
+    description:
+      - The roll started after the update. With wait_for_roll, also its final status and when each batch was
+        first seen running and ended, in seconds from the start of the wait.
+    returned: when roll_config is set and the group was updated
+    type: dict
+    sample: {
+        "id": "sbgd-c47a527a",
+        "status": "FINISHED",
+        "progress": {"unit": "percent", "value": 100},
+        "num_of_batches": 2,
+        "batches": [
+            {"batch": 1, "started_at": 0.312, "ended_at": 241.522, "duration": 241.21},
+            {"batch": 2, "started_at": 241.522, "ended_at": 470.105, "duration": 228.583}
+        ],
+        "wait": {"done": true, "elapsed": 470.105, "polls": []}
+    }
 group_id:
     description: Created / Updated group's ID.
     returned: success
     type: str
     sample: "sig-12345"
+wait:
+    description:
+      - Outcome and per-poll timing of the wait for instances.
+      - C(instances) tells, in seconds from the start of the wait, when each instance was first seen and first
+        became healthy, and C(events) lists every change of the instances as it was polled.
+    returned: when wait_for_instances is True
+    type: dict
+    sample: {
+        "done": true,
+        "elapsed": 6.412,
+        "polls": [
+            {"offset": 0.0, "duration": 0.321, "done": false},
+            {"offset": 2.154, "duration": 0.298, "done": false},
+            {"offset": 6.114, "duration": 0.298, "done": true}
+        ],
+        "instances": [
+            {"instance_id": "i-09640ad8678234c", "seen_at": 0.321, "healthy_at": 6.412, "time_to_healthy": 6.091}
+        ],
+        "events": [
+            {"instance_id": "i-09640ad8678234c", "event": "seen", "offset": 0.321},
+            {"instance_id": "i-09640ad8678234c", "event": "healthy", "offset": 6.412}
+        ]
+    }
 
 '''
 
-HAS_SPOTINST_SDK = False
-
-
-import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.basic import env_fallback
-
-try:
-    import spotinst_sdk2 as spotinst
-    from spotinst_sdk2 import SpotinstSession
-    from spotinst_sdk2.client import SpotinstClientException
-
-    HAS_SPOTINST_SDK = True
-
-except ImportError:
-    pass
-
-eni_fields = ('description',
-              'device_index',
-              'secondary_private_ip_address_count',
-              'associate_public_ip_address',
-              'delete_on_termination',
-              'groups',
-              'network_interface_id',
-              'private_ip_address',
-              'subnet_id',
-              'associate_ipv6_address')
-
-private_ip_fields = ('private_ip_address',
-                     'primary')
-
-capacity_fields = (dict(ansible_field_name='min_size',
-                        spotinst_field_name='minimum'),
-                   dict(ansible_field_name='max_size',
-                        spotinst_field_name='maximum'),
-                   'target',
-                   'unit')
-
-lspec_fields = ('user_data',
-                'key_pair',
-                'tenancy',
-                'shutdown_script',
-                'monitoring',
-                'ebs_optimized',
-                'image_id',
-                'health_check_type',
-                'health_check_grace_period',
-                'health_check_unhealthy_duration_before_replacement',
-                'security_group_ids')
-
-iam_fields = (dict(ansible_field_name='iam_role_name',
-                   spotinst_field_name='name'),
-              dict(ansible_field_name='iam_role_arn',
-                   spotinst_field_name='arn'))
-
-scheduled_task_fields = ('adjustment',
-                         'adjustment_percentage',
-                         'batch_size_percentage',
-                         'cron_expression',
-                         'frequency',
-                         'grace_period',
-                         'task_type',
-                         'is_enabled',
-                         'scale_target_capacity',
-                         'scale_min_capacity',
-                         'scale_max_capacity')
-
-scaling_policy_fields = ('policy_name',
-                         'namespace',
-                         'metric_name',
-                         'dimensions',
-                         'statistic',
-                         'evaluation_periods',
-                         'period',
-                         'threshold',
-                         'cooldown',
-                         'unit',
-                         'operator',
-                         'shouldResumeStateful')
-
-tracking_policy_fields = ('policy_name',
-                          'namespace',
-                          'source',
-                          'metric_name',
-                          'statistic',
-                          'unit',
-                          'cooldown',
-                          'target',
-                          'threshold')
-
-action_fields = (dict(ansible_field_name='action_type',
-                      spotinst_field_name='type'),
-                 'adjustment',
-                 'min_target_capacity',
-                 'max_target_capacity',
-                 'target',
-                 'minimum',
-                 'maximum')
-
-signal_fields = ('name',
-                 'timeout')
-
-multai_lb_fields = ('balancer_id',
-                    'project_id',
-                    'target_set_id',
-                    'az_awareness',
-                    'auto_weight')
-
-persistence_fields = ('should_persist_root_device',
-                      'should_persist_block_devices',
-                      'should_persist_private_ip',
-                      'block_devices_mode')
-
-revert_to_spot_fields = ('perform_at',
-                         'time_windows')
-
-elastic_beanstalk_platform_update_fields = ('perform_at',
-                                            'time_window',
-                                            'update_level')
-
-elastic_beanstalk_managed_actions_fields = ('platform_update')
-
-strategy_fields = ('risk',
-                   'utilize_reserved_instances',
-                   'fallback_to_od',
-                   'on_demand_count',
-                   'availability_vs_cost',
-                   'draining_timeout',
-                   'spin_up_time',
-                   'lifetime_period',
-                   'revert_to_spot')
-
-ebs_fields = ('delete_on_termination',
-              'encrypted',
-              'iops',
-              'snapshot_id',
-              'volume_type',
-              'volume_size')
-
-bdm_fields = ('device_name',
-              'virtual_name',
-              'no_device')
-
-
-kubernetes_fields = ('api_server',
-                     'token',
-                     'integration_mode',
-                     'cluster_identifier')
-
-kubernetes_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
-
-kubernetes_headroom_fields = (
-    'cpu_per_unit',
-    'memory_per_unit',
-    'num_of_units')
-
-kubernetes_labels_fields = ('key', 'value')
-
-kubernetes_down_fields = ('evaluation_periods')
-
-nomad_fields = ('master_host', 'master_port', 'acl_token')
-
-nomad_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
-
-nomad_headroom_fields = ('cpu_per_unit', 'memory_per_unit', 'num_of_units')
-
-nomad_constraints_fields = ('key', 'value')
-
-nomad_down_fields = ('evaluation_periods')
-
-docker_swarm_fields = ('master_host', 'master_port')
-
-docker_swarm_auto_scale_fields = ('is_enabled', 'cooldown')
-
-docker_swarm_headroom_fields = (
-    'cpu_per_unit',
-    'memory_per_unit',
-    'num_of_units')
-
-docker_swarm_down_fields = ('evaluation_periods')
-
-route53_domain_fields = ('hosted_zone_id',)
-
-route53_record_set_fields = ('name', 'use_public_ip')
-
-mlb_runtime_fields = ('deployment_id',)
-
-mlb_load_balancers_fields = (
-    'type',
-    'target_set_id',
-    'balancer_id',
-    'auto_weight',
-    'az_awareness')
-
-elastic_beanstalk_fields = ('environment_id',)
-
-elastic_beanstalk_deployment_fields = ('automatic_roll',
-                                       'batch_size_percentage',
-                                       'grace_period')
-
-elastic_beanstalk_strategy_fields = ('action', 'should_drain_instances')
-
-stateful_deallocation_fields = (
-    dict(
-        ansible_field_name='stateful_deallocation_should_delete_images',
-        spotinst_field_name='should_delete_images'),
-    dict(
-        ansible_field_name='stateful_deallocation_should_delete_snapshots',
-        spotinst_field_name='should_delete_snapshots'),
-    dict(
-        ansible_field_name='stateful_deallocation_should_delete_network_interfaces',
-        spotinst_field_name='should_delete_network_interfaces'),
-    dict(
-        ansible_field_name='stateful_deallocation_should_delete_volumes',
-        spotinst_field_name='should_delete_volumes'))
-
-code_deploy_fields = ('clean_up_on_failure', 'terminate_instance_on_failure')
-
-code_deploy_deployment_fields = ('application_name', 'deployment_group_name')
-
-right_scale_fields = ('account_id',
-                      'refresh_token')
-
-rancher_fields = ('access_key',
-                  'secret_key',
-                  'master_host',
-                  'version')
-
-chef_fields = ('chef_server',
-               'organization',
-               'user',
-               'pem_key',
-               'chef_version')
-
-az_fields = ('name',
-             'subnet_id',
-             'subnet_ids',
-             'placement_group_name')
-
-opsworks_fields = ('layer_id',)
-
-scaling_strategy_fields = ('terminate_at_end_of_billing_hour',)
-
-mesosphere_fields = ('api_server',)
-
-ecs_fields = ('cluster_name',)
-
-ecs_auto_scale_fields = ('is_enabled', 'is_auto_config', 'cooldown')
-
-ecs_headroom_fields = ('cpu_per_unit', 'memory_per_unit', 'num_of_units')
-
-ecs_attributes_fields = ('key', 'value')
-
-ecs_down_fields = ('evaluation_periods')
-
-multai_fields = ('multai_token')
-
-
-def handle_elastigroup(client, module):
-    has_changed = False
-    should_create = False
-    group_id = None
-    message = 'None'
-
-    name = module.params.get('name')
-    state = module.params.get('state')
-    uniqueness_by = module.params.get('uniqueness_by')
-    external_group_id = module.params.get('id')
-
-    if uniqueness_by == 'id':
-        if external_group_id is None:
-            should_create = True
-        else:
-            should_create = False
-            group_id = external_group_id
-    else:
-        groups = client.get_elastigroups()
-        should_create, group_id = find_group_with_same_name(groups, name)
-
-    if should_create is True:
-        if state == 'present':
-            eg = expand_elastigroup(module, is_update=False)
-            module.debug(str(" [INFO] " + message + "\n"))
-            group = client.create_elastigroup(group=eg)
-            group_id = group['id']
-            message = 'Created group Successfully.'
-            has_changed = True
-
-        elif state == 'absent':
-            message = 'Cannot delete non-existent group.'
-            has_changed = False
-    else:
-        eg = expand_elastigroup(module, is_update=True)
-        auto_apply_tags = module.params.get('auto_apply_tags')
-
-        if state == 'present':
-            group = client.update_elastigroup(group_update=eg, group_id=group_id, auto_apply_tags=auto_apply_tags)
-            message = 'Updated group successfully.'
-
-            try:
-                roll_config = module.params.get('roll_config')
-                if roll_config:
-                    eg_roll = spotinst.models.elastigroup.aws.Roll(
-                        batch_size_percentage=roll_config.get('batch_size_percentage'),
-                        grace_period=roll_config.get('grace_period'),
-                        health_check_type=roll_config.get('health_check_type')
-                    )
-                    roll_response = client.roll_group(group_roll=eg_roll, group_id=group_id)
-                    message = 'Updated and started rolling the group successfully.'
-
-            except SpotinstClientException as exc:
-                message = 'Updated group successfully, but failed to perform roll. Error:' + str(exc)
-            has_changed = True
-
-        elif state == 'absent':
-            try:
-                stfl_dealloc_request = expand_fields(
-                    stateful_deallocation_fields,
-                    module.params, 'StatefulDeallocation')
-                if stfl_dealloc_request. \
-                        should_delete_network_interfaces is True or \
-                        stfl_dealloc_request.should_delete_images is True or \
-                        stfl_dealloc_request.should_delete_volumes is True or \
-                        stfl_dealloc_request.should_delete_snapshots is True:
-                    client.delete_elastigroup_with_deallocation(
-                        group_id=group_id,
-                        stateful_deallocation=stfl_dealloc_request)
-                else:
-                    client.delete_elastigroup(group_id=group_id)
-            except SpotinstClientException as exc:
-                if "GROUP_DOESNT_EXIST" in exc.message:
-                    pass
-                else:
-                    module.fail_json(
-                        msg="Error while attempting to delete group :"
-                            " " + exc.message)
-
-            message = 'Deleted group successfully.'
-            has_changed = True
-
-    return group_id, message, has_changed
-
-
-def retrieve_group_instances(client, module, group_id):
-    wait_timeout = module.params.get('wait_timeout')
-    wait_for_instances = module.params.get('wait_for_instances')
-
-    health_check_type = module.params.get('health_check_type')
-
-    if wait_timeout is None:
-        wait_timeout = 300
-
-    wait_timeout = time.time() + wait_timeout
-    target = module.params.get('target')
-    state = module.params.get('state')
-    instances = list()
-
-    if state == 'present' and group_id is not None and wait_for_instances is True:
-
-        is_amount_fulfilled = False
-        while is_amount_fulfilled is False and wait_timeout > time.time():
-            instances = list()
-            amount_of_fulfilled_instances = 0
-
-            if health_check_type is not None:
-                healthy_instances = client.get_instance_healthiness(group_id=group_id)
-
-                for healthy_instance in healthy_instances:
-                    if(healthy_instance.get('healthStatus') == 'HEALTHY'):
-                        amount_of_fulfilled_instances += 1
-                        instances.append(healthy_instance)
-
-            else:
-                active_instances = client.get_elastigroup_active_instances(group_id=group_id)
-
-                for active_instance in active_instances:
-                    if active_instance.get('private_ip') is not None:
-                        amount_of_fulfilled_instances += 1
-                        instances.append(active_instance)
-
-            if amount_of_fulfilled_instances >= target:
-                is_amount_fulfilled = True
-
-            time.sleep(10)
-
-    return instances
-
-
-def find_group_with_same_name(groups, name):
-    for group in groups:
-        if group['name'] == name:
-            return False, group.get('id')
-
-    return True, None
-
-
-def expand_elastigroup(module, is_update):
-    do_not_update = module.params.get('do_not_update') or []
-    name = module.params.get('name')
-
-    eg = spotinst.models.elastigroup.aws.Elastigroup()
-    description = module.params.get('description')
-
-    if name is not None:
-        eg.name = name
-    if description is not None:
-        eg.description = description
-
-    # Capacity
-    expand_capacity(eg, module, is_update, do_not_update)
-    # Strategy
-    expand_strategy(eg, module)
-    # Scaling
-    expand_scaling(eg, module)
-    # Third party integrations
-    expand_integrations(eg, module)
-    # Compute
-    expand_compute(eg, module, is_update, do_not_update)
-    # Multai
-    expand_multai(eg, module)
-    # Scheduling
-    expand_scheduled_tasks(eg, module)
-
-    return eg
-
-
-def expand_compute(eg, module, is_update, do_not_update):
-    elastic_ips = module.params.get('elastic_ips')
-    on_demand_instance_type = module.params.get('on_demand_instance_type')
-    spot_instance_types = module.params.get('spot_instance_types')
-    ebs_volume_pool = module.params.get('ebs_volume_pool')
-    availability_zones_list = module.params.get('availability_zones')
-    private_ips = module.params.get('private_ips')
-    product = module.params.get('product')
-    preferred_spot_instance_types = module.params.get(
-        'preferred_spot_instance_types')
-
-    eg_compute = spotinst.models.elastigroup.aws.Compute()
-
-    if product is not None:
-        # Only put product on group creation
-        if is_update is not True:
-            eg_compute.product = product
-
-    if elastic_ips is not None:
-        eg_compute.elastic_ips = elastic_ips
-
-    if private_ips:
-        eg_compute.private_ips = private_ips
-
-    if on_demand_instance_type is not None or spot_instance_types is not None or preferred_spot_instance_types is not None:
-        eg_instance_types = spotinst.models.elastigroup.aws.InstanceTypes()
-
-        if on_demand_instance_type is not None:
-            eg_instance_types.spot = spot_instance_types
-        if spot_instance_types is not None:
-            eg_instance_types.ondemand = on_demand_instance_type
-        if preferred_spot_instance_types is not None:
-            eg_instance_types.preferred_spot = preferred_spot_instance_types
-
-        if eg_instance_types.spot is not None or eg_instance_types.ondemand is not None:
-            eg_compute.instance_types = eg_instance_types
-
-    expand_ebs_volume_pool(eg_compute, ebs_volume_pool)
-
-    eg_compute.availability_zones = expand_list(availability_zones_list, az_fields, 'AvailabilityZone')
-
-    expand_launch_spec(eg_compute, module, is_update, do_not_update)
-
-    eg.compute = eg_compute
-
-
-def expand_ebs_volume_pool(eg_compute, ebs_volumes_list):
-    if ebs_volumes_list is not None:
-        eg_volumes = []
-
-        for volume in ebs_volumes_list:
-            eg_volume = spotinst.models.elastigroup.aws.EbsVolume()
-
-            if volume.get('device_name') is not None:
-                eg_volume.device_name = volume.get('device_name')
-            if volume.get('volume_ids') is not None:
-                eg_volume.volume_ids = volume.get('volume_ids')
-
-            if eg_volume.device_name is not None:
-                eg_volumes.append(eg_volume)
-
-        if len(eg_volumes) > 0:
-            eg_compute.ebs_volume_pool = eg_volumes
-
-
-def expand_launch_spec(eg_compute, module, is_update, do_not_update):
-    eg_launch_spec = expand_fields(lspec_fields, module.params, 'LaunchSpecification')
-
-    if module.params.get('iam_role_arn') is not None or module.params.get('iam_role_name') is not None:
-        eg_launch_spec.iam_role = expand_fields(iam_fields, module.params, 'IamRole')
-
-    tags = module.params.get('tags')
-    load_balancers = module.params.get('load_balancers')
-    mlb_load_balancers = module.params.get('mlb_load_balancers')
-    target_group_arns = module.params.get('target_group_arns')
-    block_device_mappings = module.params.get('block_device_mappings')
-    network_interfaces = module.params.get('network_interfaces')
-    credit_specification = module.params.get('credit_specification')
-
-    if is_update is True:
-        if 'image_id' in do_not_update:
-            delattr(eg_launch_spec, 'image_id')
-
-    expand_tags(eg_launch_spec, tags)
-
-    expand_load_balancers(eg_launch_spec, load_balancers, target_group_arns, mlb_load_balancers)
-
-    expand_block_device_mappings(eg_launch_spec, block_device_mappings)
-
-    expand_network_interfaces(eg_launch_spec, network_interfaces)
-
-    expand_credit_specification(eg_launch_spec, credit_specification)
-
-    eg_compute.launch_specification = eg_launch_spec
-
-
-def expand_credit_specification(eg_launch_spec, credit_specification):
-    eg_credit_specification = None
-
-    if credit_specification is not None:
-        eg_credit_specification = spotinst.models.elastigroup.aws.CreditSpecification()
-        cpu_credits = credit_specification.get('cpu_credits')
-
-        if cpu_credits is not None:
-            eg_credit_specification.cpu_credits = cpu_credits
-
-    eg_launch_spec.credit_specification = eg_credit_specification
-
-
-def expand_integrations(eg, module):
-    rancher = module.params.get('rancher')
-    mesosphere = module.params.get('mesosphere')
-    ecs = module.params.get('ecs')
-    kubernetes = module.params.get('kubernetes')
-    nomad = module.params.get('nomad')
-    docker_swarm = module.params.get('docker_swarm')
-    route53 = module.params.get('route53')
-    right_scale = module.params.get('right_scale')
-    opsworks = module.params.get('opsworks')
-    chef = module.params.get('chef')
-    mlb_runtime = module.params.get('mlb_runtime')
-    elastic_beanstalk = module.params.get('elastic_beanstalk')
-    code_deploy = module.params.get('code_deploy')
-
-    integration_exists = False
-
-    eg_integrations = spotinst.models.elastigroup.aws.ThirdPartyIntegrations()
-
-    if mesosphere is not None:
-        eg_integrations.mesosphere = expand_fields(mesosphere_fields, mesosphere, 'Mesosphere')
-        integration_exists = True
-
-    if ecs is not None:
-        expand_ecs(eg_integrations, ecs)
-        integration_exists = True
-
-    if kubernetes is not None:
-        expand_kubernetes(eg_integrations, kubernetes)
-        integration_exists = True
-
-    if nomad is not None:
-        expand_nomad(eg_integrations, nomad)
-        integration_exists = True
-
-    if docker_swarm is not None:
-        expand_docker_swarm(eg_integrations, docker_swarm)
-        integration_exists = True
-
-    if route53 is not None:
-        expand_route53(eg_integrations, route53)
-        integration_exists = True
-
-    if mlb_runtime is not None:
-        eg_integrations.mlb_runtime = expand_fields(
-            mlb_runtime_fields, mlb_runtime, 'MlbRuntimeConfiguration')
-        integration_exists = True
-
-    if elastic_beanstalk:
-        expand_elastic_beanstalk(eg_integrations, elastic_beanstalk)
-        integration_exists = True
-
-    if code_deploy is not None:
-        expand_code_deploy(eg_integrations, code_deploy)
-        integration_exists = True
-
-    if right_scale is not None:
-        eg_integrations.right_scale = expand_fields(right_scale_fields, right_scale, 'RightScaleConfiguration')
-        integration_exists = True
-
-    if opsworks is not None:
-        eg_integrations.opsworks = expand_fields(opsworks_fields, opsworks, 'OpsWorksConfiguration')
-        integration_exists = True
-
-    if rancher is not None:
-        eg_integrations.rancher = expand_fields(rancher_fields, rancher, 'Rancher')
-        integration_exists = True
-
-    if chef is not None:
-        eg_integrations.chef = expand_fields(chef_fields, chef, 'ChefConfiguration')
-        integration_exists = True
-
-    if integration_exists:
-        eg.third_parties_integration = eg_integrations
-
-
-def expand_ecs(eg_integrations, ecs_config):
-    ecs = expand_fields(ecs_fields, ecs_config, 'EcsConfiguration')
-    ecs_auto_scale_config = ecs_config.get('auto_scale', None)
-
-    if ecs_auto_scale_config:
-        ecs.auto_scale = expand_fields(
-            ecs_auto_scale_fields,
-            ecs_auto_scale_config,
-            'EcsAutoScaleConfiguration')
-
-        ecs_headroom_config = ecs_auto_scale_config.get('headroom', None)
-        if ecs_headroom_config:
-            ecs.auto_scale.headroom = expand_fields(
-                ecs_headroom_fields,
-                ecs_headroom_config,
-                'EcsAutoScalerHeadroomConfiguration')
-
-        ecs_attributes_config = ecs_auto_scale_config.get('attributes', None)
-        if ecs_attributes_config:
-            ecs.auto_scale.attributes = expand_list(
-                ecs_attributes_config,
-                ecs_attributes_fields,
-                'EcsAutoScalerAttributeConfiguration')
-
-        ecs_down_config = ecs_auto_scale_config.get('down', None)
-        if ecs_down_config:
-            ecs.auto_scale.down = expand_fields(
-                ecs_down_fields, ecs_down_config,
-                'EcsAutoScalerDownConfiguration')
-
-    eg_integrations.ecs = ecs
-
-
-def expand_nomad(eg_integrations, nomad_config):
-    nomad = expand_fields(nomad_fields, nomad_config, 'NomadConfiguration')
-    nomad_auto_scale_config = nomad_config.get('auto_scale', None)
-
-    if nomad_auto_scale_config:
-        nomad.auto_scale = expand_fields(
-            nomad_auto_scale_fields,
-            nomad_auto_scale_config,
-            'NomadAutoScalerConfiguration')
-
-        nomad_headroom_config = nomad_auto_scale_config.get('headroom', None)
-        if nomad_headroom_config:
-            nomad.auto_scale.headroom = expand_fields(
-                nomad_headroom_fields,
-                nomad_headroom_config,
-                'NomadAutoScalerHeadroomConfiguration')
-
-        nomad_constraints_config = nomad_auto_scale_config.get(
-            'constraints', None)
-        if nomad_constraints_config:
-            nomad.auto_scale.constraints = expand_list(
-                nomad_constraints_config,
-                nomad_constraints_fields,
-                'NomadAutoScalerConstraintsConfiguration')
-
-        nomad_down_config = nomad_auto_scale_config.get('down', None)
-        if nomad_down_config:
-            nomad.auto_scale.down = expand_fields(
-                nomad_down_fields,
-                nomad_down_config,
-                'NomadAutoScalerDownConfiguration')
-
-    eg_integrations.nomad = nomad
-
-
-def expand_code_deploy(eg_integrations, code_deploy_config):
-    code_deploy = expand_fields(
-        code_deploy_fields, code_deploy_config, 'CodeDeployConfiguration')
-
-    code_deploy_deployment_config = code_deploy_config.get(
-        'deployment_groups', None)
-
-    if code_deploy_deployment_config:
-        code_deploy.deployment_groups = expand_list(
-            code_deploy_deployment_config, code_deploy_deployment_fields,
-            'CodeDeployDeploymentGroupsConfiguration')
-
-    eg_integrations.code_deploy = code_deploy
-
-
-def expand_docker_swarm(eg_integrations, docker_swarm_config):
-    docker_swarm = expand_fields(
-        docker_swarm_fields,
-        docker_swarm_config,
-        'DockerSwarmConfiguration')
-    docker_swarm_auto_scale_config = docker_swarm_config.get(
-        'auto_scale', None)
-
-    if docker_swarm_auto_scale_config:
-        docker_swarm.auto_scale = expand_fields(
-            docker_swarm_auto_scale_fields,
-            docker_swarm_auto_scale_config,
-            'DockerSwarmAutoScalerConfiguration')
-
-        docker_swarm_headroom_config = docker_swarm_auto_scale_config.get(
-            'headroom', None)
-        if docker_swarm_headroom_config:
-            docker_swarm.auto_scale.headroom = expand_fields(
-                docker_swarm_headroom_fields,
-                docker_swarm_headroom_config,
-                'DockerSwarmAutoScalerHeadroomConfiguration')
-
-        docker_swarm_down_config = docker_swarm_auto_scale_config.get(
-            'down', None)
-        if docker_swarm_down_config:
-            docker_swarm.auto_scale.down = expand_fields(
-                docker_swarm_down_fields,
-                docker_swarm_down_config,
-                'DockerSwarmAutoScalerDownConfiguration')
-
-    eg_integrations.docker_swarm = docker_swarm
-
-
-def expand_route53(eg_integrations, route53_config):
-    route53 = spotinst.models.elastigroup.aws.Route53Configuration()
-    domains_configuration = route53_config.get('domains', None)
-
-    if domains_configuration:
-        route53.domains = expand_list(
-            domains_configuration,
-            route53_domain_fields,
-            'Route53DomainsConfiguration')
-
-        for i in range(len(route53.domains)):
-            expanded_domain = route53.domains[i]
-            raw_domain = domains_configuration[i]
-            expanded_domain.record_sets = expand_list(
-                raw_domain['record_sets'],
-                route53_record_set_fields,
-                'Route53RecordSetsConfiguration')
-
-    eg_integrations.route53 = route53
-
-
-def expand_elastic_beanstalk(eg_integrations, elastic_beanstalk_config):
-    elastic_beanstalk = expand_fields(
-        elastic_beanstalk_fields, elastic_beanstalk_config, 'ElasticBeanstalk')
-
-    elastic_beanstalk_deployment = elastic_beanstalk_config.get(
-        'deployment_preferences', None)
-
-    elastic_beanstalk_managed_actions = elastic_beanstalk_config.get(
-        'managed_actions', None)
-
-    if elastic_beanstalk_deployment:
-        elastic_beanstalk.deployment_preferences = expand_fields(
-            elastic_beanstalk_deployment_fields, elastic_beanstalk_deployment,
-            'DeploymentPreferences')
-        if elastic_beanstalk.deployment_preferences and elastic_beanstalk_deployment.get('strategy'):
-            elastic_beanstalk.deployment_preferences.strategy = \
-                expand_fields(elastic_beanstalk_strategy_fields,
-                              elastic_beanstalk_deployment['strategy'],
-                              'BeanstalkDeploymentStrategy')
-
-    if elastic_beanstalk_managed_actions:
-        elastic_beanstalk.managed_actions = expand_fields(
-            elastic_beanstalk_managed_actions_fields, elastic_beanstalk_managed_actions,
-            'ManagedActions')
-
-        if elastic_beanstalk.managed_actions:
-            elastic_beanstalk.managed_actions.platform_update = expand_fields(
-                elastic_beanstalk_platform_update_fields, elastic_beanstalk_managed_actions['platform_update'],
-                'PlatformUpdate')
-
-    eg_integrations.elastic_beanstalk = elastic_beanstalk
-
-
-def expand_kubernetes(eg_integrations, kubernetes_config):
-    kubernetes = expand_fields(
-        kubernetes_fields,
-        kubernetes_config,
-        'KubernetesConfiguration')
-    kubernetes_auto_scale_config = kubernetes_config.get('auto_scale', None)
-
-    if kubernetes_auto_scale_config:
-        kubernetes.auto_scale = expand_fields(
-            kubernetes_auto_scale_fields,
-            kubernetes_auto_scale_config,
-            'KubernetesAutoScalerConfiguration')
-
-        kubernetes_headroom_config = kubernetes_auto_scale_config.get(
-            'auto_scale', None)
-        if kubernetes_headroom_config:
-            kubernetes.auto_scale.headroom = expand_fields(
-                kubernetes_headroom_fields,
-                kubernetes_headroom_config,
-                'KubernetesAutoScalerHeadroomConfiguration')
-
-        kubernetes_labels_config = kubernetes_auto_scale_config.get(
-            'labels', None)
-        if kubernetes_labels_config:
-            kubernetes.auto_scale.labels = expand_list(
-                kubernetes_labels_config,
-                kubernetes_labels_fields,
-                'KubernetesAutoScalerLabelsConfiguration')
-
-        kubernetes_down_config = kubernetes_auto_scale_config.get('down', None)
-        if kubernetes_down_config:
-            kubernetes.auto_scale.down = expand_fields(
-                kubernetes_down_fields,
-                kubernetes_down_config,
-                'KubernetesAutoScalerDownConfiguration')
-
-    eg_integrations.kubernetes = kubernetes
-
-
-def expand_capacity(eg, module, is_update, do_not_update):
-    eg_capacity = expand_fields(capacity_fields, module.params, 'Capacity')
-
-    if is_update is True:
-        delattr(eg_capacity, 'unit')
-
-        if 'target' in do_not_update:
-            delattr(eg_capacity, 'target')
-
-    eg.capacity = eg_capacity
-
-
-def expand_strategy(eg, module):
-    persistence = module.params.get('persistence')
-    signals = module.params.get('signals')
-    revert_to_spot = module.params.get('revert_to_spot')
-
-    eg_strategy = expand_fields(strategy_fields, module.params, 'Strategy')
-
-    terminate_at_end_of_billing_hour = module.params.get('terminate_at_end_of_billing_hour')
-
-    if terminate_at_end_of_billing_hour is not None:
-        eg_strategy.eg_scaling_strategy = expand_fields(scaling_strategy_fields, module.params, 'ScalingStrategy')
-
-    if persistence is not None:
-        eg_strategy.persistence = expand_fields(persistence_fields, persistence, 'Persistence')
-
-    if signals is not None:
-        eg_signals = expand_list(signals, signal_fields, 'Signal')
-
-        if len(eg_signals) > 0:
-            eg_strategy.signals = eg_signals
-
-    if revert_to_spot is not None:
-        eg_strategy.revert_to_spot = expand_fields(revert_to_spot_fields, revert_to_spot, "RevertToSpot")
-
-    eg.strategy = eg_strategy
-
-
-def expand_multai(eg, module):
-    multai_load_balancers = module.params.get('multai_load_balancers')
-
-    eg_multai = expand_fields(multai_fields, module.params, 'Multai')
-
-    if multai_load_balancers is not None:
-        eg_multai_load_balancers = expand_list(multai_load_balancers, multai_lb_fields, 'MultaiLoadBalancer')
-
-        if len(eg_multai_load_balancers) > 0:
-            eg_multai.balancers = eg_multai_load_balancers
-            eg.multai = eg_multai
-
-
-def expand_scheduled_tasks(eg, module):
-    scheduled_tasks = module.params.get('scheduled_tasks')
-
-    if scheduled_tasks is not None:
-        eg_scheduling = spotinst.models.elastigroup.aws.Scheduling()
-
-        eg_tasks = expand_list(scheduled_tasks, scheduled_task_fields, 'ScheduledTask')
-
-        if len(eg_tasks) > 0:
-            eg_scheduling.tasks = eg_tasks
-            eg.scheduling = eg_scheduling
-
-
-def expand_load_balancers(eg_launchspec, load_balancers, target_group_arns, mlb_load_balancers):
-    if load_balancers is not None or target_group_arns is not None:
-        eg_load_balancers_config = spotinst.models.elastigroup.aws.LoadBalancersConfig()
-        eg_total_lbs = []
-
-        if load_balancers is not None:
-            for elb_name in load_balancers:
-                eg_elb = spotinst.models.elastigroup.aws.LoadBalancer()
-                if elb_name is not None:
-                    eg_elb.name = elb_name
-                    eg_elb.type = 'CLASSIC'
-                    eg_total_lbs.append(eg_elb)
-
-        if target_group_arns is not None:
-            for target_arn in target_group_arns:
-                eg_elb = spotinst.models.elastigroup.aws.LoadBalancer()
-                if target_arn is not None:
-                    eg_elb.arn = target_arn
-                    eg_elb.type = 'TARGET_GROUP'
-                    eg_total_lbs.append(eg_elb)
-
-        if mlb_load_balancers:
-            mlbs = expand_list(
-                mlb_load_balancers,
-                mlb_load_balancers_fields,
-                'LoadBalancer')
-
-            for mlb in mlbs:
-                mlb.type = "MULTAI_TARGET_SET"
-
-            eg_total_lbs.extend(mlbs)
-
-        if len(eg_total_lbs) > 0:
-            eg_load_balancers_config.load_balancers = eg_total_lbs
-            eg_launchspec.load_balancers_config = eg_load_balancers_config
-
-
-def expand_tags(eg_launchspec, tags):
-    if tags is not None:
-        eg_tags = []
-
-        for tag in tags:
-            eg_tag = spotinst.models.elastigroup.aws.Tag()
-
-            if list(tag):
-                eg_tag.tag_key = list(tag)[0]
-            if tag[list(tag)[0]]:
-                eg_tag.tag_value = tag[list(tag)[0]]
-
-            eg_tags.append(eg_tag)
-
-        if len(eg_tags) > 0:
-            eg_launchspec.tags = eg_tags
-
-
-def expand_block_device_mappings(eg_launchspec, bdms):
-    if bdms is not None:
-        eg_bdms = []
-
-        for bdm in bdms:
-            eg_bdm = expand_fields(bdm_fields, bdm, 'BlockDeviceMapping')
-
-            if bdm.get('ebs') is not None:
-                eg_bdm.ebs = expand_fields(ebs_fields, bdm.get('ebs'), 'EBS')
-
-            eg_bdms.append(eg_bdm)
-
-        if len(eg_bdms) > 0:
-            eg_launchspec.block_device_mappings = eg_bdms
-
-
-def expand_network_interfaces(eg_launchspec, enis):
-    if enis is not None:
-        eg_enis = []
-
-        for eni in enis:
-            eg_eni = expand_fields(eni_fields, eni, 'NetworkInterface')
-
-            eg_pias = expand_list(eni.get('private_ip_addresses'), private_ip_fields, 'PrivateIpAddress')
-
-            if eg_pias is not None:
-                eg_eni.private_ip_addresses = eg_pias
-
-            eg_enis.append(eg_eni)
-
-        if len(eg_enis) > 0:
-            eg_launchspec.network_interfaces = eg_enis
-
-
-def expand_scaling(eg, module):
-    up_scaling_policies = module.params.get('up_scaling_policies')
-    down_scaling_policies = module.params.get('down_scaling_policies')
-    target_tracking_policies = module.params.get('target_tracking_policies')
-
-    eg_scaling = spotinst.models.elastigroup.aws.Scaling()
-
-    if up_scaling_policies is not None:
-        eg_up_scaling_policies = expand_scaling_policies(up_scaling_policies)
-        if len(eg_up_scaling_policies) > 0:
-            eg_scaling.up = eg_up_scaling_policies
-
-    if down_scaling_policies is not None:
-        eg_down_scaling_policies = expand_scaling_policies(down_scaling_policies)
-        if len(eg_down_scaling_policies) > 0:
-            eg_scaling.down = eg_down_scaling_policies
-
-    if target_tracking_policies is not None:
-        eg_target_tracking_policies = expand_target_tracking_policies(target_tracking_policies)
-        if len(eg_target_tracking_policies) > 0:
-            eg_scaling.target = eg_target_tracking_policies
-
-    if eg_scaling.down is not None or eg_scaling.up is not None or eg_scaling.target is not None:
-        eg.scaling = eg_scaling
-
-
-def expand_list(items, fields, class_name):
-    if items is not None:
-        new_objects_list = []
-        for item in items:
-            new_obj = expand_fields(fields, item, class_name)
-            new_objects_list.append(new_obj)
-
-        return new_objects_list
-
-
-def expand_fields(fields, item, class_name):
-    class_ = getattr(spotinst.models.elastigroup.aws, class_name)
-    new_obj = class_()
-
-    # Handle primitive fields
-    if item is not None:
-        for field in fields:
-            if isinstance(field, dict):
-                ansible_field_name = field['ansible_field_name']
-                spotinst_field_name = field['spotinst_field_name']
-            else:
-                ansible_field_name = field
-                spotinst_field_name = field
-            if item.get(ansible_field_name) is not None:
-                setattr(new_obj, spotinst_field_name, item.get(ansible_field_name))
-
-    return new_obj
-
-
-def expand_scaling_policies(scaling_policies):
-    eg_scaling_policies = []
-
-    for policy in scaling_policies:
-        eg_policy = expand_fields(scaling_policy_fields, policy, 'ScalingPolicy')
-        eg_policy.action = expand_fields(action_fields, policy, 'ScalingPolicyAction')
-        eg_scaling_policies.append(eg_policy)
-
-    return eg_scaling_policies
-
-
-def expand_target_tracking_policies(tracking_policies):
-    eg_tracking_policies = []
-
-    for policy in tracking_policies:
-        eg_policy = expand_fields(tracking_policy_fields, policy, 'TargetTrackingPolicy')
-        eg_tracking_policies.append(eg_policy)
-
-    return eg_tracking_policies
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import (
+    HAS_SPOTINST_SDK, elastigroup_fields, handle_elastigroup, retrieve_group_instances)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
 
 
 def get_client(module):
-    # Retrieve creds file variables
-    creds_file_loaded_vars = dict()
-
-    credentials_path = module.params.get('credentials_path')
-
-    if credentials_path is not None:
-        try:
-            with open(credentials_path, "r") as creds:
-                for line in creds:
-                    eq_index = line.find(':')
-                    var_name = line[:eq_index].strip()
-                    string_value = line[eq_index + 1:].strip()
-                    creds_file_loaded_vars[var_name] = string_value
-        except IOError:
-            pass
-    # End of creds file retrieval
-
-    token = module.params.get('token')
-    if not token:
-        token = creds_file_loaded_vars.get("token")
-
-    account = module.params.get('account_id')
-    if not account:
-        account = creds_file_loaded_vars.get("account")
-
-    if account is not None:
-        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
-    else:
-        session = spotinst.SpotinstSession(auth_token=token)
-
-    client = session.client("elastigroup_aws")
-
-    return client
+    return get_spot_client(module.params, "elastigroup_aws")
 
 
 def main():
     fields = dict(
         account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
-        auto_apply_tags=dict(type='bool'),
-        availability_vs_cost=dict(type='str', required=True),
-        availability_zones=dict(type='list', required=True),
-        block_device_mappings=dict(type='list'),
-        chef=dict(type='dict'),
-        code_deploy=dict(type='dict'),
         credentials_path=dict(type='path', default="~/.spotinst/credentials"),
-        credit_specification=dict(type='dict'),
-        do_not_update=dict(default=[], type='list'),
-        docker_swarm=dict(type='dict'),
-        down_scaling_policies=dict(type='list'),
-        draining_timeout=dict(type='int'),
-        ebs_optimized=dict(type='bool'),
-        ebs_volume_pool=dict(type='list'),
-        ecs=dict(type='dict'),
-        elastic_beanstalk=dict(type='dict'),
-        elastic_ips=dict(type='list'),
-        fallback_to_od=dict(type='bool'),
-        id=dict(type='str'),
-        health_check_grace_period=dict(type='int'),
-        health_check_type=dict(type='str'),
-        health_check_unhealthy_duration_before_replacement=dict(type='int'),
-        iam_role_arn=dict(type='str'),
-        iam_role_name=dict(type='str'),
-        image_id=dict(type='str', required=True),
-        key_pair=dict(type='str'),
-        kubernetes=dict(type='dict'),
-        lifetime_period=dict(type='int'),
-        load_balancers=dict(type='list'),
-        max_size=dict(type='int', required=True),
-        mesosphere=dict(type='dict'),
-        min_size=dict(type='int', required=True),
-        mlb_runtime=dict(type='dict'),
-        mlb_load_balancers=dict(type='list'),
-        monitoring=dict(type='str'),
-        multai_load_balancers=dict(type='list'),
-        multai_token=dict(type='str'),
-        name=dict(type='str', required=True),
-        network_interfaces=dict(type='list'),
-        nomad=dict(type='dict'),
-        on_demand_count=dict(type='int'),
-        on_demand_instance_type=dict(type='str'),
-        opsworks=dict(type='dict'),
-        persistence=dict(type='dict'),
-        preferred_spot_instance_types=dict(type='list'),
-        private_ips=dict(type='list'),
-        product=dict(type='str', required=True),
-        rancher=dict(type='dict'),
-        revert_to_spot=dict(type='dict'),
-        right_scale=dict(type='dict'),
-        risk=dict(type='int'),
-        roll_config=dict(type='dict'),
-        route53=dict(type='dict'),
-        scheduled_tasks=dict(type='list'),
-        security_group_ids=dict(type='list', required=True),
-        shutdown_script=dict(type='str'),
-        signals=dict(type='list'),
-        spin_up_time=dict(type='int'),
-        spot_instance_types=dict(type='list', required=True),
-        state=dict(default='present', choices=['present', 'absent']),
-        stateful_deallocation_should_delete_images=dict(type='bool'),
-        stateful_deallocation_should_delete_network_interfaces=dict(type='bool'),
-        stateful_deallocation_should_delete_snapshots=dict(type='bool'),
-        stateful_deallocation_should_delete_volumes=dict(type='bool'),
-        tags=dict(type='list'),
-        target=dict(type='int', required=True),
-        target_group_arns=dict(type='list'),
-        tenancy=dict(type='str'),
-        terminate_at_end_of_billing_hour=dict(type='bool'),
         token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN'])),
-        unit=dict(type='str'),
-        user_data=dict(type='str'),
-        utilize_reserved_instances=dict(type='bool'),
-        uniqueness_by=dict(default='name', choices=['name', 'id']),
-        up_scaling_policies=dict(type='list'),
-        target_tracking_policies=dict(type='list'),
-        wait_for_instances=dict(type='bool', default=False),
-        wait_timeout=dict(type='int')
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        **elastigroup_fields
     )
 
-    module = AnsibleModule(argument_spec=fields)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
 
     if not HAS_SPOTINST_SDK:
         module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
 
     client = get_client(module=module)
 
-    group_id, message, has_changed = handle_elastigroup(client=client, module=module)
+    roll = dict()
+    group_id, message, has_changed, diff = handle_elastigroup(client=client, module=module, roll=roll)
+
+    instances, wait = retrieve_group_instances(client=client, module=module, group_id=group_id)
+
+    result = dict(changed=has_changed, group_id=group_id, message=message, instances=instances)
+
+    if wait is not None:
+        result['wait'] = wait
+
+    if roll:
+        result['roll'] = roll
+
+    if diff is not None:
+        result['diff'] = diff
 
-    instances = retrieve_group_instances(client=client, module=module, group_id=group_id)
+    result['api_retries'] = get_retry_stats()
 
-    module.exit_json(changed=has_changed, group_id=group_id, message=message, instances=instances)
+    module.exit_json(**result)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_elastigroup_batch
+version_added: 1.3.0
+short_description: Create, update or delete many Spot AWS Elastigroups in one task
+author: Spot by NetApp (@talzur)
+description:
+  - Converges a list of AWS Elastigroups, each described with the options of M(spot.cloud_modules.aws_elastigroup).
+    Names are resolved from a single listing of the account's groups, and the groups are then created, updated
+    or deleted concurrently on a bounded pool of threads.
+  - A failure in one group does not stop the others. The task fails after all groups were handled if any of them failed.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+options:
+
+  credentials_path:
+    type: str
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+
+  account_id:
+    type: str
+    description:
+      - Optional parameter that allows to set an account-id inside the module configuration. By default this is retrieved from the credentials path
+
+  token:
+    type: str
+    description:
+      - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
+
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
+  groups:
+    type: list
+    elements: dict
+    required: true
+    description:
+      - The elastigroups to converge. Each item accepts the same options as M(spot.cloud_modules.aws_elastigroup),
+        except for the credentials which are shared by the whole batch.
+
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of groups handled at the same time.
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Converge web and worker elastigroups
+      spot.cloud_modules.aws_elastigroup_batch:
+        max_workers: 16
+        groups:
+          - name: web
+            min_size: 1
+            max_size: 10
+            target: 2
+            product: Linux/UNIX
+            availability_vs_cost: balanced
+            availability_zones:
+              - name: us-west-2a
+                subnet_id: subnet-2b68a15c
+            image_id: ami-f173cc91
+            security_group_ids:
+              - sg-8ad2d4ed
+            spot_instance_types:
+              - c5.large
+          - name: worker
+            state: absent
+            min_size: 0
+            max_size: 0
+            target: 0
+            product: Linux/UNIX
+            availability_vs_cost: balanced
+            availability_zones:
+              - name: us-west-2a
+            image_id: ami-f173cc91
+            security_group_ids:
+              - sg-8ad2d4ed
+            spot_instance_types:
+              - c5.large
+      register: result
+"""
+
+RETURN = """
+---
+results:
+    description: Outcome for each group, in the order the groups were given.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "name": "web",
+            "group_id": "sig-12345",
+            "changed": true,
+            "message": "Updated group successfully.",
+            "instances": []
+        },
+        {
+            "name": "worker",
+            "failed": true,
+            "msg": "Error while attempting to delete group : ..."
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_batch import (
+    DEFAULT_MAX_WORKERS, BatchItemModule, run_batch)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import (
+    HAS_SPOTINST_SDK, elastigroup_fields, handle_elastigroup, retrieve_group_instances)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "elastigroup_aws")
+
+
+def find_duplicate_names(groups):
+    seen, duplicates = set(), set()
+
+    for group in groups:
+        if group.get('uniqueness_by') == 'name':
+            if group['name'] in seen:
+                duplicates.add(group['name'])
+            seen.add(group['name'])
+
+    return sorted(duplicates)
+
+
+def handle_groups(client, module):
+    groups = module.params.get('groups')
+
+    if any(group.get('uniqueness_by') == 'name' for group in groups):
+        existing_groups = client.get_elastigroups()
+    else:
+        existing_groups = None
+
+    def handle_group(group):
+        item_module = BatchItemModule(module, group)
+
+        roll = dict()
+        group_id, message, has_changed, diff = handle_elastigroup(
+            client=client, module=item_module, existing_groups=existing_groups, roll=roll)
+        instances, wait = retrieve_group_instances(client=client, module=item_module, group_id=group_id)
+
+        result = dict(name=group.get('name'), group_id=group_id, changed=has_changed, message=message,
+                      instances=instances)
+
+        if wait is not None:
+            result['wait'] = wait
+
+        if roll:
+            result['roll'] = roll
+
+        if diff is not None:
+            result['diff'] = diff
+
+        return result
+
+    results = run_batch(groups, handle_group, module.params.get('max_workers'))
+
+    for group, result in zip(groups, results):
+        if result.get('failed'):
+            result['name'] = group.get('name')
+
+    return results
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        groups=dict(type='list', elements='dict', required=True, options=elastigroup_fields),
+        max_workers=dict(type='int', default=DEFAULT_MAX_WORKERS)
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    duplicates = find_duplicate_names(module.params.get('groups'))
+
+    if duplicates:
+        module.fail_json(msg="Group names must be unique within a batch, found duplicates: " + ", ".join(duplicates))
+
+    client = get_client(module=module)
+
+    results = handle_groups(client=client, module=module)
+
+    has_changed = any(result.get('changed') for result in results)
+    failed = [result for result in results if result.get('failed')]
+
+    if failed:
+        module.fail_json(msg="{0} of {1} groups failed".format(len(failed), len(results)),
+                         changed=has_changed, results=results, api_retries=get_retry_stats())
+
+    module.exit_json(changed=has_changed, results=results, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_elastigroup_info
+version_added: 1.3.0
+short_description: Get information about Spot AWS Elastigroups
+author: Spot by NetApp (@talzur)
+description:
+  - Returns the configuration of the account's AWS Elastigroups, optionally with their instances,
+    instance health and suspended processes.
+  - Groups are selected by name, by ID and by tag. The instances and other details of the selected
+    groups are fetched concurrently.
+  - I(fields) and I(exclude_fields) trim each group's configuration before it is returned, which keeps
+    large attributes such as user data out of the task result.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - spot.cloud_modules.info
+options:
+
+  tags:
+    type: dict
+    description:
+      - Only return groups whose launch specification has all of these tags, given as key and value.
+      - Applies on top of I(names) and I(ids). When neither is set, every group of the account is considered.
+
+  include:
+    type: list
+    elements: str
+    default: ['instances']
+    choices: ['instances', 'health', 'suspended_processes']
+    description:
+      - Details to fetch for each group, returned as C(instances), C(instance_health) and C(suspended_processes).
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Get the capacity and instances of the web groups
+      spot.cloud_modules.aws_elastigroup_info:
+        tags:
+          app: web
+        fields:
+          - id
+          - name
+          - capacity
+      register: result
+
+    - name: Get two groups by ID without their user data and integrations
+      spot.cloud_modules.aws_elastigroup_info:
+        ids:
+          - sig-12345
+          - sig-67890
+        include: []
+        exclude_fields:
+          - compute.launch_specification.user_data
+          - third_parties_integration
+      register: result
+"""
+
+RETURN = """
+---
+elastigroups:
+    description: The selected groups, with the requested fields and details.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "id": "sig-12345",
+            "name": "web",
+            "capacity": {"minimum": 1, "maximum": 10, "target": 2, "unit": "instance"},
+            "instances": [
+                {
+                    "instance_id": "i-0123456789abcdef0",
+                    "private_ip": "10.0.0.1",
+                    "status": "fulfilled"
+                }
+            ]
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK, get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import (
+    find_resources, get_resources_info, info_fields, tags_to_dict)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "elastigroup_aws")
+
+
+def get_group_tags(group):
+    launch_specification = (group.get('compute') or dict()).get('launch_specification') or dict()
+
+    return tags_to_dict(launch_specification.get('tags'))
+
+
+def get_groups_info(client, module):
+    groups = find_resources(client, module, client.get_elastigroups, client.get_elastigroup, get_tags=get_group_tags)
+
+    return get_resources_info(module, groups, dict(
+        instances=('instances', client.get_elastigroup_active_instances),
+        health=('instance_health', client.get_instance_healthiness),
+        suspended_processes=('suspended_processes', client.list_suspended_process)))
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        tags=dict(type='dict'),
+        include=dict(type='list', elements='str', default=['instances'],
+                     choices=['instances', 'health', 'suspended_processes']),
+        **info_fields
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    elastigroups = get_groups_info(client=client, module=module)
+
+    module.exit_json(changed=False, elastigroups=elastigroups, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_elastigroup_roll
+version_added: 1.3.0
+short_description: Roll many Spot AWS Elastigroups in one task
+author: Spot by NetApp (@talzur)
+description:
+  - Starts a roll of each of the given AWS Elastigroups and waits for every roll to end, rolling up to I(max_workers)
+    groups at the same time. Names are resolved from a single listing of the account's groups.
+  - A failed roll does not stop the rolls already running. Once more than I(max_failures) rolls failed, the groups
+    that were not started yet are skipped. The task fails after all groups were handled if any of them failed.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+options:
+
+  credentials_path:
+    type: str
+    default: "~/.spotinst/credentials"
+    description:
+      - Optional parameter that allows to set a non-default credentials path.
+
+  account_id:
+    type: str
+    description:
+      - Optional parameter that allows to set an account-id inside the module configuration. By default this is retrieved from the credentials path
+
+  token:
+    type: str
+    description:
+      - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
+
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
+  groups:
+    type: list
+    elements: str
+    required: true
+    description:
+      - The elastigroups to roll, each given by its ID (Example C(sig-12345)) or by its name.
+
+  batch_size_percentage:
+    type: int
+    required: true
+    description:
+      - Percentage of the instances of a group replaced in each batch of its roll.
+
+  grace_period:
+    type: int
+    description:
+      - Seconds to wait for the new instances of a batch to become healthy before moving on.
+
+  health_check_type:
+    type: str
+    description:
+      - Health check used to tell whether the new instances are healthy (Example C(ELB)).
+
+  max_workers:
+    type: int
+    default: 8
+    description:
+      - Maximum number of groups rolled at the same time.
+
+  max_failures:
+    type: int
+    default: 0
+    description:
+      - Number of failed rolls tolerated. Once more rolls failed, no new roll is started.
+
+  wait_for_roll_timeout:
+    type: int
+    default: 1800
+    description:
+      - How long in seconds to wait for each roll before counting it as failed.
+
+  wait_config:
+    type: dict
+    description:
+      - Polling behaviour while waiting for a roll. The first poll is immediate and the wait ends as soon as
+        the roll has ended.
+    suboptions:
+      initial_interval:
+        type: float
+        default: 2
+        description:
+          - Seconds to wait after the first poll.
+      max_interval:
+        type: float
+        default: 30
+        description:
+          - Upper bound in seconds for the wait between polls.
+      backoff:
+        type: float
+        default: 2
+        description:
+          - Factor the wait between polls grows by after each poll.
+      jitter:
+        type: float
+        default: 0.2
+        description:
+          - Random spread applied to each wait, as a fraction of it.
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Roll the web groups, four at a time
+      spot.cloud_modules.aws_elastigroup_roll:
+        groups:
+          - web-us-east-1
+          - web-eu-west-1
+          - sig-12345
+        batch_size_percentage: 25
+        grace_period: 300
+        health_check_type: ELB
+        max_workers: 4
+        max_failures: 1
+      register: result
+"""
+
+RETURN = """
+---
+results:
+    description: Outcome for each group, in the order the groups were given.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "group": "web-us-east-1",
+            "group_id": "sig-12345",
+            "changed": true,
+            "roll": {
+                "id": "sbgd-c47a527a",
+                "status": "FINISHED",
+                "progress": {"unit": "percent", "value": 100},
+                "num_of_batches": 2,
+                "batches": [
+                    {"batch": 1, "started_at": 0.312, "ended_at": 241.522, "duration": 241.21},
+                    {"batch": 2, "started_at": 241.522, "ended_at": 470.105, "duration": 228.583}
+                ],
+                "wait": {"done": true, "elapsed": 470.105, "polls": []}
+            }
+        },
+        {
+            "group": "web-eu-west-1",
+            "failed": true,
+            "msg": "Roll sbgd-d58b638b of group sig-23456 ended with status FAILED"
+        },
+        {
+            "group": "sig-34567",
+            "skipped": true,
+            "msg": "Skipped after 2 items failed"
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_batch import (
+    DEFAULT_MAX_WORKERS, BatchItemModule, run_batch)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import (
+    HAS_SPOTINST_SDK, get_roll_id, start_group_roll, wait_for_group_roll)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_waiter import waiter_fields
+
+
+def get_client(module):
+    return get_spot_client(module.params, "elastigroup_aws")
+
+
+def is_group_id(group):
+    return group.startswith("sig-")
+
+
+def resolve_group_ids(client, groups):
+    """
+    Map each of ``groups`` to its group ID, looking names up in a single
+    listing of the account's groups. Names that match no group, or more than
+    one, map to None.
+    """
+    group_ids = dict((group, group) for group in groups if is_group_id(group))
+    names = set(group for group in groups if not is_group_id(group))
+
+    if names:
+        ids_by_name = dict()
+
+        for existing_group in client.get_elastigroups():
+            if existing_group.get('name') in names:
+                ids_by_name.setdefault(existing_group['name'], list()).append(existing_group.get('id'))
+
+        for name in names:
+            ids = ids_by_name.get(name, ())
+            group_ids[name] = ids[0] if len(ids) == 1 else None
+
+    return group_ids
+
+
+def handle_groups(client, module):
+    groups = module.params.get('groups')
+    group_ids = resolve_group_ids(client, groups)
+    roll_config = dict((key, module.params.get(key))
+                       for key in ('batch_size_percentage', 'grace_period', 'health_check_type'))
+
+    def handle_group(group):
+        group_id = group_ids[group]
+
+        if group_id is None:
+            raise ValueError("Found no single group named " + group)
+
+        if module.check_mode:
+            return dict(group_id=group_id, changed=True, message='Group would be rolled.')
+
+        item_module = BatchItemModule(module, dict(wait_config=module.params.get('wait_config'),
+                                                   wait_for_roll_timeout=module.params.get('wait_for_roll_timeout')))
+
+        roll = dict(id=get_roll_id(start_group_roll(client, group_id, roll_config)))
+        roll.update(wait_for_group_roll(client, item_module, group_id, roll['id']))
+
+        return dict(group_id=group_id, changed=True, roll=roll)
+
+    results = run_batch(groups, handle_group, module.params.get('max_workers'), module.params.get('max_failures'))
+
+    for group, result in zip(groups, results):
+        result['group'] = group
+
+    return results
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        groups=dict(type='list', elements='str', required=True),
+        batch_size_percentage=dict(type='int', required=True),
+        grace_period=dict(type='int'),
+        health_check_type=dict(type='str'),
+        max_workers=dict(type='int', default=DEFAULT_MAX_WORKERS),
+        max_failures=dict(type='int', default=0),
+        wait_for_roll_timeout=dict(type='int', default=1800),
+        wait_config=dict(type='dict', options=waiter_fields)
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    results = handle_groups(client=client, module=module)
+
+    has_changed = any(result.get('changed') for result in results)
+    failed = [result for result in results if result.get('failed')]
+
+    if failed:
+        module.fail_json(msg="{0} of {1} groups failed to roll".format(len(failed), len(results)),
+                         changed=has_changed, results=results, api_retries=get_retry_stats())
+
+    module.exit_json(changed=has_changed, results=results, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -27,6 +27,28 @@ options:
         description:
             - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
 
+    rate_limit:
+        type: dict
+        description:
+            - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+            - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+              and wait for the next token when the bucket is empty. Retried requests take a token as well.
+        suboptions:
+            path:
+                type: path
+                required: true
+                description:
+                    - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+            rate:
+                type: float
+                required: true
+                description:
+                    - Requests per second allowed for each Spot account.
+            burst:
+                type: int
+                description:
+                    - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
     credentials_path:
         type: str
         default: "/root/.spotinst/credentials"
@@ -63,12 +85,31 @@ options:
             - If your managed instance names are not unique, you may use this feature to update or delete a specific group.
             - "Whenever this property is set, you must set a an `id` in order to update or delete a group, otherwise a group will be created."
 
+    name_cache:
+        type: dict
+        description:
+            - Optional on-disk cache of the account's managed instance name to ID index, shared by the tasks of a run.
+            - When set, resolving a managed instance by name lists the account once per I(ttl) instead of once per task.
+            - The cache is updated when this module creates or deletes a managed instance.
+        suboptions:
+            path:
+                type: path
+                required: true
+                description:
+                    - Path of the cache file on the control node. A C(<path>.lock) file is created next to it.
+            ttl:
+                type: int
+                default: 300
+                description:
+                    - Seconds after which the cached index is fetched again.
+
 
     do_not_update:
         type: list
         description:
             - A list of dotted paths to attributes that you don't wish to update during an update operation.
             - "Example: Specifying `compute.product` will make sure that this attribute is never updated."
+            - "Path segments may be list indexes, or C(*) for every key or list item, for instance `compute.launch_specification.tags.*.tag_value`."
 
     action:
         type: str
@@ -521,47 +562,43 @@ managed_instance_id:
     sample: smi-a20bbc74
 """
 
-HAS_SPOTINST_SDK = False
-HAS_ANSIBLE_MODULE = False
-
-
-
-from ansible.module_utils.basic import AnsibleModule, env_fallback
-
-try:
-    from ansible.module_utils.spot_ansible_module import SpotAnsibleModule
-    import copy
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ansible_module import SpotAnsibleModule
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import get_create_diff, get_delete_diff, get_update_diff, has_changes, prune_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_do_not_update import clean_do_not_update_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_name_cache, name_cache_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_model import ModelConverter
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import HAS_SPOTINST_SDK, sdk_models, spotinst_client
 
-    HAS_ANSIBLE_MODULE = True
-
-except ImportError as e:
-    pass
-
-try:
-    import spotinst_sdk2 as spotinst
-    from spotinst_sdk2 import SpotinstSession
-    from spotinst_sdk2.client import SpotinstClientException
-
-    HAS_SPOTINST_SDK = True
-
-except ImportError as e:
-    pass
+models = sdk_models("managed_instance.aws")
 
 
 CLS_NAME_BY_ATTR_NAME = {
     "managed_instance.integrations.load_balancers_config": "LoadBalancersConfiguration",
     "managed_instance.integrations.route53": "Route53Configuration",
-    "managed_instance.integrations": "IntegrationsConfig"
+    "managed_instance.integrations": "IntegrationsConfig",
+    "managed_instance.compute.launch_specification.block_device_mappings.ebs": "EBS",
+    "managed_instance.compute.launch_specification.resource_tag_specification.volumes": "TagSpecification",
+    "managed_instance.compute.launch_specification.resource_tag_specification.snapshots": "TagSpecification",
+    "managed_instance.compute.launch_specification.resource_tag_specification.enis": "TagSpecification",
+    "managed_instance.compute.launch_specification.resource_tag_specification.amis": "TagSpecification"
 }
 
 LIST_MEMBER_CLS_NAME_BY_ATTR_NAME = {
     "managed_instance.integrations.route53.domains.record_sets": "Route53RecordSetConfiguration",
     "managed_instance.integrations.route53.domains": "Route53DomainConfiguration",
     "managed_instance.scheduling.tasks": "Task",
-    "managed_instance.integrations.load_balancers_config.load_balancers": "LoadBalancer"
+    "managed_instance.integrations.load_balancers_config.load_balancers": "LoadBalancer",
+    "managed_instance.compute.launch_specification.tags": "Tag",
+    "managed_instance.compute.launch_specification.network_interfaces": "NetworkInterface",
+    "managed_instance.compute.launch_specification.block_device_mappings": "BlockDeviceMapping"
 }
 
-
+model_converter = ModelConverter(models, dict(LIST_MEMBER_CLS_NAME_BY_ATTR_NAME, **CLS_NAME_BY_ATTR_NAME))
 
 
 def to_snake_case(camel_str):
@@ -571,85 +608,12 @@ def to_snake_case(camel_str):
     return ret_val
 
 
-def to_pascal_case(snake_str):
-    return "".join(word.title() for word in snake_str.split("_"))
-
-
-def is_primitive(some_obj):
-    return any(isinstance(some_obj, x) for x in [bool, float, int, str])
-
-
-def find_in_overrides(curr_path):
-    return CLS_NAME_BY_ATTR_NAME.get(curr_path, None) or LIST_MEMBER_CLS_NAME_BY_ATTR_NAME.get(curr_path, None)
-
-
 def get_client(module):
-    creds_file_loaded_vars = dict()
-
-    credentials_path = module.custom_params.get("credentials_path")
-
-    if credentials_path is not None:
-        try:
-            with open(credentials_path, "r") as creds:
-                for line in creds:
-                    eq_index = line.find(":")
-                    var_name = line[:eq_index].strip()
-                    string_value = line[eq_index + 1:].strip()
-                    creds_file_loaded_vars[var_name] = string_value
-        except IOError:
-            pass
-    # End of creds file retrieval
-
-    token = module.custom_params.get("token")
-    if not token:
-        token = creds_file_loaded_vars.get("token")
-
-    account = module.custom_params.get("account_id")
-
-    if not account:
-        account = creds_file_loaded_vars.get("account")
-
-    if account is not None:
-        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
-    else:
-        session = spotinst.SpotinstSession(auth_token=token)
-
-    client = session.client("managed_instance_aws")
-
-    return client
-
-
-def turn_to_model(content, field_name: str, curr_path=None):
-    if content is None:
-        return None
-    elif is_primitive(content):
-        return content
-    elif isinstance(content, list):
-        new_l = []
-
-        for item in content:
-            value = turn_to_model(item, field_name, curr_path)
-            new_l.append(value)
-
-        return new_l
-
-    elif isinstance(content, dict):
-        if curr_path is not None:
-            curr_path += "." + field_name
-        else:
-            curr_path = field_name
+    return get_spot_client(module.params, "managed_instance_aws")
 
-        override = find_in_overrides(curr_path)
-        key_to_use = override if override else to_pascal_case(field_name)
 
-        class_ = getattr(spotinst.models.managed_instance.aws, key_to_use)
-        instance = class_()
-
-        for key, value in content.items():
-            new_value = turn_to_model(value, key, curr_path)
-            setattr(instance, key, new_value)
-
-        return instance
+def turn_to_model(content, field_name: str):
+    return model_converter.convert(content, field_name)
 
 
 def find_mis_with_same_name(managed_instances, name):
@@ -661,32 +625,10 @@ def find_mis_with_same_name(managed_instances, name):
     return ret_val
 
 
-def clean_do_not_update_fields(
-        managed_instance_module_copy: dict, do_not_update_list: list
-):
-    ret_val = managed_instance_module_copy
-
-    # avoid deleting parent dicts before children
-    do_not_update_list = sorted(do_not_update_list, key=len, reverse=True)
-
-    for dotted_path in do_not_update_list:
-        curr_dict = managed_instance_module_copy
-        path_as_list = dotted_path.split(".")
-        last_part_of_path = path_as_list[-1]
-
-        for path_part in path_as_list[:-1]:
-            new_dict = curr_dict.get(path_part)
-            curr_dict = new_dict
-
-        if curr_dict.get(last_part_of_path) is not None:
-            del curr_dict[last_part_of_path]
-
-    return ret_val
-
-
 def get_id_and_operation(client, state: str, module):
     operation, id = None, None
     uniqueness_by = module.custom_params.get("uniqueness_by")
+    name_cache = get_name_cache(module.params, "managed_instance_aws")
     manually_provided_mi_id = module.custom_params.get("id")
     managed_instance = module.custom_params.get("managed_instance")
 
@@ -699,8 +641,8 @@ def get_id_and_operation(client, state: str, module):
                 id = manually_provided_mi_id
                 operation = "update"
         else:
-            all_managed_instances = client.get_managed_instances()
             name = managed_instance["name"]
+            all_managed_instances = find_resources_by_name(client, name, client.get_managed_instances, name_cache=name_cache)
             instances_with_name = find_mis_with_same_name(all_managed_instances, name)
 
             if len(instances_with_name) == 0:
@@ -722,8 +664,8 @@ def get_id_and_operation(client, state: str, module):
                 msg = "Failed deleting managed instance - 'uniqueness_by' is set to `id` but parameter 'id' was not provided"
                 module.fail_json(changed=False, msg=msg)
         else:
-            all_managed_instances = client.get_managed_instances()
             name = managed_instance["name"]
+            all_managed_instances = find_resources_by_name(client, name, client.get_managed_instances, name_cache=name_cache)
             instances_with_name = find_mis_with_same_name(all_managed_instances, name)
 
             if len(instances_with_name) == 1:
@@ -742,25 +684,26 @@ def get_id_and_operation(client, state: str, module):
 
 
 def handle_managed_instance(client, module):
-    mi_models = spotinst.models.managed_instance.aws
-    managed_instance_module_copy = copy.deepcopy(module.custom_params.get("managed_instance"))
+    mi_models = models
+    managed_instance_spec = module.custom_params.get("managed_instance")
     state = module.custom_params.get("state")
+    diff = None
 
     operation, mi_id = get_id_and_operation(client, state, module)
 
     if operation == "create":
-        has_changed, managed_instance_id, message = handle_create_managed_instance(client, managed_instance_module_copy)
+        has_changed, managed_instance_id, message, diff = handle_create_managed_instance(client, managed_instance_spec, module)
     elif operation == "update":
-        has_changed, managed_instance_id, message = handle_update_managed_instance(client, managed_instance_module_copy,
-                                                                                   mi_id, module)
+        has_changed, managed_instance_id, message, diff = handle_update_managed_instance(client, managed_instance_spec,
+                                                                                         mi_id, module)
     elif operation == "delete":
-        has_changed, managed_instance_id, message = handle_delete_managed_instance(client, mi_id, mi_models, module)
+        has_changed, managed_instance_id, message, diff = handle_delete_managed_instance(client, mi_id, mi_models, module)
     else:
         module.fail_json(changed=False, msg=f"Unknown operation {operation} - "
                                             f"this is probably a bug in the module's code: please report")
-        return None, None, None  # for IDE - fail_json stops execution
+        return None, None, None, None  # for IDE - fail_json stops execution
 
-    return managed_instance_id, message, has_changed
+    return managed_instance_id, message, has_changed, diff
 
 
 def handle_delete_managed_instance(client, mi_id, mi_models, module):
@@ -769,11 +712,20 @@ def handle_delete_managed_instance(client, mi_id, mi_models, module):
 
     handle_deletion_config(delete_args, mi_models, module)
 
+    diff = get_delete_diff(mi_id)
+
+    if module.check_mode:
+        return True, mi_id, f"Managed instance {mi_id} would be deleted", diff
+
     try:
         client.delete_managed_instance(**delete_args)
         message = f"Managed instance {mi_id} deleted successfully"
         has_changed = True
-    except SpotinstClientException as exc:
+
+        name_cache = get_name_cache(module.params, "managed_instance_aws")
+        if name_cache is not None:
+            name_cache.record_deleted(mi_id)
+    except spotinst_client.SpotinstClientException as exc:
         if "MANAGED_INSTANCE_DOES_NOT_EXIST" in exc.message:
             message = f"Failed deleting managed instance - managed instance with ID {mi_id} doesn't exist"
             module.fail_json(changed=False, msg=message)
@@ -782,31 +734,53 @@ def handle_delete_managed_instance(client, mi_id, mi_models, module):
             module.fail_json(msg=message)
         has_changed = False
 
-    return has_changed, managed_instance_id, message
+    return has_changed, managed_instance_id, message, diff
 
 
-def handle_update_managed_instance(client, managed_instance_module_copy, mi_id, module):
-    managed_instance_module_copy = clean_do_not_update_fields(
-        managed_instance_module_copy,
+def handle_update_managed_instance(client, managed_instance_spec, mi_id, module):
+    managed_instance_spec = clean_do_not_update_fields(
+        managed_instance_spec,
         module.custom_params.get("do_not_update")
     )
-    ami_sdk_object = turn_to_model(managed_instance_module_copy, "managed_instance")
+    ami_sdk_object = turn_to_model(managed_instance_spec, "managed_instance")
+    diff = None
 
     try:
-        res: dict = client.update_managed_instance(mi_id, managed_instance_update=ami_sdk_object)
-        managed_instance_id = res["id"]
-        message = "Managed instance updated successfully"
-        has_changed = True
+        current_mi: dict = client.get_managed_instance(mi_id)
+        # managed instances nest their settings under "config"
+        diff = get_update_diff(ami_sdk_object, current_mi.get("config", current_mi))
+        managed_instance_id = mi_id
+
+        if has_changes(diff) and module.check_mode:
+            message = "Managed instance would be updated"
+            has_changed = True
+        elif has_changes(diff):
+            prune_model(ami_sdk_object, diff["after"])
+            res: dict = client.update_managed_instance(mi_id, managed_instance_update=ami_sdk_object)
+            managed_instance_id = res["id"]
+            message = "Managed instance updated successfully"
+            has_changed = True
+
+            name_cache = get_name_cache(module.params, "managed_instance_aws")
+            if name_cache is not None and diff["after"].get("name"):
+                name_cache.record_renamed(diff["after"]["name"], mi_id)
+        else:
+            message = "Managed instance is already up to date"
+            has_changed = False
 
         action_type = module.custom_params.get("action", None)
         should_perform_action = action_type is not None
 
-        if should_perform_action:
+        if should_perform_action and module.check_mode:
+            message = message + f" and action '{action_type}' would be started"
+            has_changed = True
+        elif should_perform_action:
             message = attempt_mi_action(
                 action_type, client, managed_instance_id, message
             )
+            has_changed = True
 
-    except SpotinstClientException as exc:
+    except spotinst_client.SpotinstClientException as exc:
         if "MANAGED_INSTANCE_DOES_NOT_EXIST" in exc.message:
             message = f"Failed updating managed instance - managed instance  with ID {mi_id} doesn't exist"
             module.fail_json(changed=False, msg=message)
@@ -815,18 +789,28 @@ def handle_update_managed_instance(client, managed_instance_module_copy, mi_id,
             module.fail_json(msg=message)
         has_changed = False
 
-    return has_changed, mi_id, message
+    return has_changed, mi_id, message, diff
 
 
-def handle_create_managed_instance(client, managed_instance_module_copy):
+def handle_create_managed_instance(client, managed_instance_spec, module):
     ami_sdk_object = turn_to_model(
-        managed_instance_module_copy, "managed_instance"
+        managed_instance_spec, "managed_instance"
     )
+    diff = get_create_diff(ami_sdk_object)
+
+    if module.check_mode:
+        return True, None, "Managed instance would be created", diff
+
     res: dict = client.create_managed_instance(managed_instance=ami_sdk_object)
     managed_instance_id = res["id"]
     message = "Managed instance created successfully"
     has_changed = True
-    return has_changed, managed_instance_id, message
+
+    name_cache = get_name_cache(module.params, "managed_instance_aws")
+    if name_cache is not None:
+        name_cache.record_created(module.params["managed_instance"]["name"], managed_instance_id)
+
+    return has_changed, managed_instance_id, message, diff
 
 
 def handle_deletion_config(delete_args, mi_models, module):
@@ -840,11 +824,11 @@ def handle_deletion_config(delete_args, mi_models, module):
             ami_backup = deletion_config.get("ami_backup")
 
             if deallocation_config is not None:
-                dealloc_sdk_object = turn_to_model(deallocation_config, mi_models.DeallocationConfig())
+                dealloc_sdk_object = turn_to_model(deallocation_config, "deallocation_config")
                 delete_args["deallocation_config"] = dealloc_sdk_object
 
             if ami_backup is not None:
-                ami_sdk_object = turn_to_model(ami_backup, mi_models.AmiBackup())
+                ami_sdk_object = turn_to_model(ami_backup, "ami_backup")
                 delete_args["ami_backup"] = ami_sdk_object
 
 
@@ -858,7 +842,7 @@ def attempt_mi_action(action_type, client, managed_instance_id, message):
             client.recycle_managed_instance(managed_instance_id)
 
         message = message + f" and action '{action_type}' started"
-    except SpotinstClientException as exc:
+    except spotinst_client.SpotinstClientException as exc:
         message = (
                 message + f" but action '{action_type}' failed, error: {exc.message}"
         )
@@ -1054,6 +1038,7 @@ def main():
         token=dict(
             type="str", fallback=(env_fallback, ["SPOTINST_TOKEN"]), no_log=True
         ),
+        rate_limit=dict(type="dict", options=rate_limit_fields),
         credentials_path=dict(type="path", default="~/.spotinst/credentials"),
         state=dict(type="str", default="present", choices=["present", "absent"]),
         account_id=dict(
@@ -1061,6 +1046,7 @@ def main():
         ),
         id=dict(type="str"),
         uniqueness_by=dict(type="str", choices=["id", "name"], default="name"),
+        name_cache=dict(type="dict", options=name_cache_fields),
         do_not_update=dict(type="list", elements="str"),
         # endregion
         # region mi-specific config fields
@@ -1072,19 +1058,9 @@ def main():
         # endregion
     )
 
-    # unchecked imports are not allowed for modules
-    # so we have to guard against the import AnsibleModule statement, even though AnsibleModule
-    # is part of ansible-core.
-    try:
-        module = SpotAnsibleModule(argument_spec=fields)
-    except (AttributeError, NameError, ImportError):
-        module = AnsibleModule(argument_spec=fields)
-        HAS_ANSIBLE_MODULE = False
+    model_converter.compile("managed_instance", actual_fields)
 
-    if not HAS_ANSIBLE_MODULE:
-        module.fail_json(
-            msg="the Spotinst Ansible module is required."
-        )
+    module = SpotAnsibleModule(argument_spec=fields, supports_check_mode=True)
 
     if not HAS_SPOTINST_SDK:
         module.fail_json(
@@ -1093,14 +1069,21 @@ def main():
 
     client = get_client(module=module)
 
-    managed_instance_id, message, has_changed = handle_managed_instance(
+    managed_instance_id, message, has_changed, diff = handle_managed_instance(
         client=client, module=module
     )
 
-    module.exit_json(
+    result = dict(
         changed=has_changed, managed_instance_id=managed_instance_id, message=message
     )
 
+    if diff is not None:
+        result["diff"] = diff
+
+    result["api_retries"] = get_retry_stats()
+
+    module.exit_json(**result)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_managed_instance_info
+version_added: 1.3.0
+short_description: Get information about Spot AWS Managed Instances
+author: Spot by NetApp (@talzur)
+description:
+  - Returns the configuration of the account's managed instances, optionally with their status.
+  - Managed instances are selected by name, by ID and by tag, and their status is fetched concurrently.
+  - I(fields) and I(exclude_fields) trim each configuration before it is returned.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - spot.cloud_modules.info
+options:
+
+  tags:
+    type: dict
+    description:
+      - Only return managed instances whose launch specification has all of these tags, given as key and value.
+      - Applies on top of I(names) and I(ids). When neither is set, every managed instance of the account is considered.
+
+  include:
+    type: list
+    elements: str
+    default: ['status']
+    choices: ['status']
+    description:
+      - Details to fetch for each managed instance, returned as C(status).
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Get the status of the managed instances tagged as databases
+      spot.cloud_modules.aws_managed_instance_info:
+        tags:
+          role: db
+        fields:
+          - id
+          - config.name
+      register: result
+"""
+
+RETURN = """
+---
+managed_instances:
+    description: The selected managed instances, with the requested fields and details.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "id": "smi-12345",
+            "config": {"name": "db-1"},
+            "status": {"status": "ACTIVE", "private_ip": "10.0.0.1"}
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK, get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import (
+    find_resources, get_resources_info, info_fields, tags_to_dict)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "managed_instance_aws")
+
+
+def get_managed_instance_tags(managed_instance):
+    # managed instances nest their settings under "config"
+    config = managed_instance.get('config') or managed_instance
+    launch_specification = (config.get('compute') or dict()).get('launch_specification') or dict()
+
+    return tags_to_dict(launch_specification.get('tags'))
+
+
+def get_managed_instances_info(client, module):
+    managed_instances = find_resources(
+        client, module, client.get_managed_instances, client.get_managed_instance, name_path=('config', 'name'),
+        get_tags=get_managed_instance_tags)
+
+    return get_resources_info(module, managed_instances, dict(
+        status=('status', client.get_managed_instance_status)))
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        tags=dict(type='dict'),
+        include=dict(type='list', elements='str', default=['status'],
+                     choices=['status']),
+        **info_fields
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    managed_instances = get_managed_instances_info(client=client, module=module)
+
+    module.exit_json(changed=False, managed_instances=managed_instances, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
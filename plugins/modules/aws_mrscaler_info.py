@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_mrscaler_info
+version_added: 1.3.0
+short_description: Get information about Spot AWS MR Scalers
+author: Spot by NetApp (@talzur)
+description:
+  - Returns the configuration of the account's MR Scalers, optionally with their instances and EMR cluster.
+  - MR Scalers are selected by name and by ID, and their details are fetched concurrently.
+  - I(fields) and I(exclude_fields) trim each configuration before it is returned.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - spot.cloud_modules.info
+options:
+
+  include:
+    type: list
+    elements: str
+    default: ['instances']
+    choices: ['instances', 'cluster']
+    description:
+      - Details to fetch for each MR Scaler, returned as C(instances) and C(cluster), the EMR cluster it manages.
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Get the instances of an MR Scaler
+      spot.cloud_modules.aws_mrscaler_info:
+        names:
+          - nightly-etl
+        exclude_fields:
+          - compute.bootstrap_actions
+          - compute.configurations
+      register: result
+"""
+
+RETURN = """
+---
+mrscalers:
+    description: The selected MR Scalers, with the requested fields and details.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "id": "simrs-12345",
+            "name": "nightly-etl",
+            "instances": [
+                {
+                    "instance_id": "i-0123456789abcdef0",
+                    "instance_group_type": "core",
+                    "status": "running"
+                }
+            ]
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK, get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import (
+    find_resources, get_resources_info, info_fields)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "mrScaler_aws")
+
+
+def get_mrscalers_info(client, module):
+    mrscalers = find_resources(client, module, client.get_all_emr, client.get_emr)
+
+    return get_resources_info(module, mrscalers, dict(
+        instances=('instances', client.get_emr_instances),
+        cluster=('cluster', client.get_emr_cluster)))
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        include=dict(type='list', elements='str', default=['instances'],
+                     choices=['instances', 'cluster']),
+        **info_fields
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    mrscalers = get_mrscalers_info(client=client, module=module)
+
+    module.exit_json(changed=False, mrscalers=mrscalers, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -41,6 +41,28 @@ options:
     description:
       - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
 
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
   state:
     type: str
     choices:
@@ -60,6 +82,24 @@ options:
       - If your group names are not unique, you may use this feature to update or delete a specific group.
         Whenever this property is set, you must set a group_id in order to update or delete a group, otherwise a group will be created.
 
+  name_cache:
+    type: dict
+    description:
+      - Optional on-disk cache of the account's cluster name to ID index, shared by the tasks of a run.
+      - When set, resolving a cluster by name lists the account once per I(ttl) instead of once per task.
+      - The cache is updated when this module creates or deletes a cluster.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the cache file on the control node. A C(<path>.lock) file is created next to it.
+      ttl:
+        type: int
+        default: 300
+        description:
+          - Seconds after which the cached index is fetched again.
+
   name:
     type: str
     description:
@@ -161,288 +201,56 @@ result:
     returned: success
     description: Created Ocean Cluster successfully
 """
-HAS_SPOTINST_SDK = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import get_create_diff, get_delete_diff, get_update_diff, has_changes, prune_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_mapping import Each, MappingConverter, ModelMapping, Nested
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_name_cache, name_cache_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import HAS_SPOTINST_SDK, sdk_models
 
-try:
-    import spotinst_sdk2 as spotinst
-    from spotinst_sdk2.client import SpotinstClientException
-
-    HAS_SPOTINST_SDK = True
-
-except ImportError:
-    pass
+models = sdk_models("ocean.aws")
 
 
 # region Request Builder Funcitons
-def expand_ocean_request(module, is_update):
-    do_not_update = module.params.get('do_not_update') or []
-
-    name = module.params.get('name')
-    controller_cluster_id = module.params.get('controller_cluster_id')
-    region = module.params.get('region')
-
-    auto_scaler = module.params.get('auto_scaler')
-    capacity = module.params.get('capacity')
-    strategy = module.params.get('strategy')
-    compute = module.params.get('compute')
-
-    ocean = spotinst.models.ocean.aws.Ocean()
-
-    if name is not None:
-        if is_update:
-            if 'name' not in do_not_update:
-                ocean.name = name
-        else:
-            ocean.name = name
-
-    if controller_cluster_id is not None:
-        if is_update:
-            if 'controller_cluster_id' not in do_not_update:
-                ocean.controller_cluster_id = controller_cluster_id
-        else:
-            ocean.controller_cluster_id = controller_cluster_id
-
-    if region is not None and not is_update:
-        ocean.region = region
-
-    # Auto Scaler
-    if auto_scaler is not None:
-        if is_update:
-            if 'auto_scaler' not in do_not_update:
-                expand_auto_scaler(ocean=ocean, auto_scaler=auto_scaler)
-        else:
-            expand_auto_scaler(ocean=ocean, auto_scaler=auto_scaler)
-    # Capacity
-    if capacity is not None:
-        if is_update:
-            if 'capacity' not in do_not_update:
-                expand_capacity(ocean=ocean, capacity=capacity)
-        else:
-            expand_capacity(ocean=ocean, capacity=capacity)
-    # Strategy
-    if strategy is not None:
-        if is_update:
-            if 'strategy' not in do_not_update:
-                expand_strategy(ocean=ocean, strategy=strategy)
-        else:
-            expand_strategy(ocean=ocean, strategy=strategy)
-    # Compute
-    if compute is not None:
-        if is_update:
-            if 'compute' not in do_not_update:
-                expand_compute(ocean=ocean, compute=compute)
-        else:
-            expand_compute(ocean=ocean, compute=compute)
-
-    return ocean
-
-
-# region Auto Scaler
-def expand_auto_scaler(ocean, auto_scaler):
-    ocean_auto_scaler = spotinst.models.ocean.aws.AutoScaler()
-
-    is_enabled = auto_scaler.get('is_enabled')
-    cooldown = auto_scaler.get('cooldown')
-    resource_limits = auto_scaler.get('resource_limits')
-    down = auto_scaler.get('down')
-    headroom = auto_scaler.get('headroom')
-    is_auto_config = auto_scaler.get('is_auto_config')
-
-    if is_enabled is not None:
-        ocean_auto_scaler.is_enabled = is_enabled
-    if cooldown is not None:
-        ocean_auto_scaler.cooldown = cooldown
-    if resource_limits is not None:
-        expand_resource_limits(ocean_auto_scaler=ocean_auto_scaler, resource_limits=resource_limits)
-    if down is not None:
-        expand_down(ocean_auto_scaler=ocean_auto_scaler, down=down)
-    if headroom is not None:
-        expand_headroom(ocean_auto_scaler=ocean_auto_scaler, headroom=headroom)
-    if is_auto_config is not None:
-        ocean_auto_scaler.is_auto_config = is_auto_config
-
-    ocean.auto_scaler = ocean_auto_scaler
-
-
-def expand_resource_limits(ocean_auto_scaler, resource_limits):
-    ocean_resource_limits = spotinst.models.ocean.aws.ResourceLimits()
-
-    max_memory_gib = resource_limits.get('max_memory_gib')
-    max_vCpu = resource_limits.get('max_vCpu')
-
-    if max_memory_gib is not None:
-        ocean_resource_limits.max_memory_gib = max_memory_gib
-    if max_vCpu is not None:
-        ocean_resource_limits.max_vCpu = max_vCpu
-
-    ocean_auto_scaler.resource_limits = ocean_resource_limits
-
-
-def expand_down(ocean_auto_scaler, down):
-    ocean_down = spotinst.models.ocean.aws.Down()
-    evaluation_periods = down.get('evaluation_periods')
-
-    if evaluation_periods is not None:
-        ocean_down.evaluation_periods = evaluation_periods
-
-    ocean_auto_scaler.down = ocean_down
-
-
-def expand_headroom(ocean_auto_scaler, headroom):
-    ocean_headroom = spotinst.models.ocean.aws.Headroom()
-
-    cpu_per_unit = headroom.get('cpu_per_unit')
-    memory_per_unit = headroom.get('memory_per_unit')
-    num_of_units = headroom.get('num_of_units')
-
-    if cpu_per_unit is not None:
-        ocean_headroom.cpu_per_unit = cpu_per_unit
-    if memory_per_unit is not None:
-        ocean_headroom.memory_per_unit = memory_per_unit
-    if num_of_units is not None:
-        ocean_headroom.num_of_units = num_of_units
-
-    ocean_auto_scaler.headroom = ocean_headroom
-# endregion
-
-
-# region Capacity
-def expand_capacity(ocean, capacity):
-    ocean_capacity = spotinst.models.ocean.aws.Capacity()
-
-    minimum = capacity.get('minimum')
-    maximum = capacity.get('maximum')
-    target = capacity.get('target')
-
-    if minimum is not None:
-        ocean_capacity.minimum = minimum
-    if maximum is not None:
-        ocean_capacity.maximum = maximum
-    if target is not None:
-        ocean_capacity.target = target
-
-    ocean.capacity = ocean_capacity
-# endregion
-
-
-# region Strategy
-def expand_strategy(ocean, strategy):
-    ocean_strategy = spotinst.models.ocean.aws.Strategy()
-
-    utilize_reserved_instances = strategy.get('utilize_reserved_instances')
-    fallback_to_od = strategy.get('fallback_to_od')
-    spot_percentage = strategy.get('spot_percentage')
-
-    if utilize_reserved_instances is not None:
-        ocean_strategy.utilize_reserved_instances = utilize_reserved_instances
-    if fallback_to_od is not None:
-        ocean_strategy.fallback_to_od = fallback_to_od
-    if spot_percentage is not None:
-        ocean_strategy.spot_percentage = spot_percentage
-
-    ocean.strategy = ocean_strategy
-# endregion
-
-
-# region Compute
-def expand_compute(ocean, compute):
-    ocean_compute = spotinst.models.ocean.aws.Compute()
-
-    instance_types = compute.get('instance_types')
-    subnet_ids = compute.get('subnet_ids')
-    launch_specification = compute.get('launch_specification')
-
-    if instance_types is not None:
-        expand_instance_types(ocean_compute=ocean_compute, instance_types=instance_types)
-    if subnet_ids is not None:
-        ocean_compute.subnet_ids = subnet_ids
-    if launch_specification is not None:
-        expand_launch_specification(ocean_compute=ocean_compute, launch_specification=launch_specification)
-
-    ocean.compute = ocean_compute
-
-
-def expand_instance_types(ocean_compute, instance_types):
-    ocean_instance_types = spotinst.models.ocean.aws.InstanceTypes()
-
-    whitelist = instance_types.get('whitelist')
-    blacklist = instance_types.get('blacklist')
-
-    if whitelist is not None:
-        ocean_instance_types.whitelist = whitelist
-    if blacklist is not None:
-        ocean_instance_types.blacklist = blacklist
-
-    ocean_compute.instance_types = ocean_instance_types
-
-
-def expand_launch_specification(ocean_compute, launch_specification):
-    ocean_launch_specs = spotinst.models.ocean.aws.LaunchSpecifications()
-
-    security_group_ids = launch_specification.get('security_group_ids')
-    image_id = launch_specification.get('image_id')
-    iam_instance_profile = launch_specification.get('iam_instance_profile')
-    key_pair = launch_specification.get('key_pair')
-    user_data = launch_specification.get('user_data')
-    tags = launch_specification.get('tags')
-
-    if security_group_ids is not None:
-        ocean_launch_specs.security_group_ids = security_group_ids
-
-    if image_id is not None:
-        ocean_launch_specs.image_id = image_id
-
-    if iam_instance_profile is not None:
-        expand_iam_instance_profile(ocean_launch_specs=ocean_launch_specs, iam_instance_profile=iam_instance_profile)
-
-    if key_pair is not None:
-        ocean_launch_specs.key_pair = key_pair
-
-    if user_data is not None:
-        ocean_launch_specs.user_data = user_data
-
-    if tags is not None:
-        expand_tags(ocean_launch_specs=ocean_launch_specs, tags=tags)
-
-    ocean_compute.launch_specification = ocean_launch_specs
-
-
-def expand_iam_instance_profile(ocean_launch_specs, iam_instance_profile):
-    ocean_iam_instance_profile = spotinst.models.ocean.aws.IamInstanceProfile()
-
-    arn = iam_instance_profile.get('arn')
-    name = iam_instance_profile.get('name')
-
-    if arn is not None:
-        ocean_iam_instance_profile.arn = arn
-    if name is not None:
-        ocean_iam_instance_profile.name = name
-
-    ocean_launch_specs.iam_instance_profile = ocean_iam_instance_profile
-
-
-def expand_tags(ocean_launch_specs, tags):
-    tag_list = []
-
-    for single_tag in tags:
-        tag = spotinst.models.ocean.aws.Tag()
-
-        tag_key = single_tag.get('tag_key')
-        tag_value = single_tag.get('tag_value')
-
-        if tag_key is not None:
-            tag.tag_key = tag_key
-        if tag_value is not None:
-            tag.tag_value = tag_value
-
-        tag_list.append(tag)
-
-    ocean_launch_specs.tags = tag_list
-# endregion
+auto_scaler_mapping = ModelMapping('AutoScaler', ('is_enabled', 'cooldown', 'is_auto_config'), members=[
+    Nested('resource_limits', ModelMapping('ResourceLimits', ('max_memory_gib', 'max_vCpu')), 'resource_limits'),
+    Nested('down', ModelMapping('Down', ('evaluation_periods',)), 'down'),
+    Nested('headroom', ModelMapping('Headroom', ('cpu_per_unit', 'memory_per_unit', 'num_of_units')), 'headroom'),
+])
+
+launch_specification_mapping = ModelMapping(
+    'LaunchSpecifications', ('security_group_ids', 'image_id', 'key_pair', 'user_data'), members=[
+        Nested('iam_instance_profile', ModelMapping('IamInstanceProfile', ('arn', 'name')), 'iam_instance_profile'),
+        Each('tags', ModelMapping('Tag', ('tag_key', 'tag_value')), 'tags'),
+    ])
+
+compute_mapping = ModelMapping('Compute', ('subnet_ids',), members=[
+    Nested('instance_types', ModelMapping('InstanceTypes', ('whitelist', 'blacklist')), 'instance_types'),
+    Nested('launch_specification', launch_specification_mapping, 'launch_specification'),
+])
+
+ocean_converter = MappingConverter(models, ModelMapping(
+    'Ocean', ('name', 'controller_cluster_id', 'region'), create_only=('region',),
+    do_not_update=('name', 'controller_cluster_id', 'auto_scaler', 'capacity', 'strategy', 'compute'), members=[
+        Nested('auto_scaler', auto_scaler_mapping, 'auto_scaler'),
+        Nested('capacity', ModelMapping('Capacity', ('minimum', 'maximum', 'target')), 'capacity'),
+        Nested('strategy', ModelMapping('Strategy', ('utilize_reserved_instances', 'fallback_to_od', 'spot_percentage')),
+               'strategy'),
+        Nested('compute', compute_mapping, 'compute'),
+    ]))
+
+
+def expand_ocean_request(module, is_update, assigned=None):
+    """
+    Build the Ocean model of ``module.params``. Updates leave out the region,
+    and the options listed in ``do_not_update``. See ``MappingConverter.convert``
+    for ``assigned``.
+    """
+    return ocean_converter.convert(module.params, is_update, module.params.get('do_not_update'), assigned)
 # endregion
 
 
@@ -453,17 +261,18 @@ def handle_ocean(client, module):
     group_id = None
     message = None
     has_changed = False
+    diff = None
 
     if request_type == "create":
-        group_id, message, has_changed = handle_create(client=client, module=module)
+        group_id, message, has_changed, diff = handle_create(client=client, module=module)
     elif request_type == "update":
-        group_id, message, has_changed = handle_update(client=client, module=module, ocean_id=ocean_id)
+        group_id, message, has_changed, diff = handle_update(client=client, module=module, ocean_id=ocean_id)
     elif request_type == "delete":
-        group_id, message, has_changed = handle_delete(client=client, module=module, ocean_id=ocean_id)
+        group_id, message, has_changed, diff = handle_delete(client=client, module=module, ocean_id=ocean_id)
     else:
         module.fail_json(msg="Action Not Allowed")
 
-    return group_id, message, has_changed
+    return group_id, message, has_changed, diff
 
 
 def get_request_type_and_id(client, module):
@@ -482,7 +291,8 @@ def get_request_type_and_id(client, module):
         else:
             ocean_id = external_ocean_id
     else:
-        clusters = client.get_all_ocean_cluster()
+        name_cache = get_name_cache(module.params, "ocean_aws")
+        clusters = find_resources_by_name(client, name, client.get_all_ocean_cluster, limit=1, name_cache=name_cache)
         should_create, ocean_id = find_clusters_with_same_name(clusters=clusters, name=name)
 
     if should_create is True:
@@ -511,71 +321,71 @@ def find_clusters_with_same_name(clusters, name):
 
 
 def get_client(module):
-    # Retrieve creds file variables
-    creds_file_loaded_vars = dict()
-
-    credentials_path = module.params.get('credentials_path')
-
-    if credentials_path is not None:
-        try:
-            with open(credentials_path, "r") as creds:
-                for line in creds:
-                    eq_index = line.find(':')
-                    var_name = line[:eq_index].strip()
-                    string_value = line[eq_index + 1:].strip()
-                    creds_file_loaded_vars[var_name] = string_value
-        except IOError:
-            pass
-    # End of creds file retrieval
-
-    token = module.params.get('token')
-    if not token:
-        token = creds_file_loaded_vars.get("token")
-
-    account = module.params.get('account_id')
-    if not account:
-        account = creds_file_loaded_vars.get("account")
-
-    if account is not None:
-        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
-    else:
-        session = spotinst.SpotinstSession(auth_token=token)
-
-    client = session.client("ocean_aws")
-
-    return client
+    return get_spot_client(module.params, "ocean_aws")
 # endregion
 
 
 # region Request Functions
 def handle_create(client, module):
     cluster_request = expand_ocean_request(module=module, is_update=False)
+    diff = get_create_diff(cluster_request)
+
+    if module.check_mode:
+        return None, 'Ocean Cluster would be created', True, diff
+
     ocean = client.create_ocean_cluster(ocean=cluster_request)
 
     ocean_id = ocean['id']
     message = 'Created Ocean Cluster successfully'
     has_changed = True
 
-    return ocean_id, message, has_changed
+    name_cache = get_name_cache(module.params, "ocean_aws")
+    if name_cache is not None:
+        name_cache.record_created(module.params.get('name'), ocean_id)
+
+    return ocean_id, message, has_changed, diff
 
 
 def handle_update(client, module, ocean_id):
     cluster_request = expand_ocean_request(module=module, is_update=True)
+    current_cluster = client.get_ocean_cluster(ocean_id=ocean_id)
+    diff = get_update_diff(cluster_request, current_cluster)
+
+    if not has_changes(diff):
+        return ocean_id, 'Ocean Cluster is already up to date', False, diff
+
+    if module.check_mode:
+        return ocean_id, 'Ocean Cluster would be updated', True, diff
+
+    prune_model(cluster_request, diff['after'])
     client.update_ocean_cluster(ocean_id=ocean_id, ocean=cluster_request)
 
     message = 'Updated Ocean Cluster successfully'
     has_changed = True
 
-    return ocean_id, message, has_changed
+    name_cache = get_name_cache(module.params, "ocean_aws")
+    if name_cache is not None and diff['after'].get('name'):
+        name_cache.record_renamed(diff['after']['name'], ocean_id)
+
+    return ocean_id, message, has_changed, diff
 
 
 def handle_delete(client, module, ocean_id):
+    diff = get_delete_diff(ocean_id)
+
+    if module.check_mode:
+        return ocean_id, 'Ocean Cluster would be deleted', True, diff
+
     client.delete_ocean_cluster(ocean_id=ocean_id)
 
     message = 'Deleted Ocean Cluster successfully'
     has_changed = True
 
-    return ocean_id, message, has_changed
+    name_cache = get_name_cache(module.params, "ocean_aws")
+    if name_cache is not None:
+        name_cache.record_deleted(ocean_id)
+
+    return ocean_id, message, has_changed, diff
 # endregion
 
 
@@ -583,9 +393,11 @@ def main():
     fields = dict(
         account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
         token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN'])),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
         state=dict(type='str', default='present', choices=['present', 'absent']),
         id=dict(type='str'),
         uniqueness_by=dict(type='str', default='name', choices=['name', 'id']),
+        name_cache=dict(type='dict', options=name_cache_fields),
         credentials_path=dict(type='path', default="~/.spotinst/credentials"),
 
         name=dict(type='str'),
@@ -596,16 +408,23 @@ def main():
         strategy=dict(type='dict'),
         compute=dict(type='dict'))
 
-    module = AnsibleModule(argument_spec=fields)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
 
     if not HAS_SPOTINST_SDK:
         module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
 
     client = get_client(module=module)
 
-    group_id, message, has_changed = handle_ocean(client=client, module=module)
+    group_id, message, has_changed, diff = handle_ocean(client=client, module=module)
+
+    result = dict(changed=has_changed, group_id=group_id, message=message, instances=[])
+
+    if diff is not None:
+        result['diff'] = diff
+
+    result['api_retries'] = get_retry_stats()
 
-    module.exit_json(changed=has_changed, group_id=group_id, message=message, instances=[])
+    module.exit_json(**result)
 
 
 if __name__ == '__main__':
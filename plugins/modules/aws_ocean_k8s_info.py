@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: aws_ocean_k8s_info
+version_added: 1.3.0
+short_description: Get information about Spot Ocean Kubernetes clusters
+author: Spot by NetApp (@talzur)
+description:
+  - Returns the configuration of the account's AWS Ocean clusters, optionally with their instances and launch specs.
+  - Clusters are selected by name, by ID and by tag, and their details are fetched concurrently.
+  - I(fields) and I(exclude_fields) trim each configuration before it is returned.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - spot.cloud_modules.info
+options:
+
+  tags:
+    type: dict
+    description:
+      - Only return clusters whose launch specification has all of these tags, given as key and value.
+      - Applies on top of I(names) and I(ids). When neither is set, every cluster of the account is considered.
+
+  include:
+    type: list
+    elements: str
+    default: ['instances']
+    choices: ['instances', 'launch_specs']
+    description:
+      - Details to fetch for each cluster, returned as C(instances) and C(launch_specs).
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Get the nodes and launch specs of the production cluster
+      spot.cloud_modules.aws_ocean_k8s_info:
+        names:
+          - prod
+        include:
+          - instances
+          - launch_specs
+        fields:
+          - id
+          - name
+          - capacity
+      register: result
+"""
+
+RETURN = """
+---
+clusters:
+    description: The selected clusters, with the requested fields and details.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "id": "o-12345",
+            "name": "prod",
+            "capacity": {"minimum": 0, "maximum": 100, "target": 12},
+            "instances": [
+                {
+                    "instance_id": "i-0123456789abcdef0",
+                    "instance_type": "c5.large",
+                    "private_ip": "10.0.0.1"
+                }
+            ]
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK, get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import (
+    find_resources, get_resources_info, info_fields, tags_to_dict)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ocean_aws import get_cluster_instances, get_cluster_launch_specs
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "ocean_aws")
+
+
+def get_cluster_tags(cluster):
+    launch_specification = (cluster.get('compute') or dict()).get('launch_specification') or dict()
+
+    return tags_to_dict(launch_specification.get('tags'))
+
+
+def get_clusters_info(client, module):
+    clusters = find_resources(
+        client, module, client.get_all_ocean_cluster, client.get_ocean_cluster, get_tags=get_cluster_tags)
+
+    return get_resources_info(module, clusters, dict(
+        instances=('instances', lambda ocean_id: get_cluster_instances(client, ocean_id)),
+        launch_specs=('launch_specs', lambda ocean_id: get_cluster_launch_specs(client, ocean_id))))
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        tags=dict(type='dict'),
+        include=dict(type='list', elements='str', default=['instances'],
+                     choices=['instances', 'launch_specs']),
+        **info_fields
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    clusters = get_clusters_info(client=client, module=module)
+
+    module.exit_json(changed=False, clusters=clusters, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
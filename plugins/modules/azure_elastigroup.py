@@ -26,6 +26,27 @@ options:
         type: str
         description:
             - "Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path"
+    rate_limit:
+        type: dict
+        description:
+            - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+            - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+              and wait for the next token when the bucket is empty. Retried requests take a token as well.
+        suboptions:
+            path:
+                type: path
+                required: true
+                description:
+                    - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+            rate:
+                type: float
+                required: true
+                description:
+                    - Requests per second allowed for each Spot account.
+            burst:
+                type: int
+                description:
+                    - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
     credentials_path:
         type: str
         default: "/root/.spotinst/credentials"
@@ -55,12 +76,30 @@ options:
         description:
             - "If your Stateful Node names are not unique, you may use this feature to update or delete a specific node."
             - "Whenever this property is set, you must set a an `id` in order to update or delete elastigroup, otherwise elastigroup node will be created."
+    name_cache:
+        type: dict
+        description:
+            - Optional on-disk cache of the account's elastigroup name to ID index, shared by the tasks of a run.
+            - When set, resolving an elastigroup by name lists the account once per I(ttl) instead of once per task.
+            - The cache is updated when this module creates or deletes an elastigroup.
+        suboptions:
+            path:
+                type: path
+                required: true
+                description:
+                    - Path of the cache file on the control node. A C(<path>.lock) file is created next to it.
+            ttl:
+                type: int
+                default: 300
+                description:
+                    - Seconds after which the cached index is fetched again.
     do_not_update:
         type: list
         elements: str
         description:
             - "A list of dotted paths to attributes that you don't wish to update during an update operation."
             - "Example: Specifying `compute.product` will make sure that this attribute is never updated."
+            - "Path segments may be list indexes, or C(*) for every key or list item, for instance `compute.launch_specification.tags.*.tag_value`."
     elastigroup:
         type: dict
         description: "Describe the desired properties of the azure elastigroup under this object."
@@ -773,21 +812,19 @@ group_id:
     sample: sig-15b1a394
 """
 
-HAS_SPOTINST_SDK = False
-
-
 from ansible.module_utils.basic import env_fallback
 from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ansible_module import SpotAnsibleModule
-import copy
-
-try:
-    import spotinst_sdk2 as spotinst
-    from spotinst_sdk2.client import SpotinstClientException
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import get_create_diff, get_delete_diff, get_update_diff, has_changes, prune_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_do_not_update import clean_do_not_update_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_name_cache, name_cache_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_model import ModelConverter
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import HAS_SPOTINST_SDK, sdk_models, spotinst_client
 
-    HAS_SPOTINST_SDK = True
-
-except ImportError as e:
-    pass
+models = sdk_models("elastigroup.azure_v3")
 
 
 CLS_NAME_BY_ATTR_NAME = {
@@ -812,9 +849,12 @@ LIST_MEMBER_CLS_NAME_BY_ATTR_NAME = {
     "elastigroup.compute.launch_specification.load_balancers_config.load_balancers": "LoadBalancer",
     "elastigroup.compute.launch_specification.network.network_interfaces.application_security_groups": "ApplicationSecurityGroup",
     "elastigroup.compute.launch_specification.network.network_interfaces.additional_ip_configurations": "AdditionalIpConfiguration",
-    "elastigroup.compute.launch_specification.secrets.vault_certificates": "VaultCertificate"
+    "elastigroup.compute.launch_specification.secrets.vault_certificates": "VaultCertificate",
+    "elastigroup.compute.launch_specification.network.network_interfaces.public_ips": "PublicIp"
 }
 
+model_converter = ModelConverter(models, dict(LIST_MEMBER_CLS_NAME_BY_ATTR_NAME, **CLS_NAME_BY_ATTR_NAME))
+
 
 def to_snake_case(camel_str):
     import re
@@ -823,85 +863,12 @@ def to_snake_case(camel_str):
     return ret_val
 
 
-def to_pascal_case(snake_str):
-    return "".join(word.title() for word in snake_str.split("_"))
-
-
-def is_primitive(some_obj):
-    return any(isinstance(some_obj, x) for x in [bool, float, int, str])
-
-
-def find_in_overrides(curr_path):
-    return CLS_NAME_BY_ATTR_NAME.get(curr_path, None) or LIST_MEMBER_CLS_NAME_BY_ATTR_NAME.get(curr_path, None)
-
-
 def get_client(module):
-    creds_file_loaded_vars = dict()
-
-    credentials_path = module.custom_params.get("credentials_path")
-
-    if credentials_path is not None:
-        try:
-            with open(credentials_path, "r") as creds:
-                for line in creds:
-                    eq_index = line.find(":")
-                    var_name = line[:eq_index].strip()
-                    string_value = line[eq_index + 1:].strip()
-                    creds_file_loaded_vars[var_name] = string_value
-        except IOError:
-            pass
-    # End of creds file retrieval
-
-    token = module.custom_params.get("token")
-    if not token:
-        token = creds_file_loaded_vars.get("token")
-
-    account = module.custom_params.get("account_id")
-
-    if not account:
-        account = creds_file_loaded_vars.get("account")
-
-    if account is not None:
-        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
-    else:
-        session = spotinst.SpotinstSession(auth_token=token)
-
-    client = session.client("elastigroup_azure_v3")
-
-    return client
-
+    return get_spot_client(module.params, "elastigroup_azure_v3")
 
-def turn_to_model(content, field_name: str, curr_path=None):
-    if content is None:
-        return None
-    elif is_primitive(content):
-        return content
-    elif isinstance(content, list):
-        new_l = []
 
-        for item in content:
-            value = turn_to_model(item, field_name, curr_path)
-            new_l.append(value)
-
-        return new_l
-
-    elif isinstance(content, dict):
-        if curr_path is not None:
-            curr_path += "." + field_name
-        else:
-            curr_path = field_name
-
-        override = find_in_overrides(curr_path)
-        key_to_use = override if override else to_pascal_case(field_name)
-
-        class_ = getattr(spotinst.models.elastigroup.azure_v3, key_to_use)
-        instance = class_()
-
-        for key, value in content.items():
-            new_value = turn_to_model(value, key, curr_path)
-            setattr(instance, key, new_value)
-
-        return instance
+def turn_to_model(content, field_name: str):
+    return model_converter.convert(content, field_name)
 
 
 def find_group_id_with_same_name(groups, name):
@@ -913,32 +880,10 @@ def find_group_id_with_same_name(groups, name):
     return ret_val
 
 
-def clean_do_not_update_fields(
-        elastigroup_module_copy: dict, do_not_update_list: list
-):
-    ret_val = elastigroup_module_copy
-
-    # avoid deleting parent dicts before children
-    do_not_update_list = sorted(do_not_update_list, key=len, reverse=True)
-
-    for dotted_path in do_not_update_list:
-        curr_dict = elastigroup_module_copy
-        path_as_list = dotted_path.split(".")
-        last_part_of_path = path_as_list[-1]
-
-        for path_part in path_as_list[:-1]:
-            new_dict = curr_dict.get(path_part)
-            curr_dict = new_dict
-
-        if curr_dict.get(last_part_of_path) is not None:
-            del curr_dict[last_part_of_path]
-
-    return ret_val
-
-
 def get_id_and_operation(client, state: str, module):
     operation, id = None, None
     uniqueness_by = module.custom_params.get("uniqueness_by")
+    name_cache = get_name_cache(module.params, "elastigroup_azure_v3")
     manually_provided_group_id = module.custom_params.get("id")
     group = module.custom_params.get("elastigroup")
 
@@ -951,8 +896,8 @@ def get_id_and_operation(client, state: str, module):
                 id = manually_provided_group_id
                 operation = "update"
         else:
-            all_groups = client.get_elastigroups()
             name = group["name"]
+            all_groups = find_resources_by_name(client, name, client.get_elastigroups, name_cache=name_cache)
             groups_with_name = find_group_id_with_same_name(all_groups, name)
 
             if len(groups_with_name) == 0:
@@ -974,8 +919,8 @@ def get_id_and_operation(client, state: str, module):
                 msg = "Failed deleting elastigroup - 'uniqueness_by' is set to `id` but parameter 'id' was not provided"
                 module.fail_json(changed=False, msg=msg)
         else:
-            all_groups = client.get_elastigroups()
             name = group["name"]
+            all_groups = find_resources_by_name(client, name, client.get_elastigroups, name_cache=name_cache)
             groups_with_name = find_group_id_with_same_name(all_groups, name)
 
             if len(groups_with_name) == 1:
@@ -994,35 +939,45 @@ def get_id_and_operation(client, state: str, module):
 
 
 def handle_elastigroup(client, module):
-    eg_models = spotinst.models.elastigroup.azure_v3
-    elastigroup_module_copy = copy.deepcopy(module.custom_params.get("elastigroup"))
+    eg_models = models
+    elastigroup_spec = module.custom_params.get("elastigroup")
     state = module.custom_params.get("state")
+    diff = None
 
     operation, id = get_id_and_operation(client, state, module)
 
     if operation == "create":
-        has_changed, group_id, message = handle_create_elastigroup(client, elastigroup_module_copy)
+        has_changed, group_id, message, diff = handle_create_elastigroup(client, elastigroup_spec, module)
     elif operation == "update":
-        has_changed, group_id, message = handle_update_elastigroup(client, elastigroup_module_copy, id, module)
+        has_changed, group_id, message, diff = handle_update_elastigroup(client, elastigroup_spec, id, module)
     elif operation == "delete":
-        has_changed, group_id, message = handle_delete_elastigroup(client, id, eg_models, module)
+        has_changed, group_id, message, diff = handle_delete_elastigroup(client, id, eg_models, module)
     else:
         module.fail_json(changed=False, msg=f"Unknown operation {operation} - "
                                             f"this is probably a bug in the module's code: please report")
-        return None, None, None  # for IDE - fail_json stops execution
+        return None, None, None, None  # for IDE - fail_json stops execution
 
-    return group_id, message, has_changed
+    return group_id, message, has_changed, diff
 
 
 def handle_delete_elastigroup(client, id, eg_models, module):
     group_id = id
     delete_args = dict(group_id=group_id)
 
+    diff = get_delete_diff(id)
+
+    if module.check_mode:
+        return True, id, f"Elastigroup {id} would be deleted", diff
+
     try:
         client.delete_elastigroup(**delete_args)
         message = f"Elastigroup {group_id} deleted successfully"
         has_changed = True
-    except SpotinstClientException as exc:
+
+        name_cache = get_name_cache(module.params, "elastigroup_azure_v3")
+        if name_cache is not None:
+            name_cache.record_deleted(group_id)
+    except spotinst_client.SpotinstClientException as exc:
         if "RESOURCE_DOES_NOT_EXIST" in exc.message:
             message = f"Failed deleting elastigroup - Elastigroup with ID {group_id} doesn't exist"
             module.fail_json(changed=False, msg=message)
@@ -1031,23 +986,40 @@ def handle_delete_elastigroup(client, id, eg_models, module):
             module.fail_json(msg=message)
         has_changed = False
 
-    return has_changed, group_id, message
+    return has_changed, group_id, message, diff
 
 
-def handle_update_elastigroup(client, elastigroup_module_copy, id, module):
-    elastigroup_module_copy = clean_do_not_update_fields(
-        elastigroup_module_copy,
+def handle_update_elastigroup(client, elastigroup_spec, id, module):
+    elastigroup_spec = clean_do_not_update_fields(
+        elastigroup_spec,
         module.custom_params.get("do_not_update")
     )
-    ami_sdk_object = turn_to_model(elastigroup_module_copy, "elastigroup")
+    ami_sdk_object = turn_to_model(elastigroup_spec, "elastigroup")
+    group_id = id
+    diff = None
 
     try:
-        res: dict = client.update_elastigroup(group_id=id, group_update=ami_sdk_object)
-        group_id = res["id"]
-        message = "Elastigroup updated successfully"
-        has_changed = True
+        current_group: dict = client.get_elastigroup(group_id=id)
+        diff = get_update_diff(ami_sdk_object, current_group)
+
+        if has_changes(diff) and module.check_mode:
+            message = "Elastigroup would be updated"
+            has_changed = True
+        elif has_changes(diff):
+            prune_model(ami_sdk_object, diff["after"])
+            res: dict = client.update_elastigroup(group_id=id, group_update=ami_sdk_object)
+            group_id = res["id"]
+            message = "Elastigroup updated successfully"
+            has_changed = True
+
+            name_cache = get_name_cache(module.params, "elastigroup_azure_v3")
+            if name_cache is not None and diff["after"].get("name"):
+                name_cache.record_renamed(diff["after"]["name"], group_id)
+        else:
+            message = "Elastigroup is already up to date"
+            has_changed = False
 
-    except SpotinstClientException as exc:
+    except spotinst_client.SpotinstClientException as exc:
         if "RESOURCE_DOES_NOT_EXIST" in exc.message:
             message = f"Failed updating elastigroup - elastigroup with ID {group_id} doesn't exist"
             module.fail_json(changed=False, msg=message)
@@ -1056,19 +1028,29 @@ def handle_update_elastigroup(client, elastigroup_module_copy, id, module):
             module.fail_json(msg=message)
         has_changed = False
 
-    return has_changed, group_id, message
+    return has_changed, group_id, message, diff
 
 
-def handle_create_elastigroup(client, elastigroup_module_copy):
+def handle_create_elastigroup(client, elastigroup_spec, module):
     ami_sdk_object = turn_to_model(
-        elastigroup_module_copy, "elastigroup"
+        elastigroup_spec, "elastigroup"
     )
 
+    diff = get_create_diff(ami_sdk_object)
+
+    if module.check_mode:
+        return True, None, "Elastigroup would be created", diff
+
     res: dict = client.create_elastigroup(group=ami_sdk_object)
     group_id = res["id"]
     message = "Elastigroup created successfully"
     has_changed = True
-    return has_changed, group_id, message
+
+    name_cache = get_name_cache(module.params, "elastigroup_azure_v3")
+    if name_cache is not None:
+        name_cache.record_created(module.params["elastigroup"]["name"], group_id)
+
+    return has_changed, group_id, message, diff
 
 
 def main():
@@ -1224,7 +1206,7 @@ def main():
     login_fields = dict(
         ssh_public_key=dict(type="str"),
         user_name=dict(type="str"),
-        password=dict(type="str"),
+        password=dict(type="str", no_log=True),
     )
 
     managed_service_identity_fields = dict(
@@ -1283,14 +1265,14 @@ def main():
 
     secret_fields = dict(
         source_vault=dict(type="dict", options=source_vault_fields),
-        certificate_url=dict(type="list", elements="dict", options=vault_certificate_fields),
+        vault_certificates=dict(type="list", elements="dict", options=vault_certificate_fields),
     )
 
     tags_fields = dict(tag_key=dict(type="str"), tag_value=dict(type="str"))
 
     launch_spec_fields = dict(
         boot_diagnostics=dict(type="dict", options=boot_diagnostics_fields),
-        custom_data=dict(type="str"),
+        custom_data=dict(type="str", no_log=True),
         data_disks=dict(type="list", elements="dict", options=data_disk_fields),
         extensions=dict(type="list", elements="dict", options=extension_fields),
         image=dict(type="dict", options=image_fields),
@@ -1337,6 +1319,7 @@ def main():
         token=dict(
             type="str", fallback=(env_fallback, ["SPOTINST_TOKEN"]), no_log=True
         ),
+        rate_limit=dict(type="dict", options=rate_limit_fields),
         credentials_path=dict(type="path", default="~/.spotinst/credentials"),
         state=dict(type="str", default="present", choices=["present", "absent"]),
         account_id=dict(
@@ -1344,6 +1327,7 @@ def main():
         ),
         id=dict(type="str"),
         uniqueness_by=dict(type="str", choices=["id", "name"], default="name"),
+        name_cache=dict(type="dict", options=name_cache_fields),
         do_not_update=dict(type="list", elements="str"),
         # endregion
 
@@ -1352,7 +1336,9 @@ def main():
         # endregion
     )
 
-    module = SpotAnsibleModule(argument_spec=fields)
+    model_converter.compile("elastigroup", actual_fields)
+
+    module = SpotAnsibleModule(argument_spec=fields, supports_check_mode=True)
 
     if not HAS_SPOTINST_SDK:
         module.fail_json(
@@ -1361,14 +1347,21 @@ def main():
 
     client = get_client(module=module)
 
-    group_id, message, has_changed = handle_elastigroup(
+    group_id, message, has_changed, diff = handle_elastigroup(
         client=client, module=module
     )
 
-    module.exit_json(
+    result = dict(
         changed=has_changed, group_id=group_id, message=message
     )
 
+    if diff is not None:
+        result["diff"] = diff
+
+    result["api_retries"] = get_retry_stats()
+
+    module.exit_json(**result)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+module: azure_stateful_node_info
+version_added: 1.3.0
+short_description: Get information about Spot Azure Stateful Nodes
+author: Spot by NetApp (@talzur)
+description:
+  - Returns the configuration of the account's Azure stateful nodes, optionally with their status and
+    attached resources.
+  - Stateful nodes are selected by name, by ID and by tag, and their details are fetched concurrently.
+  - I(fields) and I(exclude_fields) trim each configuration before it is returned.
+extends_documentation_fragment:
+  - spot.cloud_modules.requirements
+  - spot.cloud_modules.info
+options:
+
+  tags:
+    type: dict
+    description:
+      - Only return stateful nodes whose launch specification has all of these tags, given as key and value.
+      - Applies on top of I(names) and I(ids). When neither is set, every stateful node of the account is considered.
+
+  include:
+    type: list
+    elements: str
+    default: ['status']
+    choices: ['status', 'resources']
+    description:
+      - Details to fetch for each stateful node, returned as C(status) and C(resources), the node's
+        attached storage and network interfaces.
+"""
+
+EXAMPLES = """
+- hosts: localhost
+  tasks:
+    - name: Get the status and disks of a stateful node
+      spot.cloud_modules.azure_stateful_node_info:
+        names:
+          - sql-primary
+        include:
+          - status
+          - resources
+      register: result
+"""
+
+RETURN = """
+---
+stateful_nodes:
+    description: The selected stateful nodes, with the requested fields and details.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "id": "ssn-12345",
+            "name": "sql-primary",
+            "status": {"status": "ACTIVE", "vm_name": "vm-sql-primary", "private_ip": "10.0.0.4"}
+        }
+    ]
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK, get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import (
+    find_resources, get_resources_info, info_fields, tags_to_dict)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+
+
+def get_client(module):
+    return get_spot_client(module.params, "stateful_node_azure")
+
+
+def get_stateful_node_tags(stateful_node):
+    launch_specification = (stateful_node.get('compute') or dict()).get('launch_specification') or dict()
+
+    return tags_to_dict(launch_specification.get('tags'))
+
+
+def get_stateful_nodes_info(client, module):
+    stateful_nodes = find_resources(
+        client, module, client.get_all_stateful_nodes, client.get_stateful_node, get_tags=get_stateful_node_tags)
+
+    return get_resources_info(module, stateful_nodes, dict(
+        status=('status', client.get_stateful_node_status),
+        resources=('resources', client.get_stateful_node_resources)))
+
+
+def main():
+    fields = dict(
+        account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
+        credentials_path=dict(type='path', default="~/.spotinst/credentials"),
+        token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN']), no_log=True),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
+        tags=dict(type='dict'),
+        include=dict(type='list', elements='str', default=['status'],
+                     choices=['status', 'resources']),
+        **info_fields
+    )
+
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
+
+    if not HAS_SPOTINST_SDK:
+        module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
+
+    client = get_client(module=module)
+
+    stateful_nodes = get_stateful_nodes_info(client=client, module=module)
+
+    module.exit_json(changed=False, stateful_nodes=stateful_nodes, api_retries=get_retry_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -42,6 +42,28 @@ options:
       - Optional parameter that allows to set an token inside the module configuration. By default this is retrieved from the credentials path
     type: str
 
+  rate_limit:
+    type: dict
+    description:
+      - Optional limit on the rate of Spot API requests, shared by every task running on the control node.
+      - Requests take a token from a bucket per Spot account that refills at I(rate) tokens per second,
+        and wait for the next token when the bucket is empty. Retried requests take a token as well.
+    suboptions:
+      path:
+        type: path
+        required: true
+        description:
+          - Path of the bucket state file on the control node. A C(<path>.lock) file is created next to it.
+      rate:
+        type: float
+        required: true
+        description:
+          - Requests per second allowed for each Spot account.
+      burst:
+        type: int
+        description:
+          - Number of requests that may be sent at once after a quiet period. Defaults to I(rate).
+
   state:
     type: str
     choices:
@@ -103,25 +125,20 @@ result:
     description: Created Subscription successfully
 """
 
-HAS_SPOTINST_SDK = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.basic import env_fallback
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import get_create_diff, get_delete_diff, get_update_diff, has_changes, prune_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import rate_limit_fields
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_stats
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import HAS_SPOTINST_SDK, sdk_models
 
-try:
-    import spotinst_sdk2 as spotinst
-    from spotinst_sdk2.client import SpotinstClientException
-
-    HAS_SPOTINST_SDK = True
-
-except ImportError:
-    pass
+models = sdk_models("subscription")
 
 
 # region Request Builder Funcitons
 def expand_subscription_request(module):
-    event_subscription = spotinst.models.subscription.Subscription()
+    event_subscription = models.Subscription()
 
     resource_id = module.params.get('resource_id')
     protocol = module.params.get('protocol')
@@ -153,19 +170,20 @@ def handle_subscription(client, module):
     subscription_id = None
     message = None
     has_changed = False
+    diff = None
 
     request_type, subscription_id = get_request_type_and_id(client=client, module=module)
 
     if request_type == "create":
-        subscription_id, message, has_changed = handle_create(client=client, module=module)
+        subscription_id, message, has_changed, diff = handle_create(client=client, module=module)
     elif request_type == "update":
-        subscription_id, message, has_changed = handle_update(client=client, module=module, subscription_id=subscription_id)
+        subscription_id, message, has_changed, diff = handle_update(client=client, module=module, subscription_id=subscription_id)
     elif request_type == "delete":
-        subscription_id, message, has_changed = handle_delete(client=client, module=module, subscription_id=subscription_id)
+        subscription_id, message, has_changed, diff = handle_delete(client=client, module=module, subscription_id=subscription_id)
     else:
         module.fail_json(msg="Action Not Allowed")
 
-    return subscription_id, message, has_changed
+    return subscription_id, message, has_changed, diff
 
 
 def get_request_type_and_id(client, module):
@@ -187,71 +205,59 @@ def get_request_type_and_id(client, module):
 
 
 def get_client(module):
-    # Retrieve creds file variables
-    creds_file_loaded_vars = dict()
-
-    credentials_path = module.params.get('credentials_path')
-
-    if credentials_path is not None:
-        try:
-            with open(credentials_path, "r") as creds:
-                for line in creds:
-                    eq_index = line.find(':')
-                    var_name = line[:eq_index].strip()
-                    string_value = line[eq_index + 1:].strip()
-                    creds_file_loaded_vars[var_name] = string_value
-        except IOError:
-            pass
-    # End of creds file retrieval
-
-    token = module.params.get('token')
-    if not token:
-        token = creds_file_loaded_vars.get("token")
-
-    account = module.params.get('account_id')
-    if not account:
-        account = creds_file_loaded_vars.get("account")
-
-    if account is not None:
-        session = spotinst.SpotinstSession(auth_token=token, account_id=account)
-    else:
-        session = spotinst.SpotinstSession(auth_token=token)
-
-    client = session.client("subscription")
-
-    return client
+    return get_spot_client(module.params, "subscription")
 # endregion
 
 
 # region Request Functions
 def handle_create(client, module):
     subscription_request = expand_subscription_request(module=module)
+    diff = get_create_diff(subscription_request)
+
+    if module.check_mode:
+        return None, 'Subscription would be created', True, diff
+
     subscription = client.create_event_subscription(subscription=subscription_request)
 
     subscription_id = subscription['id']
     message = 'Created subscription successfully'
     has_changed = True
 
-    return subscription_id, message, has_changed
+    return subscription_id, message, has_changed, diff
 
 
 def handle_update(client, module, subscription_id):
     subscription_request = expand_subscription_request(module=module)
+    current_subscription = client.get_event_subscription(subscription_id=subscription_id)
+    diff = get_update_diff(subscription_request, current_subscription)
+
+    if not has_changes(diff):
+        return subscription_id, 'Subscription is already up to date', False, diff
+
+    if module.check_mode:
+        return subscription_id, 'Subscription would be updated', True, diff
+
+    prune_model(subscription_request, diff['after'])
     client.update_event_subscription(subscription_id=subscription_id, subscription=subscription_request)
 
     message = 'Updated subscription successfully'
     has_changed = True
 
-    return subscription_id, message, has_changed
+    return subscription_id, message, has_changed, diff
 
 
 def handle_delete(client, module, subscription_id):
+    diff = get_delete_diff(subscription_id)
+
+    if module.check_mode:
+        return subscription_id, 'Subscription would be deleted', True, diff
+
     client.delete_event_subscription(subscription_id=subscription_id)
 
     message = 'Deleted subscription successfully'
     has_changed = True
 
-    return subscription_id, message, has_changed
+    return subscription_id, message, has_changed, diff
 # endregion
 
 
@@ -259,6 +265,7 @@ def main():
     fields = dict(
         account_id=dict(type='str', fallback=(env_fallback, ['SPOTINST_ACCOUNT_ID', 'ACCOUNT'])),
         token=dict(type='str', fallback=(env_fallback, ['SPOTINST_TOKEN'])),
+        rate_limit=dict(type='dict', options=rate_limit_fields),
         state=dict(type='str', default='present', choices=['present', 'absent']),
         id=dict(type='str'),
         credentials_path=dict(type='path', default="~/.spotinst/credentials"),
@@ -269,16 +276,23 @@ def main():
         event_type=dict(type='str'),
         event_format=dict(type='dict'))
 
-    module = AnsibleModule(argument_spec=fields)
+    module = AnsibleModule(argument_spec=fields, supports_check_mode=True)
 
     if not HAS_SPOTINST_SDK:
         module.fail_json(msg="the Spotinst SDK library is required. (pip install spotinst_sdk2)")
 
     client = get_client(module=module)
 
-    subscription_id, message, has_changed = handle_subscription(client=client, module=module)
+    subscription_id, message, has_changed, diff = handle_subscription(client=client, module=module)
+
+    result = dict(changed=has_changed, subscription_id=subscription_id, message=message)
+
+    if diff is not None:
+        result['diff'] = diff
+
+    result['api_retries'] = get_retry_stats()
 
-    module.exit_json(changed=has_changed, subscription_id=subscription_id, message=message)
+    module.exit_json(**result)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import importlib
+import io
+import json
+import traceback
+
+from ansible.module_utils import basic
+from ansible.module_utils.common.text.converters import to_bytes, to_native
+from ansible.plugins.action import ActionBase
+from ansible.utils.display import Display
+from ansible.vars.clean import remove_internal_keys
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import HAS_SPOTINST_SDK
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import reset_rate_limit
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_policy
+
+try:
+    from ansible.module_utils.common.json import Direction, get_module_encoder
+
+    HAS_SERIALIZATION_PROFILES = True
+
+except ImportError:
+    HAS_SERIALIZATION_PROFILES = False
+
+display = Display()
+
+MODULES_PACKAGE = "ansible_collections.spot.cloud_modules.plugins.modules"
+SERIALIZATION_PROFILE = "legacy"
+LOCAL_TRANSPORTS = ("local", "ansible.builtin.local")
+
+# AnsibleModule reads its arguments from these module-level variables of
+# ansible.module_utils.basic when they are set, which is how AnsiballZ hands
+# them over. They are not a public API, so modules only run in process when
+# they exist.
+CAN_RUN_IN_PROCESS = hasattr(basic, "_ANSIBLE_ARGS") and (
+    not HAS_SERIALIZATION_PROFILES or hasattr(basic, "_ANSIBLE_PROFILE"))
+
+
+def encode_module_args(module_args):
+    data = dict(ANSIBLE_MODULE_ARGS=module_args)
+
+    if HAS_SERIALIZATION_PROFILES:
+        return to_bytes(json.dumps(data, cls=get_module_encoder(SERIALIZATION_PROFILE, Direction.CONTROLLER_TO_MODULE)))
+
+    return to_bytes(json.dumps(data))
+
+
+def reset_module_state():
+    """
+    Forget the retry statistics and budget and the rate limiter of the previous
+    run, so that every run starts out like a new module process.
+    """
+    get_retry_policy().reset()
+    reset_rate_limit()
+
+
+def run_module_in_process(module_name, module_args):
+    """
+    Run the ``main()`` of a collection module in this process, the way AnsiballZ
+    would run it on the target.
+
+    The arguments are handed over through ``basic._ANSIBLE_ARGS`` and the JSON the
+    module prints is captured from stdout. Modules exit through ``sys.exit()``,
+    which is caught here. Returns a ``(stdout, error)`` tuple, where ``error`` is
+    the exception the module raised instead of exiting, or None.
+    """
+    module = importlib.import_module("{0}.{1}".format(MODULES_PACKAGE, module_name))
+
+    saved_args = basic._ANSIBLE_ARGS
+    saved_profile = getattr(basic, "_ANSIBLE_PROFILE", None)
+    stdout = io.StringIO()
+    error = None
+
+    reset_module_state()
+    basic._ANSIBLE_ARGS = encode_module_args(module_args)
+
+    if HAS_SERIALIZATION_PROFILES:
+        basic._ANSIBLE_PROFILE = SERIALIZATION_PROFILE
+
+    try:
+        with contextlib.redirect_stdout(stdout):
+            module.main()
+    except SystemExit:
+        pass
+    except Exception as exc:
+        error = exc
+        display.vvv(traceback.format_exc())
+    finally:
+        basic._ANSIBLE_ARGS = saved_args
+
+        if HAS_SERIALIZATION_PROFILES:
+            basic._ANSIBLE_PROFILE = saved_profile
+
+        reset_module_state()
+
+    return stdout.getvalue(), error
+
+
+class SpotActionModule(ActionBase):
+    """
+    Runs a Spot module inside the Ansible worker process instead of shipping it
+    to the target.
+
+    The modules only talk to the Spot API, so when the task's connection is
+    local there is nothing to gain from packaging the module with AnsiballZ and
+    starting a new interpreter that imports the SDK again. Running ``main()``
+    here skips both.
+
+    Ansible forks a worker per host and task, so the clients and connection pool
+    cached by ``get_spot_client`` are only reused within one worker, for example
+    by the items of a loop. Other connections, async tasks and controllers
+    without the SDK run the module the usual way.
+    """
+
+    TRANSFERS_FILES = False
+    _supports_check_mode = True
+    _supports_async = True
+
+    def get_module_name(self):
+        return self._task.action.split(".")[-1]
+
+    def runs_in_process(self):
+        return (HAS_SPOTINST_SDK
+                and CAN_RUN_IN_PROCESS
+                and getattr(self._connection, "transport", None) in LOCAL_TRANSPORTS
+                and not self._task.async_val)
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(SpotActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if not self.runs_in_process():
+            result.update(self._execute_module(task_vars=task_vars, wrap_async=self._task.async_val))
+            return result
+
+        module_name = self.get_module_name()
+        module_args = self._task.args.copy()
+        self._update_module_args(self._task.action, module_args, task_vars)
+
+        display.vvv("Running {0} in the controller process".format(module_name))
+
+        stdout, error = run_module_in_process(module_name, module_args)
+
+        if error is not None:
+            result.update(failed=True, changed=False, msg=to_native(error) or type(error).__name__)
+            return result
+
+        res = dict(rc=0, stdout=stdout, stderr="")
+
+        if HAS_SERIALIZATION_PROFILES:
+            data = self._parse_returned_data(res, SERIALIZATION_PROFILE)
+        else:
+            data = self._parse_returned_data(res)
+
+        remove_internal_keys(data)
+        result.update(data)
+
+        return result
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.utils.display import Display
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_batch import run_batch
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import get_spot_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_json_file import LockedJsonFile
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_cache_scope
+
+display = Display()
+
+DEFAULT_CACHE_TTL = 300
+DEFAULT_CACHE_MAX_AGE = 3600
+
+
+class SpotInventoryPlugin(BaseInventoryPlugin, Constructable):
+    """
+    Common parts of the Spot inventory plugins: the credentials options, and
+    adding a host with its groups, variables and constructed groups.
+    """
+
+    def get_client_params(self):
+        return dict(
+            credentials_path=self.get_option("credentials_path"),
+            account_id=self.get_option("account_id"),
+            token=self.get_option("token"))
+
+    def get_client(self, service):
+        return get_spot_client(self.get_client_params(), service)
+
+    def get_ansible_host(self, private_ip, public_ip):
+        if self.get_option("use_private_ip"):
+            return private_ip
+
+        return public_ip or private_ip
+
+    def add_spot_host(self, host, group_names, host_vars):
+        strict = self.get_option("strict")
+
+        self.inventory.add_host(host)
+
+        for group_name in group_names:
+            self.inventory.add_child(self.inventory.add_group(self._sanitize_group_name(group_name)), host)
+
+        for key, value in host_vars.items():
+            self.inventory.set_variable(host, key, value)
+
+        self._set_composite_vars(self.get_option("compose"), host_vars, host, strict=strict)
+        self._add_host_to_composed_groups(self.get_option("groups"), host_vars, host, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, host, strict=strict)
+
+    def get_cached(self, path, cache, fetch):
+        """
+        Return the data of an inventory plugin that is also ``Cacheable``, read
+        from the inventory cache when it is enabled and ``cache`` allows it, or
+        from ``fetch()`` otherwise. ``fetch()`` returns the data and whether it
+        is complete; a partial result is not cached, so that the next run fetches
+        the missing parts again.
+        """
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+
+        if use_cache:
+            try:
+                return self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+
+        data, complete = fetch()
+
+        if update_cache and complete:
+            self._cache[cache_key] = data
+
+        return data
+
+
+def fetch_hosts(resources, fetch, max_workers):
+    """
+    Call ``fetch(resource)`` for every resource on a bounded thread pool.
+    Returns a list of ``(resource, hosts, error)``; ``hosts`` is None when the
+    fetch failed.
+    """
+    results = run_batch(resources, fetch, max_workers)
+    fetched = list()
+
+    for resource, result in zip(resources, results):
+        if isinstance(result, dict) and result.get("failed"):
+            fetched.append((resource, None, result["msg"]))
+        else:
+            fetched.append((resource, result, None))
+
+    return fetched
+
+
+def get_resources(resource_cache, list_resources, fetch, max_workers):
+    """
+    Return the resources listed by ``list_resources()``, each with the ``hosts``
+    returned by ``fetch(resource)``, going through ``resource_cache`` if it is
+    not None. Resources whose hosts could not be fetched are reported as warnings.
+    """
+    if resource_cache is not None:
+        return resource_cache.get(list_resources, fetch, max_workers)[0]
+
+    results = list()
+
+    for resource, hosts, error in fetch_hosts(list_resources(), fetch, max_workers):
+        if error is not None:
+            display.warning("Failed to fetch the hosts of {0}: {1}".format(resource["id"], error))
+            continue
+
+        results.append(dict(resource, hosts=hosts))
+
+    return results
+
+
+def get_resource_cache(plugin, service):
+    """
+    Build the resource cache configured by the plugin's ``resource_cache``
+    option, or return None if the option is not set.
+    """
+    resource_cache = plugin.get_option("resource_cache")
+
+    if not resource_cache or not resource_cache.get("path"):
+        return None
+
+    ttl = resource_cache.get("ttl")
+    if ttl is None:
+        ttl = DEFAULT_CACHE_TTL
+
+    max_age = resource_cache.get("max_age")
+    if max_age is None:
+        max_age = DEFAULT_CACHE_MAX_AGE
+
+    return ResourceCache(path=resource_cache["path"], ttl=ttl, max_age=max_age,
+                         scope=get_cache_scope(plugin.get_client_params(), service))
+
+
+class ResourceCache(object):
+    """
+    Resources and the hosts fetched for each of them, persisted in a local JSON
+    file per account.
+
+    Within ``ttl`` seconds of the last refresh the cached hosts are used as is.
+    After that the resources are listed again, and hosts are fetched only for
+    resources that are new, whose ``updated_at`` changed, or whose hosts are
+    older than ``max_age`` seconds. The last bound picks up changes that do not
+    touch the resource itself, such as an instance being replaced.
+    """
+
+    def __init__(self, path, ttl, max_age, scope, clock=time.time):
+        self.store = LockedJsonFile(path)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.scope = scope
+        self.clock = clock
+
+    def is_current(self, cached, resource, now):
+        return cached is not None and cached.get("updated_at") == resource.get("updated_at") and \
+            now - cached.get("fetched_at", 0) < self.max_age
+
+    def get(self, list_resources, fetch, max_workers):
+        """
+        Return the resources listed by ``list_resources()``, each with the
+        ``hosts`` returned by ``fetch(resource)``, and the number of resources
+        whose hosts could not be fetched. Every resource needs an ``id`` and an
+        ``updated_at``.
+        """
+        with self.store.locked():
+            content = self.store.read()
+            entry = content.get(self.scope) or dict()
+            now = self.clock()
+
+            if entry and now - entry.get("refreshed_at", 0) < self.ttl:
+                return entry["resources"], 0
+
+            cached_by_id = dict((cached["id"], cached) for cached in entry.get("resources", []))
+            resources = list_resources()
+            stale = [resource for resource in resources
+                     if not self.is_current(cached_by_id.get(resource["id"]), resource, now)]
+            fetched_by_id = dict((resource["id"], (hosts, error))
+                                 for resource, hosts, error in fetch_hosts(stale, fetch, max_workers))
+
+            results = list()
+            failures = 0
+
+            for resource in resources:
+                cached = cached_by_id.get(resource["id"])
+                hosts, error = fetched_by_id.get(resource["id"], (None, None))
+
+                if error is not None:
+                    display.warning("Failed to fetch the hosts of {0}: {1}".format(resource["id"], error))
+                    failures += 1
+
+                    # Keep the last known hosts, marked so they are fetched again next time.
+                    if cached is not None:
+                        results.append(dict(resource, updated_at=None, fetched_at=0, hosts=cached["hosts"]))
+                elif hosts is not None:
+                    results.append(dict(resource, fetched_at=now, hosts=hosts))
+                else:
+                    results.append(dict(resource, fetched_at=cached["fetched_at"], hosts=cached["hosts"]))
+
+            # After a failure the next run refreshes again instead of serving this listing for a whole TTL.
+            content[self.scope] = dict(refreshed_at=now if not failures else 0, resources=results)
+            self.store.write(content)
+
+        return results, failures
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Measure how long building the Elastigroup model of aws_elastigroup takes.
+
+The options set every field the builder reads, with ``--items`` entries in each
+list. To compare against another revision of the builder, save its
+``spot_elastigroup_aws.py`` and pass it with ``--baseline``, for instance:
+
+    git show HEAD~1:plugins/module_utils/spot_elastigroup_aws.py > /tmp/baseline.py
+    python tests/benchmarks/elastigroup_converter.py --baseline /tmp/baseline.py
+
+Run from a checkout that lives in an ``ansible_collections/spot/cloud_modules``
+directory, or point ``--collections-path`` at the directory that contains
+``ansible_collections``.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import importlib.util
+import os
+import sys
+import timeit
+
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+COLLECTIONS_PATH = os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT)))
+
+
+class BenchmarkModule(object):
+
+    def __init__(self, params):
+        self.params = params
+
+
+def auto_scale(items, **extra):
+    return dict(is_enabled=True, is_auto_config=False, cooldown=300,
+                headroom=dict(cpu_per_unit=1024, memory_per_unit=512, num_of_units=items),
+                down=dict(evaluation_periods=5), **extra)
+
+
+def max_size_params(items=10):
+    """Options of aws_elastigroup with every field the builder reads set."""
+    policy = dict(policy_name="scale", namespace="AWS/EC2", metric_name="CPUUtilization", dimensions=[],
+                  statistic="average", evaluation_periods=5, period=300, threshold=80, cooldown=300, unit="percent",
+                  operator="gte", action_type="adjustment", adjustment=1, min_target_capacity=1,
+                  max_target_capacity=10, target=5, minimum=1, maximum=10)
+
+    return dict(
+        name="web", description="web servers", min_size=1, max_size=items * 10, target=items, unit="instance",
+        do_not_update=["image_id", "target"],
+        risk=100, utilize_reserved_instances=True, fallback_to_od=True, on_demand_count=1,
+        availability_vs_cost="balanced", draining_timeout=120, spin_up_time=60, lifetime_period="days",
+        revert_to_spot=dict(perform_at="timeWindow", time_windows=["Mon:12:00-Mon:14:00"]),
+        terminate_at_end_of_billing_hour=True,
+        persistence=dict(should_persist_root_device=True, should_persist_block_devices=True,
+                         should_persist_private_ip=False, block_devices_mode="reattach"),
+        signals=[dict(name="INSTANCE_READY", timeout=600)],
+        up_scaling_policies=[dict(policy) for i in range(items)],
+        down_scaling_policies=[dict(policy) for i in range(items)],
+        target_tracking_policies=[dict(policy_name="track", namespace="AWS/EC2", source="cloudWatch",
+                                       metric_name="CPUUtilization", statistic="average", unit="percent",
+                                       cooldown=300, target=50) for i in range(items)],
+        mesosphere=dict(api_server="10.0.0.1"),
+        ecs=dict(cluster_name="ecs", auto_scale=auto_scale(
+            items, attributes=[dict(key="k%d" % i, value="v") for i in range(items)])),
+        kubernetes=dict(api_server="https://k8s", token="secret", integration_mode="pod", cluster_identifier="k8s",
+                        auto_scale=auto_scale(items, labels=[dict(key="k%d" % i, value="v") for i in range(items)])),
+        nomad=dict(master_host="nomad", master_port=4646, acl_token="secret", auto_scale=auto_scale(
+            items, constraints=[dict(key="k%d" % i, value="v") for i in range(items)])),
+        docker_swarm=dict(master_host="swarm", master_port=2376, auto_scale=dict(
+            is_enabled=True, cooldown=300, headroom=dict(cpu_per_unit=1024, memory_per_unit=512, num_of_units=2),
+            down=dict(evaluation_periods=5))),
+        route53=dict(domains=[dict(hosted_zone_id="Z%d" % i, record_sets=[dict(name="www", use_public_ip=True)])
+                              for i in range(items)]),
+        mlb_runtime=dict(deployment_id="dp-1"),
+        elastic_beanstalk=dict(
+            environment_id="e-1",
+            deployment_preferences=dict(automatic_roll=True, batch_size_percentage=50, grace_period=300,
+                                        strategy=dict(action="REPLACE_SERVER", should_drain_instances=True)),
+            managed_actions=dict(platform_update=dict(perform_at="timeWindow", time_window="Mon:23:50-Tue:00:20",
+                                                      update_level="minorAndPatch"))),
+        code_deploy=dict(clean_up_on_failure=True, terminate_instance_on_failure=True,
+                         deployment_groups=[dict(application_name="app", deployment_group_name="dg%d" % i)
+                                            for i in range(items)]),
+        right_scale=dict(account_id="1", refresh_token="secret"),
+        opsworks=dict(layer_id="l-1"),
+        rancher=dict(access_key="a", secret_key="s", master_host="rancher", version="2"),
+        chef=dict(chef_server="chef", organization="org", user="u", pem_key="k", chef_version="14"),
+        product="Linux/UNIX", elastic_ips=["eipalloc-%d" % i for i in range(items)],
+        private_ips=["10.0.0.%d" % i for i in range(items)],
+        on_demand_instance_type="c5.large", spot_instance_types=["c5.large", "m5.large", "r5.large"],
+        preferred_spot_instance_types=["c5.large"],
+        ebs_volume_pool=[dict(device_name="/dev/xvdb", volume_ids=["vol-%d" % i]) for i in range(items)],
+        availability_zones=[dict(name="us-east-1a", subnet_id="subnet-%d" % i, placement_group_name="pg")
+                            for i in range(items)],
+        user_data="IyEvYmluL2Jhc2g=", key_pair="key", tenancy="default", shutdown_script="c2h1dGRvd24=",
+        monitoring=True, ebs_optimized=True, image_id="ami-1", health_check_type="ELB",
+        health_check_grace_period=300, health_check_unhealthy_duration_before_replacement=120,
+        security_group_ids=["sg-%d" % i for i in range(items)],
+        iam_role_arn="arn:aws:iam::1:instance-profile/web",
+        tags=[{"key%d" % i: "value"} for i in range(items)],
+        load_balancers=["elb-%d" % i for i in range(items)],
+        target_group_arns=["arn:aws:elasticloadbalancing:tg/%d" % i for i in range(items)],
+        mlb_load_balancers=[dict(target_set_id="ts-%d" % i, balancer_id="lb-1", auto_weight=True, az_awareness=True)
+                            for i in range(items)],
+        block_device_mappings=[dict(device_name="/dev/xvd%d" % i, ebs=dict(
+            delete_on_termination=True, encrypted=False, iops=100, volume_type="gp2", volume_size=30))
+            for i in range(items)],
+        network_interfaces=[dict(device_index=i, associate_public_ip_address=True, delete_on_termination=True,
+                                 private_ip_addresses=[dict(private_ip_address="10.0.1.%d" % i, primary=True)])
+                            for i in range(items)],
+        credit_specification=dict(cpu_credits="unlimited"),
+        multai_token="secret",
+        multai_load_balancers=[dict(balancer_id="lb-%d" % i, project_id="p", target_set_id="ts", az_awareness=True,
+                                    auto_weight=True) for i in range(items)],
+        scheduled_tasks=[dict(task_type="scale", cron_expression="0 1 * * *", is_enabled=True, scale_target_capacity=i,
+                              scale_min_capacity=0, scale_max_capacity=10) for i in range(items)],
+    )
+
+
+def time_builder(expand_elastigroup, params, number, repeat):
+    module = BenchmarkModule(params)
+    runs = timeit.repeat(lambda: expand_elastigroup(module, True), number=number, repeat=repeat)
+
+    return min(runs) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline")
+    parser.add_argument("--collections-path", default=COLLECTIONS_PATH)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.collections_path)
+    from ansible_collections.spot.cloud_modules.plugins.module_utils import spot_elastigroup_aws
+
+    builders = [("current", spot_elastigroup_aws)]
+
+    if args.baseline:
+        spec = importlib.util.spec_from_file_location("baseline_elastigroup_aws", args.baseline)
+        baseline = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(baseline)
+        builders.insert(0, ("baseline", baseline))
+
+    params = max_size_params(args.items)
+
+    # ebs_volume_pool needs a model class the installed SDK may not have.
+    if not hasattr(spot_elastigroup_aws.models, "EbsVolume"):
+        params.pop("ebs_volume_pool")
+
+    print("{0:<10} {1:>12}".format("builder", "us per call"))
+
+    for name, module in builders:
+        seconds = time_builder(module.expand_elastigroup, params, args.number, args.repeat)
+        print("{0:<10} {1:>12.1f}".format(name, seconds * 1000000))
+
+
+if __name__ == "__main__":
+    main()
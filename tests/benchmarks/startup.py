@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Measure how long each module takes to start, in a fresh interpreter per run.
+
+For every module this reports the median time to import it, to fail on its
+arguments (the path an argument error takes), and the time to import the Spot
+SDK on top, which only runs that reach the API pay. Run from a checkout that
+lives in an ``ansible_collections/spot/cloud_modules`` directory, or point
+``--collections-path`` at the directory that contains ``ansible_collections``:
+
+    python tests/benchmarks/startup.py [--runs N] [--collections-path PATH] [module ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+COLLECTIONS_PATH = os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT)))
+MODULES_PACKAGE = "ansible_collections.spot.cloud_modules.plugins.modules"
+
+CHILD = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+from ansible.module_utils import basic
+import importlib
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+basic._ANSIBLE_ARGS = json.dumps(dict(ANSIBLE_MODULE_ARGS=dict(_bogus_option=1))).encode()
+basic._ANSIBLE_PROFILE = "legacy"
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        module.main()
+    except SystemExit:
+        pass
+failed = time.perf_counter()
+sdk_loaded = "spotinst_sdk2" in sys.modules
+import spotinst_sdk2
+sdk = time.perf_counter()
+print(json.dumps(dict(imported=imported - start, failed=failed - start, sdk=sdk - failed, sdk_loaded=sdk_loaded)))
+"""
+
+
+def list_modules():
+    names = os.listdir(os.path.join(COLLECTION_ROOT, "plugins", "modules"))
+    return sorted(name[:-3] for name in names if name.endswith(".py") and not name.startswith("_"))
+
+
+def measure(module_name, collections_path):
+    env = dict(os.environ, PYTHONPATH=collections_path)
+    output = subprocess.check_output(
+        [sys.executable, "-c", CHILD, "{0}.{1}".format(MODULES_PACKAGE, module_name)], env=env)
+
+    return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--collections-path", default=COLLECTIONS_PATH)
+    parser.add_argument("modules", nargs="*")
+    args = parser.parse_args()
+
+    print("{0:<28} {1:>10} {2:>14} {3:>10}  {4}".format("module", "import ms", "arg error ms", "sdk ms", "sdk loaded"))
+
+    for module_name in args.modules or list_modules():
+        runs = [measure(module_name, args.collections_path) for i in range(args.runs)]
+
+        print("{0:<28} {1:>10.1f} {2:>14.1f} {3:>10.1f}  {4}".format(
+            module_name,
+            median([run["imported"] for run in runs]) * 1000,
+            median([run["failed"] for run in runs]) * 1000,
+            median([run["sdk"] for run in runs]) * 1000,
+            any(run["sdk_loaded"] for run in runs)))
+
+
+if __name__ == "__main__":
+    main()
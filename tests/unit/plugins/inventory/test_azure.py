@@ -0,0 +1,68 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible.inventory.data import InventoryData
+from ansible_collections.spot.cloud_modules.plugins.inventory.azure import InventoryModule
+
+
+OPTIONS = dict(
+    include=["stateful_nodes", "elastigroups"],
+    hostname="vm_name",
+    use_private_ip=True,
+    max_workers=4,
+    resource_cache=None,
+    strict=False,
+    compose={},
+    groups={},
+    keyed_groups=[],
+)
+
+
+class TestAzureInventory(unittest.TestCase):
+    """Unit test for the Azure stateful node and elastigroup inventory plugin"""
+
+    def setUp(self):
+        self.plugin = InventoryModule()
+        self.plugin.inventory = InventoryData()
+        self.options = dict(OPTIONS)
+        self.plugin.get_option = lambda name: self.options[name]
+
+        self.stateful_node_client = MagicMock()
+        self.stateful_node_client.get_all_stateful_nodes.return_value = [
+            dict(id="ssn-1", name="db", region="eastus", resource_group_name="rg", updated_at="t1",
+                 compute=dict(launch_specification=dict(tags=[dict(tag_key="env", tag_value="prod")])))]
+        self.stateful_node_client.get_stateful_node_status.return_value = dict(
+            id="ssn-1", vm_name="db-vm", private_ip="10.0.0.1", public_ip="1.1.1.1")
+
+        self.elastigroup_client = MagicMock()
+        self.elastigroup_client.get_elastigroups.return_value = [
+            dict(id="sig-1", name="web", region="westus", resource_group_name="rg", updated_at="t1")]
+        self.elastigroup_client.get_elastigroup_status.return_value = dict(vms=[
+            dict(vm_name="web-1", private_ip="10.0.1.1"), dict(vm_name="web-2", private_ip="10.0.1.2")])
+
+    def test_fetch_and_populate(self):
+        """VMs of both kinds are grouped by resource, region, resource group and tag"""
+
+        self.plugin.populate(self.plugin.fetch_resources(self.stateful_node_client, self.elastigroup_client))
+
+        inventory = self.plugin.inventory
+        self.assertEqual(["db-vm"], [host.name for host in inventory.groups["stateful_node_db"].get_hosts()])
+        self.assertEqual(["web-1", "web-2"], sorted(host.name for host in inventory.groups["elastigroup_web"].get_hosts()))
+        self.assertEqual(3, len(inventory.groups["resource_group_rg"].get_hosts()))
+        self.assertEqual(["db-vm"], [host.name for host in inventory.groups["tag_env_prod"].get_hosts()])
+
+        host_vars = inventory.get_host("db-vm").vars
+        self.assertEqual("10.0.0.1", host_vars["ansible_host"])
+        self.assertEqual("ssn-1", host_vars["spot_resource_id"])
+
+    def test_include(self):
+        """Only the included kinds are listed"""
+
+        self.options["include"] = ["elastigroups"]
+        resources = self.plugin.fetch_resources(self.stateful_node_client, self.elastigroup_client)
+
+        self.assertEqual(["sig-1"], [resource["id"] for resource in resources])
+        self.stateful_node_client.get_all_stateful_nodes.assert_not_called()
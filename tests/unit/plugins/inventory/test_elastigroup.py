@@ -0,0 +1,95 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible.inventory.data import InventoryData
+from ansible_collections.spot.cloud_modules.plugins.inventory.elastigroup import InventoryModule
+
+
+OPTIONS = dict(
+    group_names=[],
+    hostname="instance_id",
+    use_private_ip=False,
+    max_workers=4,
+    strict=False,
+    compose={},
+    groups={},
+    keyed_groups=[],
+)
+
+
+class TestElastigroupInventory(unittest.TestCase):
+    """Unit test for the elastigroup inventory plugin"""
+
+    def setUp(self):
+        self.plugin = InventoryModule()
+        self.plugin.inventory = InventoryData()
+        self.options = dict(OPTIONS)
+        self.plugin.get_option = lambda name: self.options[name]
+
+        self.client = MagicMock()
+        self.client.get_elastigroups.return_value = [
+            dict(id="sig-1", name="web", compute=dict(
+                product="Linux/UNIX",
+                launch_specification=dict(tags=[dict(tag_key="env", tag_value="prod")]))),
+            dict(id="sig-2", name="db", compute=dict(product="Windows")),
+        ]
+        self.client.get_elastigroup_active_instances.side_effect = lambda group_id: dict(
+            [("sig-1", [dict(instance_id="i-1", private_ip="10.0.0.1", public_ip="1.1.1.1"),
+                        dict(instance_id="i-2", private_ip="10.0.0.2")]),
+             ("sig-2", [dict(instance_id="i-3", private_ip="10.0.0.3")])])[group_id]
+
+    def test_fetch_and_populate(self):
+        """Hosts are grouped by group name, tag and product, with the instance as host vars"""
+
+        groups, complete = self.plugin.fetch_groups(self.client)
+        self.plugin.populate(groups)
+
+        self.assertTrue(complete)
+        self.assertEqual(2, self.client.get_elastigroup_active_instances.call_count)
+
+        inventory = self.plugin.inventory
+        self.assertEqual(["i-1", "i-2"], sorted(host.name for host in inventory.groups["elastigroup_web"].get_hosts()))
+        self.assertEqual(["i-1", "i-2"], sorted(host.name for host in inventory.groups["tag_env_prod"].get_hosts()))
+        self.assertEqual(["i-3"], [host.name for host in inventory.groups["product_Windows"].get_hosts()])
+
+        host_vars = inventory.get_host("i-1").vars
+        self.assertEqual("1.1.1.1", host_vars["ansible_host"])
+        self.assertEqual("sig-1", host_vars["spot_group_id"])
+        self.assertEqual("10.0.0.1", host_vars["spot_private_ip"])
+        self.assertEqual("10.0.0.2", inventory.get_host("i-2").vars["ansible_host"])
+
+    def test_filter_and_partial_failure(self):
+        """Only the named groups are fetched, and a failed group is reported as incomplete"""
+
+        self.options["group_names"] = ["web"]
+        self.client.get_elastigroup_active_instances.side_effect = Exception("boom")
+
+        groups, complete = self.plugin.fetch_groups(self.client)
+
+        self.assertFalse(complete)
+        self.assertEqual([("sig-1", [])], [(group["id"], group["instances"]) for group in groups])
+
+    def test_inventory_cache(self):
+        """Cached groups are used when allowed, and a partial listing is not cached"""
+
+        self.options["cache"] = True
+        self.plugin._cache = dict()
+        self.plugin.get_cache_key = lambda path: "key"
+        fetch = MagicMock(return_value=([dict(id="sig-1")], False))
+
+        self.assertEqual([dict(id="sig-1")], self.plugin.get_cached("inventory.yml", True, fetch))
+        self.assertEqual(dict(), self.plugin._cache)
+
+        fetch.return_value = ([dict(id="sig-2")], True)
+        self.plugin.get_cached("inventory.yml", True, fetch)
+        self.assertEqual(dict(key=[dict(id="sig-2")]), self.plugin._cache)
+
+        self.assertEqual([dict(id="sig-2")], self.plugin.get_cached("inventory.yml", True, fetch))
+        self.assertEqual(2, fetch.call_count)
+
+        fetch.return_value = ([dict(id="sig-3")], True)
+        self.assertEqual([dict(id="sig-3")], self.plugin.get_cached("inventory.yml", False, fetch))
+        self.assertEqual(dict(key=[dict(id="sig-3")]), self.plugin._cache)
@@ -0,0 +1,79 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible.inventory.data import InventoryData
+from ansible_collections.spot.cloud_modules.plugins.inventory.ocean import InventoryModule
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ocean_aws import OCEAN_CLUSTER_URL
+
+
+OPTIONS = dict(
+    cluster_names=[],
+    hostname="instance_id",
+    use_private_ip=True,
+    max_workers=4,
+    strict=False,
+    compose={},
+    groups={},
+    keyed_groups=[],
+)
+
+RESPONSES = {
+    OCEAN_CLUSTER_URL + "/o-1/instances": [
+        dict(instance_id="i-1", private_ip="10.0.0.1", launch_spec_id="ols-1"),
+        dict(instance_id="i-2", private_ip="10.0.0.2")],
+    OCEAN_CLUSTER_URL + "/o-2/instances": [dict(instance_id="i-3", private_ip="10.0.0.3")],
+}
+
+
+class TestOceanInventory(unittest.TestCase):
+    """Unit test for the Ocean cluster inventory plugin"""
+
+    def setUp(self):
+        self.plugin = InventoryModule()
+        self.plugin.inventory = InventoryData()
+        self.options = dict(OPTIONS)
+        self.plugin.get_option = lambda name: self.options[name]
+
+        self.client = MagicMock()
+        self.client.get_all_ocean_cluster.return_value = [
+            dict(id="o-1", name="prod", controller_cluster_id="prod-eks"),
+            dict(id="o-2", name="dev", controller_cluster_id="dev-eks")]
+        self.client.convert_json.side_effect = lambda content, convert: dict(response=dict(items=content))
+
+        def send_get(url, entity_name, query_params=None):
+            if query_params:
+                return [dict(id="ols-1", name="gpu")] if query_params["oceanId"] == "o-1" else []
+
+            return RESPONSES[url]
+
+        self.client.send_get.side_effect = send_get
+
+    def test_fetch_and_populate(self):
+        """Nodes are grouped by cluster and by launch spec name"""
+
+        clusters, complete = self.plugin.fetch_clusters(self.client)
+        self.plugin.populate(clusters)
+
+        self.assertTrue(complete)
+
+        inventory = self.plugin.inventory
+        self.assertEqual(["i-1", "i-2"], sorted(host.name for host in inventory.groups["ocean_prod"].get_hosts()))
+        self.assertEqual(["i-3"], [host.name for host in inventory.groups["ocean_dev"].get_hosts()])
+        self.assertEqual(["i-1"], [host.name for host in inventory.groups["launch_spec_gpu"].get_hosts()])
+
+        host_vars = inventory.get_host("i-1").vars
+        self.assertEqual("10.0.0.1", host_vars["ansible_host"])
+        self.assertEqual("prod-eks", host_vars["spot_controller_cluster_id"])
+        self.assertEqual("gpu", host_vars["spot_launch_spec_name"])
+
+    def test_cluster_names(self):
+        """Only the named clusters are fetched"""
+
+        self.options["cluster_names"] = ["dev"]
+        clusters, complete = self.plugin.fetch_clusters(self.client)
+
+        self.assertEqual(["o-2"], [cluster["id"] for cluster in clusters])
+        self.assertEqual(2, self.client.send_get.call_count)
@@ -0,0 +1,72 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import tempfile
+import unittest
+
+import spotinst_sdk2
+import spotinst_sdk2.client
+from ansible_collections.spot.cloud_modules.plugins.module_utils import spot_client
+
+
+class TestSpotClient(unittest.TestCase):
+    """Unit test for the shared Spot client factory"""
+
+    def setUp(self):
+        spot_client.clear_client_cache()
+
+    def test_credentials_file(self):
+        """Token and account are read from the credentials file when not passed"""
+
+        with tempfile.NamedTemporaryFile("w", suffix=".creds", delete=False) as creds:
+            creds.write("token: file-token\naccount: act-file\n")
+
+        try:
+            token, account = spot_client.resolve_credentials(dict(credentials_path=creds.name))
+            self.assertEqual("file-token", token)
+            self.assertEqual("act-file", account)
+
+            token, account = spot_client.resolve_credentials(
+                dict(credentials_path=creds.name, token="param-token", account_id="act-param"))
+            self.assertEqual("param-token", token)
+            self.assertEqual("act-param", account)
+        finally:
+            os.remove(creds.name)
+
+    def test_missing_credentials_file(self):
+        self.assertEqual(dict(), spot_client.load_credentials_file("/nonexistent/credentials"))
+        self.assertEqual(dict(), spot_client.load_credentials_file(None))
+
+    def test_client_reuse(self):
+        """Clients are reused per service and credentials"""
+
+        params = dict(token="token", account_id="act-1")
+
+        first = spot_client.get_spot_client(params, "elastigroup_aws")
+        second = spot_client.get_spot_client(params, "elastigroup_aws")
+        other_account = spot_client.get_spot_client(dict(token="token", account_id="act-2"), "elastigroup_aws")
+        other_service = spot_client.get_spot_client(params, "ocean_aws")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_account)
+        self.assertIsInstance(first, spotinst_sdk2.ElastigroupAwsClient)
+        self.assertIsInstance(other_service, spotinst_sdk2.OceanAwsClient)
+        self.assertEqual("act-2", other_account.account_id)
+
+    def test_no_sdk_output(self):
+        """Clients do not print requests to stdout, where modules write their result"""
+
+        client = spot_client.get_spot_client(dict(token="token", account_id="act-1"), "elastigroup_aws")
+
+        self.assertFalse(client.should_print_output)
+
+    def test_pooled_transport(self):
+        """SDK HTTP calls are routed through one shared session"""
+
+        spot_client.get_spot_client(dict(token="token"), "subscription")
+
+        self.assertIsInstance(spotinst_sdk2.client.requests, spot_client.PooledRequests)
+        self.assertIs(spot_client.get_http_session(), spotinst_sdk2.client.requests.session)
+        self.assertEqual(200, spotinst_sdk2.client.requests.codes.ok)
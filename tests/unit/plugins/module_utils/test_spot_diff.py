@@ -0,0 +1,130 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+import spotinst_sdk2 as spotinst
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import (
+    MASKED_VALUE, get_create_diff, get_update_diff, has_changes, model_to_dict, prune_model)
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import expand_elastigroup
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = input_dict
+
+
+class TestGetUpdateDiff(unittest.TestCase):
+    """Unit test for the update diff helper"""
+
+    def setUp(self):
+        self.current = dict(
+            id="sig-1",
+            name="web",
+            capacity=dict(minimum=1, maximum=5, target=2, unit="instance"),
+            compute=dict(
+                instance_types=dict(ondemand="c5.large", spot=["c5.large", "m5.large"]),
+                launch_specification=dict(monitoring=True, tags=[dict(tag_key="env", tag_value="prod")])))
+
+    def test_unchanged_model(self):
+        """Fields the API adds, or that were not set, are ignored"""
+
+        eg = spotinst.models.elastigroup.aws.Elastigroup(
+            name="web",
+            capacity=spotinst.models.elastigroup.aws.Capacity(minimum=1, maximum=5, target=2))
+        eg.compute = dict(instance_types=dict(spot=["c5.large", "m5.large"]),
+                          launch_specification=dict(monitoring="True", tags=[dict(tag_key="env")]))
+
+        diff = get_update_diff(eg, self.current)
+
+        self.assertFalse(has_changes(diff))
+        self.assertEqual(dict(before=dict(), after=dict()), diff)
+
+    def test_changed_fields(self):
+        """Only the differing fields are reported"""
+
+        desired = dict(name="web", capacity=dict(minimum=1, target=3),
+                       compute=dict(instance_types=dict(spot=["c5.large"])))
+
+        diff = get_update_diff(desired, self.current)
+
+        self.assertTrue(has_changes(diff))
+        self.assertEqual(dict(capacity=dict(target=3), compute=dict(instance_types=dict(spot=["c5.large"]))),
+                         diff["after"])
+        self.assertEqual(dict(capacity=dict(target=2),
+                              compute=dict(instance_types=dict(spot=["c5.large", "m5.large"]))),
+                         diff["before"])
+
+    def test_missing_in_current(self):
+        diff = get_update_diff(dict(strategy=dict(risk=100), description=None), self.current)
+
+        self.assertEqual(dict(strategy=dict(risk=100)), diff["after"])
+        self.assertEqual(dict(strategy=dict(risk=None)), diff["before"])
+
+    def test_unset_option(self):
+        """Options the builder leaves as None do not diff against values the API returns"""
+
+        module = MockModule(dict(name="web", min_size=1, max_size=2, target=1, product="Linux/UNIX", image_id="ami-1"))
+        eg = expand_elastigroup(module=module, is_update=True)
+        current = model_to_dict(expand_elastigroup(module=module, is_update=True))
+        current["compute"]["launch_specification"]["credit_specification"] = dict(cpu_credits="standard")
+
+        self.assertIsNone(eg.compute.launch_specification.credit_specification)
+        self.assertFalse(has_changes(get_update_diff(eg, current)))
+
+    def test_write_only_fields(self):
+        """Write-only fields the API does not return are not compared, and secrets are masked"""
+
+        current = dict(compute=dict(launch_specification=dict(login=dict(user_name="admin"))))
+        desired = dict(compute=dict(launch_specification=dict(login=dict(user_name="admin", password="secret"))))
+
+        self.assertFalse(has_changes(get_update_diff(desired, current)))
+
+        desired["compute"]["launch_specification"]["login"]["user_name"] = "root"
+        diff = get_update_diff(desired, current)
+
+        self.assertEqual(dict(user_name="root"), diff["after"]["compute"]["launch_specification"]["login"])
+
+        current["compute"]["launch_specification"]["login"]["password"] = "old"
+        diff = get_update_diff(desired, current)
+
+        self.assertEqual(MASKED_VALUE, diff["after"]["compute"]["launch_specification"]["login"]["password"])
+        self.assertEqual(MASKED_VALUE, diff["before"]["compute"]["launch_specification"]["login"]["password"])
+
+    def test_create_diff_masks_secrets(self):
+        diff = get_create_diff(dict(name="n", login=dict(user_name="admin", password="secret"), custom_data="c2VjcmV0"))
+
+        self.assertEqual(dict(name="n", login=dict(user_name="admin", password=MASKED_VALUE), custom_data=MASKED_VALUE),
+                         diff["after"])
+
+
+class TestPruneModel(unittest.TestCase):
+    """Unit test for pruning an update down to the changed fields"""
+
+    def test_prune(self):
+        aws = spotinst.models.elastigroup.aws
+        eg = aws.Elastigroup(
+            name="web",
+            capacity=aws.Capacity(minimum=1, maximum=5, target=3),
+            compute=aws.Compute(
+                launch_specification=aws.LaunchSpecification(user_data="big-blob", image_id="ami-2"),
+                availability_zones=[aws.AvailabilityZone(name="us-east-1a"), aws.AvailabilityZone(name="us-east-1b")]))
+        current = dict(
+            name="web",
+            capacity=dict(minimum=1, maximum=5, target=2),
+            compute=dict(launch_specification=dict(user_data="big-blob", image_id="ami-1"),
+                         availability_zones=[dict(name="us-east-1a")]))
+
+        diff = get_update_diff(eg, current)
+        prune_model(eg, diff["after"])
+
+        self.assertEqual(dict(
+            capacity=dict(target=3),
+            compute=dict(launch_specification=dict(image_id="ami-2"),
+                         availability_zones=[dict(name="us-east-1a"), dict(name="us-east-1b")])), model_to_dict(eg))
+
+    def test_prune_dict(self):
+        desired = dict(name="n", os_disk=dict(size_gb=64, type="Standard_LRS"))
+
+        self.assertEqual(dict(os_disk=dict(size_gb=64)), prune_model(desired, dict(os_disk=dict(size_gb=64))))
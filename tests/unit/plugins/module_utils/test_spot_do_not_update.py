@@ -0,0 +1,87 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_do_not_update import (
+    LEAF, clean_do_not_update_fields, compile_paths)
+
+
+def get_spec():
+    return dict(
+        name="node",
+        region="eastus",
+        compute=dict(
+            os="Linux",
+            launch_specification=dict(
+                image=dict(marketplace=dict(offer="UbuntuServer")),
+                data_disks=[dict(lun=0, size_gb=32), dict(lun=1, size_gb=64)],
+                tags=[dict(tag_key="a", tag_value="1")])))
+
+
+class TestCleanDoNotUpdateFields(unittest.TestCase):
+    """Unit test for removing do_not_update paths before an update"""
+
+    def test_compile_paths(self):
+        """Paths share their prefixes, and a path ending above another one covers it"""
+
+        trie = compile_paths(["compute.os", "compute.launch_specification.image", "compute.launch_specification",
+                              "region", "region.name"])
+
+        self.assertEqual(dict(region=LEAF, compute=dict(os=LEAF, launch_specification=LEAF)), trie)
+
+    def test_paths(self):
+        spec = clean_do_not_update_fields(get_spec(), ["region", "compute.launch_specification.image.marketplace"])
+
+        self.assertNotIn("region", spec)
+        self.assertEqual(dict(), spec["compute"]["launch_specification"]["image"])
+        self.assertEqual("Linux", spec["compute"]["os"])
+
+    def test_wildcards_and_indexes(self):
+        spec = clean_do_not_update_fields(get_spec(), ["compute.launch_specification.data_disks.*.size_gb",
+                                                       "compute.launch_specification.tags.0",
+                                                       "compute.*.image"])
+
+        launch_specification = spec["compute"]["launch_specification"]
+        self.assertEqual([dict(lun=0), dict(lun=1)], launch_specification["data_disks"])
+        self.assertEqual([], launch_specification["tags"])
+        self.assertNotIn("image", launch_specification)
+
+    def test_copy_on_write(self):
+        """The options are left as they are, and only the dicts and lists along matched paths are copied"""
+
+        spec = get_spec()
+
+        cleaned = clean_do_not_update_fields(spec, ["compute.launch_specification.data_disks.1.size_gb",
+                                                    "compute.launch_specification.tags.*"])
+
+        self.assertEqual(get_spec(), spec)
+        launch_specification = cleaned["compute"]["launch_specification"]
+        self.assertIsNot(spec["compute"], cleaned["compute"])
+        self.assertIs(spec["compute"]["launch_specification"]["image"], launch_specification["image"])
+        self.assertIs(spec["compute"]["launch_specification"]["data_disks"][0], launch_specification["data_disks"][0])
+        self.assertEqual(dict(lun=1), launch_specification["data_disks"][1])
+        self.assertEqual([], launch_specification["tags"])
+
+    def test_unmatched_paths_share_everything(self):
+        spec = get_spec()
+
+        self.assertIs(spec, clean_do_not_update_fields(spec, ["persistence", "compute.launch_specification.os_disk"]))
+
+    def test_missing_paths(self):
+        """Paths through keys that are missing, None or hold plain values are skipped"""
+
+        spec = get_spec()
+        spec["compute"]["launch_specification"]["image"] = None
+
+        cleaned = clean_do_not_update_fields(spec, ["persistence.should_persist_os_disk", "compute.os.name",
+                                                    "compute.launch_specification.image.custom",
+                                                    "compute.launch_specification.data_disks.5.size_gb",
+                                                    "compute.launch_specification.data_disks.first"])
+
+        expected = get_spec()
+        expected["compute"]["launch_specification"]["image"] = None
+        self.assertEqual(expected, cleaned)
+
+    def test_no_paths(self):
+        self.assertEqual(get_spec(), clean_do_not_update_fields(get_spec(), None))
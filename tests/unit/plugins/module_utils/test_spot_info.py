@@ -0,0 +1,50 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_info import matches_tags, project
+
+
+def make_group():
+    return dict(
+        id="sig-1",
+        name="web",
+        capacity=dict(minimum=1, maximum=4),
+        compute=dict(
+            availability_zones=[dict(name="us-east-1a", subnet_ids=["s-1"]), dict(name="us-east-1b")],
+            launch_specification=dict(image_id="ami-1", user_data="ZWNobw==")))
+
+
+class TestSpotInfo(unittest.TestCase):
+    """Unit test for the info module helpers"""
+
+    def test_project_fields(self):
+        """Only the selected paths are kept, through nested dicts and lists"""
+
+        projected = project(make_group(), fields=[
+            "id", "capacity.maximum", "compute.availability_zones.name", "compute.launch_specification.image_id",
+            "missing.path"])
+
+        self.assertEqual(dict(
+            id="sig-1",
+            capacity=dict(maximum=4),
+            compute=dict(
+                availability_zones=[dict(name="us-east-1a"), dict(name="us-east-1b")],
+                launch_specification=dict(image_id="ami-1"))), projected)
+
+    def test_project_exclude_fields(self):
+        """Excluded paths are removed, after the selection"""
+
+        projected = project(make_group(), fields=["compute"], exclude_fields=[
+            "compute.launch_specification.user_data", "compute.availability_zones.subnet_ids"])
+
+        self.assertEqual(dict(compute=dict(
+            availability_zones=[dict(name="us-east-1a"), dict(name="us-east-1b")],
+            launch_specification=dict(image_id="ami-1"))), projected)
+        self.assertEqual(make_group(), project(make_group()))
+
+    def test_matches_tags(self):
+        self.assertTrue(matches_tags(dict(app="web", env="prod"), dict(app="web")))
+        self.assertFalse(matches_tags(dict(app="web"), dict(app="web", env="prod")))
+        self.assertTrue(matches_tags(dict(), None))
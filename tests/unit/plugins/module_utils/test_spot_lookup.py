@@ -0,0 +1,58 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from spotinst_sdk2.client import SpotinstClientException
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import build_client
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_lookup import find_resources_by_name
+
+
+def list_response(items):
+    return dict(response=dict(items=items))
+
+
+class TestFindResourcesByName(unittest.TestCase):
+    """Unit test for the name lookup helper"""
+
+    def test_filtered_query(self):
+        """Only matching items are returned and converted"""
+
+        client = build_client("managed_instance_aws", "token", "act-1")
+        client.send_get = MagicMock(return_value=list_response([
+            dict(id="smi-1", config=dict(name="other")),
+            dict(id="smi-2", config=dict(name="wanted", healthCheck=dict(gracePeriod=120))),
+            dict(id="smi-3", config=dict(name="wanted")),
+        ]))
+        list_all = MagicMock()
+
+        matches = find_resources_by_name(client, "wanted", list_all)
+
+        self.assertEqual(["smi-2", "smi-3"], [mi["id"] for mi in matches])
+        self.assertEqual(120, matches[0]["config"]["health_check"]["grace_period"])
+        self.assertEqual(dict(name="wanted"), client.send_get.call_args[1]["query_params"])
+        list_all.assert_not_called()
+
+    def test_limit(self):
+        client = build_client("elastigroup_aws", "token", "act-1")
+        client.send_get = MagicMock(return_value=list_response([
+            dict(id="sig-1", name="wanted"),
+            dict(id="sig-2", name="wanted"),
+        ]))
+
+        matches = find_resources_by_name(client, "wanted", MagicMock(), limit=1)
+
+        self.assertEqual(["sig-1"], [group["id"] for group in matches])
+
+    def test_fallback_to_full_list(self):
+        """A rejected filtered query falls back to listing every resource"""
+
+        client = build_client("ocean_aws", "token", "act-1")
+        client.send_get = MagicMock(side_effect=SpotinstClientException("Error encountered while getting", "{}"))
+        list_all = MagicMock(return_value=[dict(id="o-1", name="other"), dict(id="o-2", name="wanted")])
+
+        matches = find_resources_by_name(client, "wanted", list_all, limit=1)
+
+        self.assertEqual(["o-2"], [cluster["id"] for cluster in matches])
+        list_all.assert_called_once_with()
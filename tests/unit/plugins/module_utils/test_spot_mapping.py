@@ -0,0 +1,103 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import SDK_MISSING
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_mapping import (
+    Each, MappingConverter, ModelMapping, Nested)
+
+
+class Model(object):
+
+    def __init__(self):
+        self.name = SDK_MISSING
+        self.size = SDK_MISSING
+        self.items = SDK_MISSING
+
+
+class Group(Model):
+    pass
+
+
+class Capacity(Model):
+    pass
+
+
+class Item(Model):
+    pass
+
+
+class Models:
+    Group = Group
+    Capacity = Capacity
+    Item = Item
+
+
+class TestMappingConverter(unittest.TestCase):
+    """Unit test for building models from declared field tables"""
+
+    def setUp(self):
+        self.converter = MappingConverter(Models, ModelMapping('Group', ('name',), members=[
+            Nested('capacity', ModelMapping('Capacity', (dict(ansible_field_name='target', spotinst_field_name='size'),
+                                                         'unit'),
+                                            create_only=('unit',), do_not_update=('target',))),
+            Each('items', ModelMapping('Item', ('name',), required=('name',)), 'names',
+                 prepare=lambda name: dict(name=name)),
+            Each('items', ModelMapping('Item', ('name', 'size'), constants=dict(items='extra')), 'extra_items'),
+            Nested('settings', ModelMapping('Item', ('size',)), 'settings', default=None),
+        ]))
+
+    def test_convert(self):
+        group = self.converter.convert(dict(name="web", target=2, unit="instance", names=["a", None],
+                                            extra_items=[dict(name="b", size=1)]))
+
+        self.assertEqual("web", group.name)
+        self.assertEqual((2, "instance"), (group.capacity.size, group.capacity.unit))
+        self.assertEqual(["a", "b"], [item.name for item in group.items])
+        self.assertEqual([SDK_MISSING, "extra"], [item.items for item in group.items])
+        self.assertIsNone(group.settings)
+
+    def test_assigned(self):
+        """The paths of the attributes set from options are reported, without those of dropped models"""
+
+        assigned = []
+
+        self.converter.convert(dict(name="web", target=2, names=["a", None], extra_items=[dict(size=1)]),
+                               assigned=assigned)
+
+        self.assertEqual(["name", "capacity.size", "items[0].name", "items[1].size"], assigned)
+
+    def test_update_masks(self):
+        """Updates drop create-only fields, and do_not_update fields only when listed"""
+
+        params = dict(target=2, unit="instance")
+
+        capacity = self.converter.convert(params, is_update=True).capacity
+        self.assertEqual(2, capacity.size)
+        self.assertFalse(hasattr(capacity, "unit"))
+
+        capacity = self.converter.convert(params, is_update=True, do_not_update=["target"]).capacity
+        self.assertEqual(SDK_MISSING, capacity.size)
+
+        capacity = self.converter.convert(params, do_not_update=["target"]).capacity
+        self.assertEqual((2, "instance"), (capacity.size, capacity.unit))
+
+    def test_unset_options(self):
+        """None and empty options leave attributes unset, and models missing required attributes are dropped"""
+
+        group = self.converter.convert(dict(name=None, names=[None], extra_items=[], settings={}))
+
+        self.assertEqual(SDK_MISSING, group.name)
+        self.assertEqual(SDK_MISSING, group.items)
+        self.assertIsNone(group.settings)
+
+    def test_classes_resolved_on_first_use(self):
+        class NoModels:
+            Group = Group
+
+        converter = MappingConverter(NoModels, ModelMapping('Group', ('name',), members=[
+            Nested('capacity', ModelMapping('Capacity', ('size',)), 'capacity')]))
+
+        self.assertEqual("web", converter.convert(dict(name="web")).name)
+        self.assertRaises(AttributeError, converter.convert, dict(capacity=dict(size=1)))
@@ -0,0 +1,113 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import patch
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_model import ModelConverter
+from ansible_collections.spot.cloud_modules.plugins.modules import aws_managed_instance, azure_elastigroup, azure_stateful_node
+
+
+class Model(object):
+
+    def __init__(self):
+        self.set_by = type(self).__name__
+
+
+class Group(Model):
+    pass
+
+
+class Compute(Model):
+    pass
+
+
+class Disk(Model):
+    pass
+
+
+class Models:
+    Group = Group
+    Compute = Compute
+    Disk = Disk
+
+
+class ArgumentSpec(Exception):
+    pass
+
+
+def get_argument_spec(module):
+    def capture(argument_spec, **kwargs):
+        raise ArgumentSpec(argument_spec)
+
+    with patch.object(module, "SpotAnsibleModule", side_effect=capture):
+        try:
+            module.main()
+        except ArgumentSpec as exc:
+            return exc.args[0]
+
+
+def walk(node):
+    yield node
+
+    for child in node.children.values():
+        for descendant in walk(child):
+            yield descendant
+
+
+class TestModelConverter(unittest.TestCase):
+    """Unit test for turning module options into SDK models"""
+
+    def setUp(self):
+        self.converter = ModelConverter(Models, {"group.compute.data_disks": "Disk"})
+        self.spec = dict(
+            name=dict(type="str"),
+            compute=dict(type="dict", options=dict(
+                data_disks=dict(type="list", elements="dict", options=dict(size_gb=dict(type="int")))))
+        )
+
+    def test_convert(self):
+        """Dicts become models named after their option or its override, list items share the class"""
+
+        self.converter.compile("group", self.spec)
+
+        group = self.converter.convert(dict(
+            name="web", tags=["a"],
+            compute=dict(data_disks=[dict(size_gb=1), dict(size_gb=2)], zone=None)), "group")
+
+        self.assertIsInstance(group, Group)
+        self.assertEqual(["a"], group.tags)
+        self.assertIsInstance(group.compute, Compute)
+        self.assertIsNone(group.compute.zone)
+        self.assertEqual([Disk, Disk], [type(disk) for disk in group.compute.data_disks])
+        self.assertEqual([1, 2], [disk.size_gb for disk in group.compute.data_disks])
+
+    def test_paths_outside_the_spec(self):
+        """Dicts the spec does not describe are resolved on first use and kept"""
+
+        self.converter.convert(dict(compute=dict(data_disks=[dict(size_gb=1)])), "group")
+
+        node = self.converter.roots["group"].children["compute"].children["data_disks"]
+        self.assertEqual(("group.compute.data_disks", "Disk", Disk), (node.path, node.cls_name, node.cls))
+
+    def test_compile_does_not_resolve_classes(self):
+        converter = ModelConverter(object(), {})
+
+        node = converter.compile("group", self.spec)
+
+        self.assertEqual(["group", "group.compute", "group.compute.data_disks"], [n.path for n in walk(node)])
+        self.assertTrue(all(n.cls is None for n in walk(node)))
+
+    def test_module_specs(self):
+        """Every dict option of the modules maps to a model class of the SDK"""
+
+        for module, name in ((aws_managed_instance, "managed_instance"),
+                             (azure_elastigroup, "elastigroup"),
+                             (azure_stateful_node, "stateful_node")):
+            get_argument_spec(module)
+            models = module.models.load()
+
+            missing = [node.path for node in walk(module.model_converter.roots[name])
+                       if not hasattr(models, node.cls_name)]
+
+            self.assertEqual([], missing)
@@ -0,0 +1,82 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import NameCache, get_name_cache
+
+
+class TestNameCache(unittest.TestCase):
+    """Unit test for the on-disk name -> ID cache"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "names.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_shared_between_instances(self):
+        """The account is listed once, later lookups read the file"""
+
+        list_all = MagicMock(return_value=[
+            dict(id="sig-1", name="web"),
+            dict(id="sig-2", name="db"),
+            dict(id="sig-3", name="web"),
+        ])
+
+        first = NameCache(path=self.path, ttl=300, scope="elastigroup_aws/act-1/x")
+        second = NameCache(path=self.path, ttl=300, scope="elastigroup_aws/act-1/x")
+
+        self.assertEqual(["sig-1", "sig-3"], first.get_ids("web", list_all, ("name",)))
+        self.assertEqual(["sig-2"], second.get_ids("db", list_all, ("name",)))
+        self.assertEqual([], second.get_ids("missing", list_all, ("name",)))
+        list_all.assert_called_once_with()
+
+    def test_expired_and_scoped(self):
+        list_all = MagicMock(return_value=[dict(id="smi-1", config=dict(name="mi"))])
+
+        NameCache(path=self.path, ttl=300, scope="a").get_ids("mi", list_all, ("config", "name"))
+        NameCache(path=self.path, ttl=300, scope="b").get_ids("mi", list_all, ("config", "name"))
+        NameCache(path=self.path, ttl=0, scope="a").get_ids("mi", list_all, ("config", "name"))
+
+        self.assertEqual(3, list_all.call_count)
+
+    def test_record_created_and_deleted(self):
+        cache = NameCache(path=self.path, ttl=300, scope="a")
+        list_all = MagicMock(return_value=[dict(id="o-1", name="old")])
+
+        cache.get_ids("old", list_all, ("name",))
+        cache.record_created("new", "o-2")
+        cache.record_deleted("o-1")
+
+        self.assertEqual(["o-2"], cache.get_ids("new", list_all, ("name",)))
+        self.assertEqual([], cache.get_ids("old", list_all, ("name",)))
+        list_all.assert_called_once_with()
+
+    def test_record_renamed(self):
+        """A renamed resource is only found under its new name"""
+
+        cache = NameCache(path=self.path, ttl=300, scope="a")
+        list_all = MagicMock(return_value=[dict(id="o-1", name="old"), dict(id="o-2", name="old")])
+
+        cache.get_ids("old", list_all, ("name",))
+        cache.record_renamed("new", "o-1")
+
+        self.assertEqual(["o-1"], cache.get_ids("new", list_all, ("name",)))
+        self.assertEqual(["o-2"], cache.get_ids("old", list_all, ("name",)))
+        list_all.assert_called_once_with()
+
+    def test_get_name_cache(self):
+        self.assertIsNone(get_name_cache(dict(token="t"), "ocean_aws"))
+
+        params = dict(token="secret-token", account_id="act-1", name_cache=dict(path=self.path))
+        cache = get_name_cache(params, "ocean_aws")
+
+        self.assertEqual(300, cache.ttl)
+        self.assertTrue(cache.scope.startswith("ocean_aws/act-1/"))
+        self.assertNotIn("secret-token", cache.scope)
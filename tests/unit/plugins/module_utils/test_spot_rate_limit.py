@@ -0,0 +1,76 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from ansible_collections.spot.cloud_modules.plugins.module_utils import spot_rate_limit
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_rate_limit import TokenBucket
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Unit test for the file backed token bucket"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "buckets.json")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        spot_rate_limit.reset_rate_limit()
+        shutil.rmtree(self.tmp_dir)
+
+    def bucket(self, rate=2.0, burst=2):
+        return TokenBucket(self.path, rate, burst, sleep=self.clock.sleep, clock=self.clock.time)
+
+    def test_burst_then_spaced(self):
+        """Requests beyond the burst wait 1 / rate apart, shared between instances"""
+
+        first, second = self.bucket(), self.bucket()
+
+        self.assertEqual(0.0, first.acquire("act-1"))
+        self.assertEqual(0.0, second.acquire("act-1"))
+        self.assertEqual(0.5, first.acquire("act-1"))
+        self.assertEqual(1.0, second.acquire("act-1"))
+        self.assertEqual([0.5, 1.0], self.clock.sleeps)
+
+    def test_refill_and_accounts(self):
+        """Tokens refill over time up to the burst, and each account has its own bucket"""
+
+        bucket = self.bucket()
+
+        bucket.acquire("act-1")
+        bucket.acquire("act-1")
+        self.assertEqual(0.0, bucket.acquire("act-2"))
+
+        self.clock.now += 60
+        self.assertEqual(0.0, bucket.acquire("act-1"))
+        self.assertEqual(0.0, bucket.acquire("act-1"))
+        self.assertEqual(0.5, bucket.acquire("act-1"))
+
+    def test_configure(self):
+        """The limiter is off unless the rate_limit option is set"""
+
+        spot_rate_limit.configure_rate_limit(dict(rate_limit=None))
+        self.assertIsNone(spot_rate_limit._limiter)
+
+        spot_rate_limit.configure_rate_limit(dict(rate_limit=dict(path=self.path, rate=5.0, burst=None)))
+        self.assertEqual(5, spot_rate_limit._limiter.burst)
+
+        spot_rate_limit.acquire_rate_limit("act-1")
+        self.assertTrue(os.path.exists(self.path))
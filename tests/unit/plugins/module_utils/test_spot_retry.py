@@ -0,0 +1,94 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+import requests
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import RetryPolicy, is_idempotent, parse_retry_after
+
+
+def response(status_code, headers=None):
+    return MagicMock(status_code=status_code, headers=headers or dict())
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Unit test for the API retry policy"""
+
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(max_retries=3, base_delay=1, max_delay=4, budget=30, sleep=self.sleeps.append)
+
+    def test_retry_after(self):
+        """Rate limited calls wait as long as the API asks"""
+
+        send = MagicMock(side_effect=[response(429, {"Retry-After": "7"}), response(200)])
+
+        self.assertEqual(200, self.policy.call("post", send).status_code)
+        self.assertEqual([7.0], self.sleeps)
+        self.assertEqual(dict(count=1, waited=7.0, by_reason={"429": 1}), self.policy.stats())
+
+    def test_reads_and_writes(self):
+        """Server errors are retried for reads but not for creates"""
+
+        send = MagicMock(side_effect=[response(503), response(502), response(200)])
+        self.assertEqual(200, self.policy.call("GET", send).status_code)
+
+        send = MagicMock(return_value=response(503))
+        self.assertEqual(503, self.policy.call("POST", send).status_code)
+        send.assert_called_once_with()
+
+        send = MagicMock(side_effect=requests.exceptions.ReadTimeout())
+        self.assertRaises(requests.exceptions.ReadTimeout, self.policy.call, "POST", send)
+        send.assert_called_once_with()
+
+        send = MagicMock(side_effect=[requests.exceptions.ConnectTimeout(), response(200)])
+        self.assertEqual(200, self.policy.call("POST", send).status_code)
+
+        self.assertEqual(3, self.policy.stats()["count"])
+        self.assertTrue(all(0 <= delay <= 4 for delay in self.sleeps))
+
+    def test_action_urls(self):
+        """PUT requests that start an action are retried like creates"""
+
+        roll_url = "https://api.spotinst.io/aws/ec2/group/sig-1/roll?accountId=act-1"
+
+        send = MagicMock(return_value=response(503))
+        self.assertEqual(503, self.policy.call("PUT", send, roll_url).status_code)
+        send.assert_called_once_with()
+
+        send = MagicMock(side_effect=requests.exceptions.ReadTimeout())
+        self.assertRaises(requests.exceptions.ReadTimeout, self.policy.call, "PUT", send, roll_url)
+        send.assert_called_once_with()
+
+        send = MagicMock(side_effect=[response(429), response(200)])
+        self.assertEqual(200, self.policy.call("PUT", send, roll_url).status_code)
+
+        send = MagicMock(side_effect=[response(503), response(200)])
+        self.assertEqual(200, self.policy.call("PUT", send, "https://api.spotinst.io/aws/ec2/group/sig-1").status_code)
+
+    def test_is_idempotent(self):
+        self.assertTrue(is_idempotent("PUT", "https://api.spotinst.io/aws/ec2/group/sig-1"))
+        self.assertTrue(is_idempotent("PUT"))
+        self.assertTrue(is_idempotent("DELETE", "https://api.spotinst.io/aws/ec2/group/sig-1"))
+        self.assertFalse(is_idempotent("PUT", "https://api.spotinst.io/aws/ec2/group/sig-1/scale/up?adjustment=1"))
+        self.assertFalse(is_idempotent("PUT", "https://api.spotinst.io/aws/ec2/managedInstance/smi-1/pause/"))
+        self.assertFalse(is_idempotent("POST", "https://api.spotinst.io/aws/ec2/group"))
+
+    def test_max_retries_and_budget(self):
+        send = MagicMock(return_value=response(500))
+        self.assertEqual(500, self.policy.call("GET", send).status_code)
+        self.assertEqual(4, send.call_count)
+
+        self.policy.reset()
+        send = MagicMock(return_value=response(429, {"Retry-After": "25"}))
+        self.policy.call("GET", send)
+
+        self.assertLessEqual(self.policy.stats()["waited"], 30)
+        self.assertEqual(2, send.call_count)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(3.0, parse_retry_after("3"))
+        self.assertEqual(10.0, parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
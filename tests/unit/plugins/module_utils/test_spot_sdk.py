@@ -0,0 +1,34 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import json
+import unittest
+from mock import patch
+from ansible_collections.spot.cloud_modules.plugins.module_utils import spot_sdk
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_sdk import LazyModule, is_installed, sdk_models
+
+
+class TestLazyModule(unittest.TestCase):
+    """Unit test for the deferred SDK imports"""
+
+    def test_imports_on_first_use(self):
+        """The module is imported once, when an attribute is first read"""
+
+        with patch.object(spot_sdk.importlib, "import_module", return_value=json) as import_module:
+            lazy = LazyModule("json")
+            import_module.assert_not_called()
+
+            self.assertIs(json.dumps, lazy.dumps)
+            self.assertIs(json.loads, lazy.loads)
+            import_module.assert_called_once_with("json")
+
+    def test_models(self):
+        models = sdk_models("elastigroup.aws")
+
+        self.assertEqual("spotinst_sdk2.models.elastigroup.aws", models._name)
+        self.assertEqual("Elastigroup", models.Elastigroup.__name__)
+
+    def test_is_installed(self):
+        self.assertTrue(is_installed("json"))
+        self.assertFalse(is_installed("spot_no_such_package"))
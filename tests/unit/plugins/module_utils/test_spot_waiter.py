@@ -0,0 +1,68 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_waiter import Waiter, get_waiter
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestWaiter(unittest.TestCase):
+    """Unit test for the polling waiter"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_waiter(self, **kwargs):
+        return Waiter(sleep=self.clock.sleep, clock=self.clock.time, **kwargs)
+
+    def test_immediate_return(self):
+        """No sleep happens once the condition holds"""
+
+        poll = MagicMock(side_effect=[[], ["i-1"], ["i-1", "i-2"]])
+
+        result = self.make_waiter(initial_interval=1, backoff=2, jitter=0).wait(poll, lambda v: len(v) >= 2, 300)
+
+        self.assertTrue(result.done)
+        self.assertEqual(["i-1", "i-2"], result.value)
+        self.assertEqual([1, 2], self.clock.sleeps)
+        self.assertEqual([0.0, 1.0, 3.0], [p["offset"] for p in result.to_dict()["polls"]])
+
+    def test_backoff_capped_and_timeout(self):
+        poll = MagicMock(return_value=[])
+
+        result = self.make_waiter(initial_interval=2, max_interval=5, backoff=3, jitter=0).wait(
+            poll, lambda v: False, 15)
+
+        self.assertFalse(result.done)
+        self.assertEqual([2, 5, 5, 3], self.clock.sleeps)
+        self.assertEqual(15, result.elapsed)
+        self.assertEqual(5, poll.call_count)
+
+    def test_jitter_bounds(self):
+        waiter = self.make_waiter(initial_interval=10, max_interval=10, jitter=0.5)
+        intervals = waiter.intervals()
+
+        for _ in range(50):
+            self.assertTrue(5 <= next(intervals) <= 10)
+
+    def test_get_waiter(self):
+        waiter = get_waiter(dict(wait_config=dict(initial_interval=1.0, jitter=None)))
+
+        self.assertEqual(1.0, waiter.initial_interval)
+        self.assertEqual(0.2, waiter.jitter)
+        self.assertEqual(2.0, get_waiter(dict()).initial_interval)
@@ -4,7 +4,9 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.aws_elastigroup import expand_elastigroup
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import model_to_dict
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import (
+    InstanceTracker, RollTracker, expand_elastigroup, handle_elastigroup, retrieve_group_instances)
 
 
 sys.modules['spotinst_sdk'] = MagicMock()
@@ -72,3 +74,172 @@ class TestSpotinstAwsElastigroup(unittest.TestCase):
             100, actual_eg.third_parties_integration.elastic_beanstalk.deployment_preferences.batch_size_percentage)
         self.assertEqual(
             True, actual_eg.third_parties_integration.elastic_beanstalk.deployment_preferences.automatic_roll)
+
+    def test_expand_nested_options(self):
+        """Instance types, integrations, multai and the update masks land on the right attributes"""
+
+        params = dict(
+            name="web", min_size=1, max_size=2, target=1, unit="instance", product="Linux/UNIX", image_id="ami-1",
+            spot_instance_types=["c5.large"], do_not_update=["image_id"], terminate_at_end_of_billing_hour=True,
+            tags=[dict(team="web"), dict(empty=None)], mlb_load_balancers=[dict(target_set_id="ts-1")],
+            kubernetes=dict(auto_scale=dict(is_enabled=True, headroom=dict(num_of_units=2),
+                                            down=dict(evaluation_periods=3))),
+            multai_token="token", multai_load_balancers=[dict(balancer_id="lb-1")])
+
+        eg = expand_elastigroup(module=MockModule(params), is_update=False)
+
+        self.assertEqual(["c5.large"], eg.compute.instance_types.spot)
+        self.assertEqual("Linux/UNIX", eg.compute.product)
+        self.assertEqual("ami-1", eg.compute.launch_specification.image_id)
+        self.assertEqual("instance", eg.capacity.unit)
+        self.assertTrue(eg.strategy.scaling_strategy.terminate_at_end_of_billing_hour)
+        self.assertEqual([dict(tag_key="team", tag_value="web"), dict(tag_key="empty")],
+                         model_to_dict(eg.compute.launch_specification.tags))
+        self.assertEqual([dict(target_set_id="ts-1", type="MULTAI_TARGET_SET")],
+                         model_to_dict(eg.compute.launch_specification.load_balancers_config.load_balancers))
+        self.assertEqual(2, eg.third_parties_integration.kubernetes.auto_scale.headroom.num_of_units)
+        self.assertEqual(3, eg.third_parties_integration.kubernetes.auto_scale.down.evaluation_periods)
+        self.assertEqual(dict(token="token", balancers=[dict(balancer_id="lb-1")]), model_to_dict(eg.multai))
+
+        eg = model_to_dict(expand_elastigroup(module=MockModule(params), is_update=True))
+
+        self.assertNotIn("product", eg["compute"])
+        self.assertNotIn("image_id", eg["compute"]["launch_specification"])
+        self.assertEqual(dict(minimum=1, maximum=2, target=1), eg["capacity"])
+        self.assertNotIn("scaling", eg)
+
+    def test_handle_elastigroup_check_mode(self):
+        """Check mode reports changes without creating, updating, rolling or deleting the group"""
+
+        params = dict(state="present", uniqueness_by="id", id=None, name="web", min_size=1, max_size=2, target=1,
+                      product="Linux/UNIX", image_id="ami-1", roll_config=dict(batch_size_percentage=50))
+        client = MagicMock()
+        client.get_elastigroup.return_value = model_to_dict(expand_elastigroup(module=MockModule(params), is_update=True))
+        module = MockModule(input_dict=params)
+        module.check_mode = True
+
+        group_id, message, has_changed, diff = handle_elastigroup(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        params["id"] = "sig-1"
+        group_id, message, has_changed, diff = handle_elastigroup(client=client, module=module)
+        self.assertFalse(has_changed)
+
+        params["target"] = 2
+        group_id, message, has_changed, diff = handle_elastigroup(client=client, module=module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(capacity=dict(target=2)), diff["after"])
+
+        params["state"] = "absent"
+        group_id, message, has_changed, diff = handle_elastigroup(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        client.create_elastigroup.assert_not_called()
+        client.update_elastigroup.assert_not_called()
+        client.roll_group.assert_not_called()
+        client.delete_elastigroup.assert_not_called()
+
+    def test_instance_tracker(self):
+        """Only changed instances are replaced, and the health changes are recorded as they are polled"""
+
+        clock = iter([0.0, 1.0, 2.0, 3.0])
+        tracker = InstanceTracker(lambda instance: instance.get('private_ip') is not None, clock=lambda: next(clock))
+
+        first = dict(instance_id="i-1", private_ip=None)
+        tracker.update([first, dict(instance_id="i-2", private_ip="10.0.0.2")])
+        tracker.update([dict(instance_id="i-1", private_ip=None), dict(instance_id="i-2", private_ip="10.0.0.2")])
+        self.assertIs(first, tracker.instances["i-1"])
+        self.assertEqual({"i-2"}, tracker.healthy)
+
+        tracker.update([dict(instance_id="i-1", private_ip="10.0.0.1")])
+
+        self.assertEqual([dict(instance_id="i-1", private_ip="10.0.0.1")], tracker.get_healthy_instances())
+        self.assertEqual([("i-1", "seen", 1.0), ("i-2", "seen", 1.0), ("i-2", "healthy", 1.0),
+                          ("i-1", "healthy", 3.0), ("i-2", "gone", 3.0)],
+                         [(event["instance_id"], event["event"], event["offset"]) for event in tracker.events])
+        self.assertEqual([dict(instance_id="i-1", seen_at=1.0, healthy_at=3.0, time_to_healthy=2.0),
+                          dict(instance_id="i-2", seen_at=1.0, healthy_at=1.0, time_to_healthy=0.0)],
+                         tracker.get_timeline())
+
+    def test_retrieve_group_instances(self):
+        """The wait ends once target instances are healthy and reports when each became healthy"""
+
+        params = dict(state="present", target=2, health_check_type="ELB", wait_for_instances=True,
+                      wait_timeout=60, wait_config=dict(initial_interval=0.0, jitter=0.0))
+        client = MagicMock()
+        client.get_instance_healthiness.side_effect = [
+            [dict(instance_id="i-1", health_status="UNHEALTHY")],
+            [dict(instance_id="i-1", health_status="HEALTHY"), dict(instance_id="i-2", health_status="UNHEALTHY")],
+            [dict(instance_id="i-1", health_status="HEALTHY"), dict(instance_id="i-2", health_status="HEALTHY")],
+        ]
+        module = MockModule(input_dict=params)
+        module.check_mode = False
+        module.debug = MagicMock()
+
+        instances, wait = retrieve_group_instances(client=client, module=module, group_id="sig-1")
+
+        self.assertEqual(["i-1", "i-2"], [instance["instance_id"] for instance in instances])
+        self.assertTrue(wait["done"])
+        self.assertEqual(3, len(wait["polls"]))
+        self.assertEqual(["i-1", "i-2"], [entry["instance_id"] for entry in wait["instances"]])
+        self.assertTrue(all(entry["healthy_at"] is not None for entry in wait["instances"]))
+        self.assertEqual(4, len(wait["events"]))
+        self.assertEqual(4, module.debug.call_count)
+
+    def test_roll_tracker(self):
+        """Each batch lasts from the first poll it is seen running in until the next batch or the end of the roll"""
+
+        clock = iter([0.0, 1.0, 5.0, 9.0, 12.0])
+        tracker = RollTracker(clock=lambda: next(clock))
+
+        for batch, status in ((1, "starting"), (1, "in_progress"), (2, "in_progress"), (2, "finished")):
+            tracker.update(dict(status=status, current_batch=batch, num_of_batches=2))
+
+        self.assertTrue(tracker.is_done())
+        self.assertEqual(dict(status="FINISHED", progress=None, num_of_batches=2, batches=[
+            dict(batch=1, started_at=1.0, ended_at=9.0, duration=8.0),
+            dict(batch=2, started_at=9.0, ended_at=12.0, duration=3.0)]), tracker.to_dict())
+
+    def get_roll_module(self, client):
+        params = dict(state="present", uniqueness_by="id", id="sig-1", name="web", min_size=1, max_size=2, target=1,
+                      product="Linux/UNIX", image_id="ami-1", roll_config=dict(batch_size_percentage=50),
+                      wait_for_roll=True, wait_for_roll_timeout=60, wait_config=dict(initial_interval=0.0, jitter=0.0))
+        client.get_elastigroup.return_value = dict(name="web", capacity=dict(minimum=1, maximum=2, target=2))
+        client.roll_group.return_value = dict(items=[dict(id="sbgd-1", status="STARTING")])
+        module = MockModule(input_dict=params)
+        module.check_mode = False
+        module.fail_json = MagicMock(side_effect=SystemExit)
+
+        return module
+
+    def test_wait_for_roll(self):
+        """The update waits for the roll it started and returns its batches"""
+
+        client = MagicMock()
+        client.get_deployment_status.side_effect = [
+            [dict(id="sbgd-1", status="IN_PROGRESS", current_batch=1, num_of_batches=2)],
+            [dict(id="sbgd-1", status="IN_PROGRESS", current_batch=2, num_of_batches=2)],
+            [dict(id="sbgd-1", status="FINISHED", current_batch=2, num_of_batches=2)],
+        ]
+        roll = dict()
+
+        group_id, message, has_changed, diff = handle_elastigroup(
+            client=client, module=self.get_roll_module(client), roll=roll)
+
+        self.assertEqual('Updated and rolled the group successfully.', message)
+        client.get_deployment_status.assert_called_with(group_id="sig-1", roll_id="sbgd-1")
+        self.assertEqual(("sbgd-1", "FINISHED"), (roll["id"], roll["status"]))
+        self.assertEqual([1, 2], [batch["batch"] for batch in roll["batches"]])
+        self.assertTrue(all(batch["duration"] is not None for batch in roll["batches"]))
+        self.assertEqual(3, len(roll["wait"]["polls"]))
+
+    def test_wait_for_failed_roll(self):
+        client = MagicMock()
+        client.get_deployment_status.return_value = [dict(id="sbgd-1", status="FAILED", current_batch=1)]
+        module = self.get_roll_module(client)
+
+        self.assertRaises(SystemExit, handle_elastigroup, client=client, module=module)
+
+        kwargs = module.fail_json.call_args[1]
+        self.assertEqual("Roll sbgd-1 of group sig-1 ended with status FAILED", kwargs["msg"])
+        self.assertEqual("FAILED", kwargs["roll"]["status"])
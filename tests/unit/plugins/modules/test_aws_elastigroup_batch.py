@@ -0,0 +1,64 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from spotinst_sdk2.client import SpotinstClientException
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_elastigroup_aws import elastigroup_fields
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_elastigroup_batch import find_duplicate_names, handle_groups
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = input_dict
+        self.check_mode = False
+
+    def debug(self, msg):
+        pass
+
+
+def make_group(name, **kwargs):
+    group = dict((key, spec.get('default')) for key, spec in elastigroup_fields.items())
+    group.update(name=name, min_size=1, max_size=2, target=1, product="Linux/UNIX", availability_vs_cost="balanced",
+                 availability_zones=[dict(name="us-east-1a")], image_id="ami-1", security_group_ids=["sg-1"],
+                 spot_instance_types=["c5.large"])
+    group.update(kwargs)
+    return group
+
+
+class TestSpotinstAwsElastigroupBatch(unittest.TestCase):
+    """Unit test for the aws_elastigroup_batch module"""
+
+    def test_handle_groups(self):
+        """Names are resolved from one listing and a failed group does not stop the others"""
+
+        client = MagicMock()
+        client.get_elastigroups.return_value = [dict(id="sig-1", name="same"), dict(id="sig-2", name="gone")]
+        client.get_elastigroup.return_value = dict(
+            id="sig-1", name="same", capacity=dict(minimum=1, maximum=2, target=1),
+            strategy=dict(availability_vs_cost="balanced"),
+            compute=dict(product="Linux/UNIX", availability_zones=[dict(name="us-east-1a")],
+                         instance_types=dict(spot=["c5.large"]),
+                         launch_specification=dict(image_id="ami-1", security_group_ids=["sg-1"])))
+        client.create_elastigroup.return_value = dict(id="sig-3")
+        client.delete_elastigroup.side_effect = SpotinstClientException("Error encountered while deleting", "{}")
+
+        module = MockModule(dict(token="token", account_id=None, credentials_path=None, max_workers=2, groups=[
+            make_group("same"), make_group("new"), make_group("gone", state="absent"),
+        ]))
+
+        results = handle_groups(client=client, module=module)
+
+        self.assertEqual(["same", "new", "gone"], [result["name"] for result in results])
+        self.assertFalse(results[0]["changed"])
+        self.assertEqual("sig-3", results[1]["group_id"])
+        self.assertTrue(results[2]["failed"])
+        client.get_elastigroups.assert_called_once_with()
+        client.update_elastigroup.assert_not_called()
+
+    def test_find_duplicate_names(self):
+        groups = [make_group("a"), make_group("b"), make_group("a"), make_group("b", uniqueness_by="id", id="sig-1")]
+
+        self.assertEqual(["a"], find_duplicate_names(groups))
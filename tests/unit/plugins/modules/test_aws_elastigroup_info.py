@@ -0,0 +1,92 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_elastigroup_info import get_groups_info
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = dict(names=None, ids=None, tags=None, include=["instances"], fields=None, exclude_fields=None,
+                           max_workers=4)
+        self.params.update(input_dict)
+        self.warnings = []
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+
+
+def make_group(group_id, name, tags):
+    return dict(id=group_id, name=name, capacity=dict(target=1), compute=dict(launch_specification=dict(
+        user_data="ZWNobw==", tags=[dict(tag_key=key, tag_value=value) for key, value in tags.items()])))
+
+
+class TestSpotinstAwsElastigroupInfo(unittest.TestCase):
+    """Unit test for the aws_elastigroup_info module"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_elastigroups.return_value = [
+            make_group("sig-1", "web", dict(app="web", env="prod")),
+            make_group("sig-2", "web-dev", dict(app="web", env="dev")),
+            make_group("sig-3", "db", dict(app="db", env="prod")),
+        ]
+        self.client.get_elastigroup.side_effect = lambda group_id: make_group(group_id, "by-id", dict())
+        self.client.get_elastigroup_active_instances.side_effect = lambda group_id: [dict(instance_id=group_id + "-i")]
+
+    def test_filters_and_projection(self):
+        """Names and tags select groups from one listing, and fields trim the result"""
+
+        module = MockModule(dict(names=["web", "db"], tags=dict(env="prod"), fields=["id", "capacity"]))
+
+        groups = get_groups_info(self.client, module)
+
+        self.assertEqual([
+            dict(id="sig-1", capacity=dict(target=1), instances=[dict(instance_id="sig-1-i")]),
+            dict(id="sig-3", capacity=dict(target=1), instances=[dict(instance_id="sig-3-i")]),
+        ], groups)
+        self.client.get_elastigroups.assert_called_once_with()
+
+    def test_ids_only(self):
+        """IDs alone are fetched directly, without listing the account"""
+
+        module = MockModule(dict(ids=["sig-7", "sig-8"], include=[],
+                                 exclude_fields=["compute.launch_specification.user_data"]))
+
+        groups = get_groups_info(self.client, module)
+
+        self.assertEqual(["sig-7", "sig-8"], [group["id"] for group in groups])
+        self.assertNotIn("user_data", groups[0]["compute"]["launch_specification"])
+        self.client.get_elastigroups.assert_not_called()
+        self.client.get_elastigroup_active_instances.assert_not_called()
+
+    def test_missing_ids(self):
+        """IDs that are not in the account are skipped with a warning"""
+
+        self.client.get_elastigroup.side_effect = lambda group_id: (
+            make_group(group_id, "by-id", dict()) if group_id != "sig-9" else self.fail_fetch())
+        module = MockModule(dict(ids=["sig-1", "sig-9"], include=[]))
+
+        groups = get_groups_info(self.client, module)
+
+        self.assertEqual(["sig-1"], [group["id"] for group in groups])
+        self.assertEqual(["Resources not found: sig-9"], module.warnings)
+
+    def test_failed_id_fetch(self):
+        """A failed fetch of a group that exists fails the module"""
+
+        self.client.get_elastigroup.side_effect = lambda group_id: self.fail_fetch()
+
+        with self.assertRaises(AssertionError) as context:
+            get_groups_info(self.client, MockModule(dict(ids=["sig-1", "sig-9"], include=[])))
+
+        self.assertIn("Failed to fetch 1 of 2 resources: boom", str(context.exception))
+
+    def fail_fetch(self):
+        raise Exception("boom")
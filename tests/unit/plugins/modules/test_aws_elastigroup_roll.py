@@ -0,0 +1,90 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_elastigroup_roll import handle_groups, resolve_group_ids
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = input_dict
+        self.check_mode = False
+
+    def debug(self, msg):
+        pass
+
+
+def make_params(groups, **kwargs):
+    params = dict(token="token", account_id=None, credentials_path=None, groups=groups, batch_size_percentage=50,
+                  grace_period=300, health_check_type=None, max_workers=1, max_failures=0, wait_for_roll_timeout=60,
+                  wait_config=dict(initial_interval=0.0, jitter=0.0))
+    params.update(kwargs)
+    return params
+
+
+def make_client(statuses):
+    client = MagicMock()
+    client.get_elastigroups.return_value = [dict(id="sig-1", name="web"), dict(id="sig-5", name="twin"),
+                                            dict(id="sig-6", name="twin")]
+    client.roll_group.side_effect = lambda group_roll, group_id: dict(items=[dict(id="roll-" + group_id)])
+    client.get_deployment_status.side_effect = lambda group_id, roll_id: [
+        dict(id=roll_id, status=statuses[group_id], current_batch=1, num_of_batches=1)]
+    return client
+
+
+class TestSpotinstAwsElastigroupRoll(unittest.TestCase):
+    """Unit test for the aws_elastigroup_roll module"""
+
+    def test_handle_groups(self):
+        """Names are resolved from one listing and every roll is waited for"""
+
+        client = make_client({"sig-1": "FINISHED", "sig-2": "FINISHED"})
+
+        results = handle_groups(client=client, module=MockModule(make_params(["web", "sig-2"])))
+
+        self.assertEqual(["web", "sig-2"], [result["group"] for result in results])
+        self.assertEqual(["sig-1", "sig-2"], [result["group_id"] for result in results])
+        self.assertEqual(["roll-sig-1", "roll-sig-2"], [result["roll"]["id"] for result in results])
+        self.assertEqual([1], [batch["batch"] for batch in results[0]["roll"]["batches"]])
+        self.assertEqual(50, client.roll_group.call_args[1]["group_roll"].batch_size_percentage)
+        client.get_elastigroups.assert_called_once_with()
+
+    def test_failure_budget(self):
+        """No roll starts once more than max_failures rolls failed"""
+
+        client = make_client({"sig-1": "FINISHED", "sig-2": "FAILED", "sig-3": "FINISHED"})
+
+        results = handle_groups(client=client, module=MockModule(make_params(["sig-2", "missing", "sig-3"])))
+
+        self.assertEqual("Roll roll-sig-2 of group sig-2 ended with status FAILED", results[0]["msg"])
+        self.assertTrue(results[0]["failed"])
+        self.assertTrue(results[1]["skipped"])
+        self.assertTrue(results[2]["skipped"])
+        self.assertEqual(1, client.roll_group.call_count)
+
+        results = handle_groups(client=client, module=MockModule(make_params(["sig-2", "missing", "sig-3"],
+                                                                             max_failures=2)))
+
+        self.assertEqual("Found no single group named missing", results[1]["msg"])
+        self.assertEqual("FINISHED", results[2]["roll"]["status"])
+
+    def test_check_mode(self):
+        client = make_client(dict())
+        module = MockModule(make_params(["web"]))
+        module.check_mode = True
+
+        results = handle_groups(client=client, module=module)
+
+        self.assertEqual([dict(group="web", group_id="sig-1", changed=True, message="Group would be rolled.")], results)
+        client.roll_group.assert_not_called()
+
+    def test_resolve_group_ids(self):
+        """IDs are kept as they are, and names matching no group or several map to None"""
+
+        client = make_client(dict())
+
+        self.assertEqual(dict(web="sig-1", twin=None, missing=None, **{"sig-9": "sig-9"}),
+                         resolve_group_ids(client, ["web", "twin", "missing", "sig-9"]))
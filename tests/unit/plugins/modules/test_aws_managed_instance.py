@@ -5,7 +5,7 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.aws_managed_instance import turn_to_model
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_managed_instance import handle_managed_instance, turn_to_model
 from spotinst_sdk2.models.managed_instance.aws import (
     ManagedInstance,
     Persistence,
@@ -32,8 +32,13 @@ sys.modules['spotinst_sdk'] = MagicMock()
 
 class MockModule:
 
-    def __init__(self, input_dict):
+    def __init__(self, input_dict, check_mode=False):
         self.params = input_dict
+        self.custom_params = input_dict
+        self.check_mode = check_mode
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
 
 class TestTurnToModel(unittest.TestCase):
     """Unit test for the turn to model helper function"""
@@ -189,3 +194,42 @@ class TestTurnToModel(unittest.TestCase):
         self.assertEqual(exp_first_record_set.name, act_first_record_set.name)
         self.assertEqual(exp_first_record_set.use_public_ip, act_first_record_set.use_public_ip)
         self.assertEqual(exp_first_record_set.use_public_dns, act_first_record_set.use_public_dns)
+
+
+class TestCheckMode(unittest.TestCase):
+    """Unit test for running the managed instance handler in check mode"""
+
+    def test_check_mode(self):
+        """Check mode reports changes without creating, updating or deleting the managed instance"""
+
+        client = MagicMock()
+        client.get_managed_instance.return_value = dict(id="smi-1", config=dict(name="n", description="old"))
+        params = dict(state="present", uniqueness_by="id", id=None, do_not_update=[], action=None,
+                      managed_instance=dict(name="n", description="old"))
+        module = MockModule(params, check_mode=True)
+
+        resource_id, message, has_changed, diff = handle_managed_instance(client, module)
+        self.assertTrue(has_changed)
+
+        params["id"] = "smi-1"
+        resource_id, message, has_changed, diff = handle_managed_instance(client, module)
+        self.assertFalse(has_changed)
+
+        params["managed_instance"]["description"] = "new"
+        resource_id, message, has_changed, diff = handle_managed_instance(client, module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(description="new"), diff["after"])
+
+        params["managed_instance"]["description"] = "old"
+        params["action"] = "pause"
+        resource_id, message, has_changed, diff = handle_managed_instance(client, module)
+        self.assertTrue(has_changed)
+
+        params["state"] = "absent"
+        resource_id, message, has_changed, diff = handle_managed_instance(client, module)
+        self.assertTrue(has_changed)
+
+        client.create_managed_instance.assert_not_called()
+        client.update_managed_instance.assert_not_called()
+        client.delete_managed_instance.assert_not_called()
+        client.pause_managed_instance.assert_not_called()
@@ -0,0 +1,55 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_client import build_client
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_managed_instance_info import get_managed_instances_info
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = dict(names=None, ids=None, tags=None, include=["status"], fields=None, exclude_fields=None,
+                           max_workers=4)
+        self.params.update(input_dict)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+
+
+def make_mi(mi_id, name, tags):
+    return dict(id=mi_id, config=dict(name=name, compute=dict(launch_specification=dict(
+        tags=[dict(tag_key=key, tag_value=value) for key, value in tags.items()]))))
+
+
+class TestSpotinstAwsManagedInstanceInfo(unittest.TestCase):
+    """Unit test for the aws_managed_instance_info module"""
+
+    def setUp(self):
+        self.client = build_client("managed_instance_aws", "token", "act-1")
+        self.client.get_managed_instances = MagicMock(return_value=[
+            make_mi("smi-1", "db-1", dict(role="db")), make_mi("smi-2", "web-1", dict(role="web"))])
+        self.client.get_managed_instance_status = MagicMock(side_effect=lambda mi_id: dict(id=mi_id, status="ACTIVE"))
+
+    def test_names_use_server_side_filter(self):
+        """Each name is looked up with the name filter, without listing the account"""
+
+        self.client.send_get = MagicMock(return_value=dict(response=dict(items=[dict(id="smi-1", config=dict(name="db-1"))])))
+
+        managed_instances = get_managed_instances_info(self.client, MockModule(dict(names=["db-1"])))
+
+        self.assertEqual([dict(id="smi-1", config=dict(name="db-1"), status=dict(id="smi-1", status="ACTIVE"))],
+                         managed_instances)
+        self.assertEqual(dict(name="db-1"), self.client.send_get.call_args[1]["query_params"])
+        self.client.get_managed_instances.assert_not_called()
+
+    def test_tags(self):
+        """Tags are matched on the listed managed instances"""
+
+        managed_instances = get_managed_instances_info(self.client, MockModule(dict(
+            tags=dict(role="web"), include=[], fields=["id", "config.name"])))
+
+        self.assertEqual([dict(id="smi-2", config=dict(name="web-1"))], managed_instances)
+        self.client.get_managed_instance_status.assert_not_called()
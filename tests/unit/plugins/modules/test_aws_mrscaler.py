@@ -4,7 +4,8 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.aws_mrscaler import expand_emr_request
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import model_to_dict
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_mrscaler import expand_emr_request, handle_emr
 
 
 sys.modules['spotinst_sdk'] = MagicMock()
@@ -54,3 +55,71 @@ class TestSpotinstMrScaler(unittest.TestCase):
 
         self.assertEqual("ON_DEMAND", actual_mrScaler.compute.instance_groups.core_group.life_cycle)
         self.assertEqual(1, actual_mrScaler.compute.instance_groups.core_group.target)
+
+    def test_expand_emr_request_nested_options(self):
+        """Wrapping, configurations and scaling metrics are built, and updates only carry updatable fields"""
+
+        input_dict = dict(
+            name="test_name",
+            region="us-west-2",
+            strategy=dict(wrap=dict(source_cluster_id="j-1")),
+            scaling=dict(up=[dict(metric_name="AppsPending", threshold=100, action=dict(type="adjustment"),
+                                  dimensions=[dict(name="JobFlowId")])]),
+            compute=dict(
+                ec2_key_name="key",
+                configurations=dict(file=dict(bucket="bucket", key="configurations.json")),
+                instance_groups=dict(
+                    master_group=dict(target=1),
+                    core_group=dict(target=1, capacity=dict(target=2)),
+                    task_group=dict(life_cycle="SPOT", capacity=dict(target=3)))),
+            cluster=dict(log_uri="s3://logs", termination_protected=True)
+        )
+
+        emr = expand_emr_request(module=MockModule(input_dict=input_dict), is_update=False)
+
+        self.assertEqual("j-1", emr.strategy.wrapping.source_cluster_id)
+        self.assertEqual("configurations.json", emr.compute.configurations.file.key)
+        self.assertEqual("AppsPending", emr.scaling.up[0].metric_name)
+        self.assertEqual(100, emr.scaling.up[0].threshold)
+        self.assertEqual("adjustment", emr.scaling.up[0].action.type)
+        self.assertEqual("JobFlowId", emr.scaling.up[0].dimensions[0].name)
+
+        input_dict["do_not_update"] = ["task_group"]
+        assigned = []
+        emr = expand_emr_request(module=MockModule(input_dict=input_dict), is_update=True, assigned=assigned)
+
+        self.assertEqual(
+            dict(name="test_name", compute=dict(instance_groups=dict(core_group=dict(capacity=dict(target=2)))),
+                 cluster=dict(termination_protected=True)),
+            model_to_dict(emr))
+        self.assertEqual(["name", "compute.instance_groups.core_group.capacity.target", "cluster.termination_protected"],
+                         assigned)
+
+    def test_handle_emr_check_mode(self):
+        """Check mode reports changes without creating, updating or deleting the cluster"""
+
+        client = MagicMock()
+        client.get_emr.return_value = dict(id="simrs-1", name="test_name", description="old")
+        module = MockModule(input_dict=dict(state="present", uniqueness_by="id", id=None, name="test_name",
+                                            description="old"))
+        module.check_mode = True
+
+        emr_id, message, has_changed, diff = handle_emr(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        module.params["id"] = "simrs-1"
+        emr_id, message, has_changed, diff = handle_emr(client=client, module=module)
+        self.assertFalse(has_changed)
+
+        module.params["description"] = "new"
+        emr_id, message, has_changed, diff = handle_emr(client=client, module=module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(description="new"), diff["after"])
+
+        module.params["state"] = "absent"
+        emr_id, message, has_changed, diff = handle_emr(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        client.create_emr.assert_not_called()
+        client.update_emr.assert_not_called()
+        client.delete_emr.assert_not_called()
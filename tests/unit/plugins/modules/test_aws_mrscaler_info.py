@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_mrscaler_info import get_mrscalers_info
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = dict(names=None, ids=None, include=["instances"], fields=None, exclude_fields=None,
+                           max_workers=4)
+        self.params.update(input_dict)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+
+
+class TestSpotinstAwsMrScalerInfo(unittest.TestCase):
+    """Unit test for the aws_mrscaler_info module"""
+
+    def test_all_with_details(self):
+        """Every MR Scaler is listed once and its details are fetched"""
+
+        client = MagicMock()
+        client.get_all_emr.return_value = [
+            dict(id="simrs-1", name="etl", compute=dict(bootstrap_actions=dict(file=dict(bucket="b")))),
+            dict(id="simrs-2", name="adhoc")]
+        client.get_emr_instances.side_effect = lambda emr_id: [dict(instance_id=emr_id + "-i")]
+        client.get_emr_cluster.side_effect = lambda emr_id: dict(cluster_id="j-" + emr_id)
+
+        mrscalers = get_mrscalers_info(client, MockModule(dict(
+            include=["instances", "cluster"], exclude_fields=["compute.bootstrap_actions"])))
+
+        self.assertEqual([
+            dict(id="simrs-1", name="etl", compute=dict(), instances=[dict(instance_id="simrs-1-i")],
+                 cluster=dict(cluster_id="j-simrs-1")),
+            dict(id="simrs-2", name="adhoc", instances=[dict(instance_id="simrs-2-i")],
+                 cluster=dict(cluster_id="j-simrs-2")),
+        ], mrscalers)
+        client.get_all_emr.assert_called_once_with()
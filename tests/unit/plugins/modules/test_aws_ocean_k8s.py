@@ -5,14 +5,16 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.aws_ocean_k8s import expand_ocean_request
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_diff import model_to_dict
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_ocean_k8s import expand_ocean_request, handle_ocean
 
 sys.modules['spotinst_sdk'] = MagicMock()
 
 class MockModule:
 
-    def __init__(self, input_dict):
+    def __init__(self, input_dict, check_mode=False):
         self.params = input_dict
+        self.check_mode = check_mode
 
 class TestSpotinstOceanK8s(unittest.TestCase):
     """Unit test for the aws_ocean_k8s module"""
@@ -43,3 +45,41 @@ class TestSpotinstOceanK8s(unittest.TestCase):
         self.assertEqual("test_key_pair", actual_ocean.compute.launch_specification.key_pair)
         self.assertEqual("test_image_id", actual_ocean.compute.launch_specification.image_id)
         self.assertEqual(["test_security_group_ids"], actual_ocean.compute.launch_specification.security_group_ids)
+
+    def test_expand_ocean_request_update(self):
+        """Updates leave out the region and the options listed in do_not_update"""
+
+        input_dict = dict(
+            name="test_name",
+            region="test_region",
+            do_not_update=["compute"],
+            capacity=dict(minimum=0, target=2),
+            compute=dict(subnet_ids=["subnet-1"])
+        )
+        assigned = []
+
+        ocean = expand_ocean_request(module=MockModule(input_dict=input_dict), is_update=True, assigned=assigned)
+
+        self.assertEqual(dict(name="test_name", capacity=dict(minimum=0, target=2)), model_to_dict(ocean))
+        self.assertEqual(["name", "capacity.minimum", "capacity.target"], assigned)
+
+    def test_handle_ocean_check_mode(self):
+        """Check mode reports the update without sending it"""
+
+        client = MagicMock()
+        client.get_ocean_cluster.return_value = dict(id="o-1", name="test_name", capacity=dict(minimum=0, target=2))
+        module = MockModule(input_dict=dict(
+            id="o-1", uniqueness_by="id", state="present", name="test_name", capacity=dict(minimum=0, target=3)
+        ), check_mode=True)
+
+        ocean_id, message, has_changed, diff = handle_ocean(client=client, module=module)
+
+        self.assertEqual("o-1", ocean_id)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(capacity=dict(target=3)), diff["after"])
+        client.update_ocean_cluster.assert_not_called()
+
+        module.params["capacity"]["target"] = 2
+        ocean_id, message, has_changed, diff = handle_ocean(client=client, module=module)
+
+        self.assertFalse(has_changed)
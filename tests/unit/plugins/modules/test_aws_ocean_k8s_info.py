@@ -0,0 +1,38 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_ocean_aws import OCEAN_CLUSTER_URL
+from ansible_collections.spot.cloud_modules.plugins.modules.aws_ocean_k8s_info import get_clusters_info
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = dict(names=None, ids=None, tags=None, include=["instances"], fields=None, exclude_fields=None,
+                           max_workers=4)
+        self.params.update(input_dict)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+
+
+class TestSpotinstAwsOceanK8sInfo(unittest.TestCase):
+    """Unit test for the aws_ocean_k8s_info module"""
+
+    def test_ids_with_instances(self):
+        """Clusters given by ID are fetched directly, with their instances"""
+
+        client = MagicMock()
+        client.get_ocean_cluster.side_effect = lambda ocean_id: dict(id=ocean_id, name="prod", capacity=dict(target=3))
+        client.convert_json.side_effect = lambda content, convert: content
+        client.send_get.side_effect = lambda url, entity_name, query_params=None: dict(response=dict(items=[
+            dict(instance_id="i-1", url=url)]))
+
+        clusters = get_clusters_info(client, MockModule(dict(ids=["o-1"], fields=["id", "capacity.target"])))
+
+        self.assertEqual([dict(id="o-1", capacity=dict(target=3), instances=[
+            dict(instance_id="i-1", url=OCEAN_CLUSTER_URL + "/o-1/instances")])], clusters)
+        client.get_all_ocean_cluster.assert_not_called()
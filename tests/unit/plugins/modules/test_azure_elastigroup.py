@@ -5,7 +5,7 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.azure_elastigroup import turn_to_model
+from ansible_collections.spot.cloud_modules.plugins.modules.azure_elastigroup import handle_elastigroup, turn_to_model
 from spotinst_sdk2.models.elastigroup.azure_v3 import (
     Capacity,
     Health,
@@ -28,8 +28,13 @@ sys.modules['spotinst_sdk'] = MagicMock()
 
 class MockModule:
 
-    def __init__(self, input_dict):
+    def __init__(self, input_dict, check_mode=False):
         self.params = input_dict
+        self.custom_params = input_dict
+        self.check_mode = check_mode
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
 
 class TestTurnToModel(unittest.TestCase):
     """Unit test for the turn to model helper function"""
@@ -281,3 +286,36 @@ class TestTurnToModel(unittest.TestCase):
         self.assertEqual(actual_tags[0].tag_value, expected_tags[0].tag_value)
         self.assertEqual(actual_tags[1].tag_key, expected_tags[1].tag_key)
         self.assertEqual(actual_tags[1].tag_value, expected_tags[1].tag_value)
+
+
+class TestCheckMode(unittest.TestCase):
+    """Unit test for running the elastigroup handler in check mode"""
+
+    def test_check_mode(self):
+        """Check mode reports changes without creating, updating or deleting the elastigroup"""
+
+        client = MagicMock()
+        client.get_elastigroup.return_value = dict(id="sig-1", name="n", description="old")
+        params = dict(state="present", uniqueness_by="id", id=None, do_not_update=[], action=None,
+                      elastigroup=dict(name="n", description="old"))
+        module = MockModule(params, check_mode=True)
+
+        resource_id, message, has_changed, diff = handle_elastigroup(client, module)
+        self.assertTrue(has_changed)
+
+        params["id"] = "sig-1"
+        resource_id, message, has_changed, diff = handle_elastigroup(client, module)
+        self.assertFalse(has_changed)
+
+        params["elastigroup"]["description"] = "new"
+        resource_id, message, has_changed, diff = handle_elastigroup(client, module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(description="new"), diff["after"])
+
+        params["state"] = "absent"
+        resource_id, message, has_changed, diff = handle_elastigroup(client, module)
+        self.assertTrue(has_changed)
+
+        client.create_elastigroup.assert_not_called()
+        client.update_elastigroup.assert_not_called()
+        client.delete_elastigroup.assert_not_called()
@@ -2,10 +2,15 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import os
+import shutil
+import tempfile
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.azure_stateful_node import turn_to_model
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_name_cache import get_name_cache
+from ansible_collections.spot.cloud_modules.plugins.modules.azure_stateful_node import (
+    handle_stateful_node, handle_update_stateful_node, turn_to_model)
 from spotinst_sdk2.models.stateful_node import (
     Persistence,
     Health,
@@ -29,8 +34,18 @@ sys.modules['spotinst_sdk'] = MagicMock()
 
 class MockModule:
 
-    def __init__(self, input_dict):
+    def __init__(self, input_dict, check_mode=False):
         self.params = input_dict
+        self.custom_params = input_dict
+        self.check_mode = check_mode
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+        self.custom_params = input_dict
+        self.check_mode = False
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
 
 
 class TestTurnToModel(unittest.TestCase):
@@ -299,3 +314,71 @@ class TestTurnToModel(unittest.TestCase):
         self.assertEqual(actual_tags[0].tag_value, expected_tags[0].tag_value)
         self.assertEqual(actual_tags[1].tag_key, expected_tags[1].tag_key)
         self.assertEqual(actual_tags[1].tag_value, expected_tags[1].tag_value)
+
+
+class TestNameCacheRename(unittest.TestCase):
+    """Unit test for keeping the name cache in sync on update"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_update_records_rename(self):
+        """A node renamed by ID is only found under its new name"""
+
+        params = dict(token="token", account_id="act-1", do_not_update=[], action=None,
+                      stateful_node=dict(name="new"), name_cache=dict(path=os.path.join(self.tmp_dir, "names.json"), ttl=300))
+        name_cache = get_name_cache(params, "stateful_node_azure")
+        name_cache.get_ids("old", lambda: [dict(id="ssn-1", name="old")], ("name",))
+
+        client = MagicMock()
+        client.get_stateful_node.return_value = dict(id="ssn-1", name="old")
+        client.update_stateful_node.return_value = dict(id="ssn-1")
+
+        handle_update_stateful_node(client, dict(name="new"), "ssn-1", MockModule(params))
+
+        list_all = MagicMock()
+        self.assertEqual(["ssn-1"], name_cache.get_ids("new", list_all, ("name",)))
+        self.assertEqual([], name_cache.get_ids("old", list_all, ("name",)))
+        list_all.assert_not_called()
+
+
+class TestCheckMode(unittest.TestCase):
+    """Unit test for running the stateful node handler in check mode"""
+
+    def test_check_mode(self):
+        """Check mode reports changes without creating, updating or deleting the stateful node"""
+
+        client = MagicMock()
+        client.get_stateful_node.return_value = dict(id="ssn-1", name="n", description="old")
+        params = dict(state="present", uniqueness_by="id", id=None, do_not_update=[], action=None,
+                      stateful_node=dict(name="n", description="old"))
+        module = MockModule(params, check_mode=True)
+
+        resource_id, message, has_changed, diff = handle_stateful_node(client, module)
+        self.assertTrue(has_changed)
+
+        params["id"] = "ssn-1"
+        resource_id, message, has_changed, diff = handle_stateful_node(client, module)
+        self.assertFalse(has_changed)
+
+        params["stateful_node"]["description"] = "new"
+        resource_id, message, has_changed, diff = handle_stateful_node(client, module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(description="new"), diff["after"])
+
+        params["stateful_node"]["description"] = "old"
+        params["action"] = "pause"
+        resource_id, message, has_changed, diff = handle_stateful_node(client, module)
+        self.assertTrue(has_changed)
+
+        params["state"] = "absent"
+        resource_id, message, has_changed, diff = handle_stateful_node(client, module)
+        self.assertTrue(has_changed)
+
+        client.create_stateful_node.assert_not_called()
+        client.update_stateful_node.assert_not_called()
+        client.delete_stateful_node.assert_not_called()
+        client.update_stateful_node_state.assert_not_called()
@@ -0,0 +1,53 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.modules.azure_stateful_node_info import get_stateful_nodes_info
+
+
+class MockModule:
+
+    def __init__(self, input_dict):
+        self.params = dict(names=None, ids=None, tags=None, include=["status"], fields=None, exclude_fields=None,
+                           max_workers=4)
+        self.params.update(input_dict)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError(msg)
+
+
+class TestSpotinstAzureStatefulNodeInfo(unittest.TestCase):
+    """Unit test for the azure_stateful_node_info module"""
+
+    def test_tags_and_details(self):
+        """Tags filter the listing and the requested details are added"""
+
+        client = MagicMock()
+        client.get_all_stateful_nodes.return_value = [
+            dict(id="ssn-1", name="sql", compute=dict(launch_specification=dict(tags=[dict(tag_key="env", tag_value="prod")]))),
+            dict(id="ssn-2", name="dev", compute=dict(launch_specification=dict(tags=[dict(tag_key="env", tag_value="dev")]))),
+        ]
+        client.get_stateful_node_status.return_value = dict(status="ACTIVE")
+        client.get_stateful_node_resources.return_value = dict(data_disks=[])
+
+        stateful_nodes = get_stateful_nodes_info(client, MockModule(dict(
+            tags=dict(env="prod"), include=["status", "resources"], exclude_fields=["compute"])))
+
+        self.assertEqual([dict(id="ssn-1", name="sql", status=dict(status="ACTIVE"), resources=dict(data_disks=[]))],
+                         stateful_nodes)
+        client.get_stateful_node_status.assert_called_once_with("ssn-1")
+
+    def test_failed_fetch(self):
+        """A failed detail fetch fails the module"""
+
+        client = MagicMock()
+        client.get_stateful_node.side_effect = lambda node_id: dict(id=node_id, name=node_id)
+        client.get_stateful_node_status.side_effect = Exception("boom")
+
+        with self.assertRaises(AssertionError) as context:
+            get_stateful_nodes_info(client, MockModule(dict(ids=["ssn-1", "ssn-2"])))
+
+        self.assertIn("Failed to fetch 2 of 2", str(context.exception))
+        client.get_all_stateful_nodes.assert_not_called()
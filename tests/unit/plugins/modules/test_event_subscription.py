@@ -5,7 +5,7 @@ __metaclass__ = type
 import unittest
 import sys
 from mock import MagicMock
-from ansible_collections.spot.cloud_modules.plugins.modules.event_subscription import expand_subscription_request
+from ansible_collections.spot.cloud_modules.plugins.modules.event_subscription import expand_subscription_request, handle_subscription
 
 
 sys.modules['spotinst_sdk'] = MagicMock()
@@ -38,3 +38,31 @@ class TestSpotinstEventSubscription(unittest.TestCase):
         self.assertEqual("test_endpoint", actual_event_subscription.endpoint)
         self.assertEqual("test_event_type", actual_event_subscription.event_type)
         self.assertEqual("test_event_format", actual_event_subscription.event_format)
+
+    def test_handle_subscription_check_mode(self):
+        """Check mode reports changes without creating, updating or deleting the subscription"""
+
+        client = MagicMock()
+        client.get_event_subscription.return_value = dict(id="sub-1", resource_id="sig-1", protocol="email")
+        module = MockModule(input_dict=dict(state="present", id=None, resource_id="sig-1", protocol="email"))
+        module.check_mode = True
+
+        subscription_id, message, has_changed, diff = handle_subscription(client=client, module=module)
+        self.assertTrue(has_changed)
+        self.assertEqual(dict(resource_id="sig-1", protocol="email"), diff["after"])
+
+        module.params["id"] = "sub-1"
+        subscription_id, message, has_changed, diff = handle_subscription(client=client, module=module)
+        self.assertFalse(has_changed)
+
+        module.params["protocol"] = "http"
+        subscription_id, message, has_changed, diff = handle_subscription(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        module.params["state"] = "absent"
+        subscription_id, message, has_changed, diff = handle_subscription(client=client, module=module)
+        self.assertTrue(has_changed)
+
+        client.create_event_subscription.assert_not_called()
+        client.update_event_subscription.assert_not_called()
+        client.delete_event_subscription.assert_not_called()
@@ -0,0 +1,101 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import json
+import sys
+import unittest
+from mock import MagicMock, patch
+from ansible.module_utils import basic
+from ansible_collections.spot.cloud_modules.plugins.module_utils import spot_rate_limit
+from ansible_collections.spot.cloud_modules.plugins.module_utils.spot_retry import get_retry_policy
+from ansible_collections.spot.cloud_modules.plugins.modules import aws_elastigroup_info
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils import spot_action
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_action import (
+    SpotActionModule, run_module_in_process)
+
+
+def module_args(**kwargs):
+    kwargs.update(token="token", account_id="act-1", include=[], _ansible_check_mode=False)
+    return kwargs
+
+
+class TestRunModuleInProcess(unittest.TestCase):
+    """Unit test for running a module in the controller process"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_elastigroups.return_value = [dict(id="sig-1", name="web")]
+        patcher = patch.object(aws_elastigroup_info, "get_spot_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_returns_module_output(self):
+        """The JSON printed by the module is returned, and the process state is restored"""
+
+        saved_args, saved_stdout = basic._ANSIBLE_ARGS, sys.stdout
+
+        stdout, error = run_module_in_process("aws_elastigroup_info", module_args(fields=["id"]))
+
+        self.assertIsNone(error)
+        self.assertEqual([dict(id="sig-1")], json.loads(stdout)["elastigroups"])
+        self.assertIs(saved_args, basic._ANSIBLE_ARGS)
+        self.assertIs(saved_stdout, sys.stdout)
+
+    def test_fail_json(self):
+        """Argument errors come back as the module's failed result"""
+
+        stdout, error = run_module_in_process("aws_elastigroup_info", module_args(bogus=1))
+
+        self.assertIsNone(error)
+        self.assertTrue(json.loads(stdout)["failed"])
+
+    def test_exception(self):
+        """An exception that escapes the module is returned instead of raised"""
+
+        self.client.get_elastigroups.side_effect = IOError("no credentials")
+
+        stdout, error = run_module_in_process("aws_elastigroup_info", module_args())
+
+        self.assertEqual("no credentials", str(error))
+        self.assertEqual("", stdout)
+
+    def test_resets_process_state(self):
+        """Retry statistics and the rate limiter do not carry over to the next run"""
+
+        get_retry_policy().reserve(1.0, "500")
+        spot_rate_limit._limiter = MagicMock()
+
+        stdout, error = run_module_in_process("aws_elastigroup_info", module_args())
+
+        self.assertEqual(0, json.loads(stdout)["api_retries"]["count"])
+        self.assertIsNone(spot_rate_limit._limiter)
+        self.assertEqual(0, get_retry_policy().stats()["count"])
+
+
+class TestSpotActionModule(unittest.TestCase):
+    """Unit test for choosing between in-process and regular module execution"""
+
+    def get_action(self, transport, async_val=0):
+        action = SpotActionModule.__new__(SpotActionModule)
+        action._connection = MagicMock(transport=transport)
+        action._task = MagicMock(async_val=async_val, action="spot.cloud_modules.aws_elastigroup_info")
+        return action
+
+    def test_runs_in_process(self):
+        """Only tasks on a local connection that are not async run in process"""
+
+        with patch.object(spot_action, "HAS_SPOTINST_SDK", True):
+            self.assertTrue(self.get_action("local").runs_in_process())
+            self.assertTrue(self.get_action("ansible.builtin.local").runs_in_process())
+            self.assertFalse(self.get_action("ssh").runs_in_process())
+            self.assertFalse(self.get_action("local", async_val=60).runs_in_process())
+
+        with patch.object(spot_action, "HAS_SPOTINST_SDK", False):
+            self.assertFalse(self.get_action("local").runs_in_process())
+
+        with patch.object(spot_action, "HAS_SPOTINST_SDK", True), patch.object(spot_action, "CAN_RUN_IN_PROCESS", False):
+            self.assertFalse(self.get_action("local").runs_in_process())
+
+    def test_module_name(self):
+        self.assertEqual("aws_elastigroup_info", self.get_action("local").get_module_name())
@@ -0,0 +1,76 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from mock import MagicMock
+from ansible_collections.spot.cloud_modules.plugins.plugin_utils.spot_inventory import ResourceCache
+
+
+class TestResourceCache(unittest.TestCase):
+    """Unit test for the incremental inventory resource cache"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "inventory.json")
+        self.now = 1000.0
+        self.resources = [dict(id="ssn-1", updated_at="t1"), dict(id="ssn-2", updated_at="t1")]
+        self.list_resources = MagicMock(side_effect=lambda: [dict(resource) for resource in self.resources])
+        self.fetch = MagicMock(side_effect=lambda resource: [dict(vm_name=resource["id"] + "-vm")])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def cache(self, scope="azure/act-1"):
+        return ResourceCache(self.path, ttl=60, max_age=600, scope=scope, clock=lambda: self.now)
+
+    def fetched_ids(self):
+        return sorted(call[0][0]["id"] for call in self.fetch.call_args_list)
+
+    def test_ttl_and_incremental_refresh(self):
+        """Within the TTL nothing is fetched, after it only changed resources are"""
+
+        resources, failures = self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(0, failures)
+        self.assertEqual([[dict(vm_name="ssn-1-vm")], [dict(vm_name="ssn-2-vm")]], [r["hosts"] for r in resources])
+
+        self.now += 30
+        self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(1, self.list_resources.call_count)
+
+        self.now += 60
+        self.fetch.reset_mock()
+        self.resources[1]["updated_at"] = "t2"
+        self.resources.append(dict(id="ssn-3", updated_at="t1"))
+        resources, failures = self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(["ssn-2", "ssn-3"], self.fetched_ids())
+        self.assertEqual(["ssn-1", "ssn-2", "ssn-3"], [r["id"] for r in resources])
+
+        self.now += 600
+        self.fetch.reset_mock()
+        self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(["ssn-1", "ssn-2", "ssn-3"], self.fetched_ids())
+
+    def test_failure_and_scope(self):
+        """A failed fetch keeps the last hosts and is retried; accounts do not share entries"""
+
+        self.cache().get(self.list_resources, self.fetch, 4)
+
+        self.now += 90
+        self.resources[0]["updated_at"] = "t2"
+        self.fetch.side_effect = Exception("boom")
+        resources, failures = self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(1, failures)
+        self.assertEqual([dict(vm_name="ssn-1-vm")], resources[0]["hosts"])
+
+        self.fetch.reset_mock()
+        self.fetch.side_effect = lambda resource: []
+        self.cache().get(self.list_resources, self.fetch, 4)
+        self.assertEqual(["ssn-1"], self.fetched_ids())
+
+        self.fetch.reset_mock()
+        self.cache(scope="azure/act-2").get(self.list_resources, self.fetch, 4)
+        self.assertEqual(["ssn-1", "ssn-2"], self.fetched_ids())